@@ -1,3 +1,4 @@
 from .cluster_manager import ClusterManager
+from .kubeconfig_store import KubeconfigStore, kubeconfig_store
 
-__all__ = ['ClusterManager']
+__all__ = ['ClusterManager', 'KubeconfigStore', 'kubeconfig_store']
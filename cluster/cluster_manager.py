@@ -1,15 +1,19 @@
-import os
-
 import pulumi
 import pulumi_oci as oci
 
+from utils.error_context import with_error_boundary
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
+from utils.tracing import tracer
 
+from .kubeconfig_store import kubeconfig_store
 from .node_pool import NodePoolManager
 from .oke import OKEClusterManager
 
-logger = global_logger
+logger = get_logger(__name__)
+
+# get_cluster_kube_config 토큰 버전 (캐시 키에 포함)
+KUBECONFIG_TOKEN_VERSION = '2.0.0'
 
 
 @apply_exception_handler
@@ -23,55 +27,76 @@ class ClusterManager:
         self.node_config = node_config
 
     def save_kubeconfig_to_file(self, region, kubeconfig_content):
-        if hasattr(kubeconfig_content, 'content'):
-            kubeconfig_content = kubeconfig_content.content
+        """kubeconfig 저장 (병합 파일 / 지역별 파일, 내용이 바뀐 경우에만 기록)"""
+        # preview에서는 파일을 쓰지 않음
+        if pulumi.runtime.is_dry_run():
+            return None
+
+        with tracer.span('cluster.save_kubeconfig', region=region):
+            # 내용이 없으면 (None 또는 빈 문자열) 기존 파일을 덮어쓰지 않음
+            if not kubeconfig_content:
+                logger.error(f'Kubeconfig content for region {region} is empty.')
+                return None
+
+            return kubeconfig_store.save(region, kubeconfig_content)
+
+    def get_kubeconfig(self, cluster_id):
+        """
+        클러스터의 kubeconfig 내용 조회.
+        (cluster_id, token_version) 캐시가 cache_ttl 안이면 invoke를 생략하고,
+        preview에서는 만료된 캐시라도 재사용하며 invoke를 하지 않는다 (캐시가 없으면 None).
+        """
+        if pulumi.runtime.is_dry_run():
+            return kubeconfig_store.cached(cluster_id, KUBECONFIG_TOKEN_VERSION, ignore_ttl=True)
 
-        # None 체크 및 문자열 변환
-        if kubeconfig_content is None:
-            print(f'Error: Kubeconfig content for region {region} is None.')
-            return
+        content = kubeconfig_store.cached(cluster_id, KUBECONFIG_TOKEN_VERSION)
+        if content is not None:
+            logger.debug(f'Kubeconfig for {self.region} loaded from cache')
+            return content
 
-        file_path = os.path.expanduser(f'~/.kube/config-{region}')
-        absolute_file_path = os.path.abspath(file_path)
-        os.makedirs(os.path.dirname(absolute_file_path), exist_ok=True)
-        with open(absolute_file_path, 'w') as kubeconfig_file:
-            kubeconfig_file.write(kubeconfig_content)
-        print(f'Kubeconfig saved to: {absolute_file_path}')
+        with tracer.span('cluster.get_kubeconfig', region=self.region):
+            content = oci.containerengine.get_cluster_kube_config(
+                cluster_id=cluster_id,
+                token_version=KUBECONFIG_TOKEN_VERSION,
+                opts=pulumi.InvokeOptions(provider=self.config.provider),
+            ).content
+        kubeconfig_store.cache(cluster_id, KUBECONFIG_TOKEN_VERSION, content)
+        return content
 
     def create_cluster(self):
         # Step 6: OKE 클러스터 생성
-        cluster_manager = OKEClusterManager(
-            self.region,
-            self.config,
-            self.compartment_id,
-            self.vcn_id,
-            self.subnet_ids,
-            self.node_config,
-        )
-        cluster_id = cluster_manager.create_oke_cluster()
+        with tracer.span('cluster.oke', category='declare', region=self.region):
+            cluster_manager = OKEClusterManager(
+                self.region,
+                self.config,
+                self.compartment_id,
+                self.vcn_id,
+                self.subnet_ids,
+                self.node_config,
+            )
+            cluster_id = cluster_manager.create_oke_cluster()
 
         # Step 7: OKE 노드 풀 생성
-        node_pool_manager = NodePoolManager(
-            self.region,
-            self.config,
-            self.compartment_id,
-            self.subnet_ids,
-            cluster_id,
-            self.node_config,
-        )
-        node_pool_id = node_pool_manager.create_node_pool()
+        with tracer.span('cluster.node_pool', category='declare', region=self.region):
+            node_pool_manager = NodePoolManager(
+                self.region,
+                self.config,
+                self.compartment_id,
+                self.subnet_ids,
+                cluster_id,
+                self.node_config,
+            )
+            node_pool_id = node_pool_manager.create_node_pool()
 
-        # 클러스터 ID가 생성되면 이를 사용하여 kubeconfig 가져오기
+        # 클러스터가 ACTIVE가 되어 ID가 확정되면 (노드 풀 생성을 기다리지 않고) kubeconfig 가져오기
         self.kubeconfig = (
-            pulumi.Output.all(cluster_id, node_pool_id)
+            pulumi.Output.from_input(cluster_id)
+            .apply(with_error_boundary(self.get_kubeconfig, region=self.region))
             .apply(
-                lambda outputs: oci.containerengine.get_cluster_kube_config(
-                    cluster_id=outputs[0],
-                    token_version='2.0.0',
-                    opts=pulumi.InvokeOptions(provider=self.config.provider),
+                with_error_boundary(
+                    lambda kubeconfig: self.save_kubeconfig_to_file(self.region, kubeconfig), region=self.region
                 )
             )
-            .apply(lambda kubeconfig: self.save_kubeconfig_to_file(self.region, kubeconfig))
         )
 
         return cluster_id, node_pool_id
@@ -0,0 +1,251 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import yaml
+
+from utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+logger = get_logger(__name__)
+
+# kubeconfig 파일은 클러스터 접근 토큰 명령을 포함하므로 소유자만 읽기/쓰기
+KUBECONFIG_FILE_MODE = 0o600
+
+# get_cluster_kube_config로 조회한 kubeconfig 캐시 디렉토리 (kubeconfig.directory 기준)
+CACHE_DIRECTORY = '.oke-kubeconfig-cache'
+
+
+def content_digest(content):
+    """kubeconfig 내용의 sha256 (변경 여부 비교용)"""
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_digest(path):
+    """파일 내용의 sha256 (파일이 없으면 None)"""
+    try:
+        with open(path, 'rb') as file:
+            return content_digest(file.read())
+    except FileNotFoundError:
+        return None
+
+
+def write_atomic(path, content):
+    """
+    같은 디렉토리의 임시 파일에 쓴 뒤 rename으로 교체.
+    중간에 실패하거나 동시에 읽어도 이전 내용 또는 새 내용 중 하나만 보인다.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.chmod(temp_path, KUBECONFIG_FILE_MODE)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def write_if_changed(path, content):
+    """내용이 기존 파일과 같으면 쓰지 않음. 파일을 썼으면 True"""
+    if file_digest(path) == content_digest(content):
+        return False
+    write_atomic(path, content)
+    return True
+
+
+def rename_entries(kubeconfig, name):
+    """
+    OKE kubeconfig(클러스터/사용자/컨텍스트 각 1개)의 항목 이름을 name으로 변경.
+    OKE가 생성하는 이름(cluster-<id>, user-<id>)은 지역을 알 수 없으므로 병합 파일에서는 지역 기준 이름을 사용한다.
+    """
+    clusters = kubeconfig.get('clusters') or []
+    users = kubeconfig.get('users') or []
+    contexts = kubeconfig.get('contexts') or []
+    if len(clusters) != 1 or len(users) != 1 or len(contexts) != 1:
+        raise ValueError(
+            f'Unexpected kubeconfig for {name}: '
+            f'{len(clusters)} cluster(s), {len(users)} user(s), {len(contexts)} context(s)'
+        )
+    cluster = {**clusters[0], 'name': name}
+    user = {**users[0], 'name': name}
+    context = {'name': name, 'context': {**(contexts[0].get('context') or {}), 'cluster': name, 'user': name}}
+    return cluster, user, context
+
+
+def _replace_entry(entries, entry):
+    """이름이 같은 항목을 교체하고 없으면 추가 (다른 항목의 순서는 유지)"""
+    for index, existing in enumerate(entries):
+        if existing.get('name') == entry['name']:
+            entries[index] = entry
+            return
+    entries.append(entry)
+
+
+class KubeconfigStore:
+    """
+    지역별 OKE kubeconfig 저장소.
+
+    - 병합 파일: 지역마다 컨텍스트 1개(oke-<region>)를 갖는 kubeconfig 하나를 파일 잠금 아래에서
+      해당 지역 항목만 교체하는 방식으로 갱신 (다른 지역/스택이 쓴 항목과 사용자가 추가한 항목은 유지)
+    - 지역별 파일: per_region_files가 True(기본값)이면 기존처럼 config-<region> 파일도 유지
+    - 캐시: 조회한 kubeconfig를 (cluster_id, token_version) 기준으로 cache_ttl(초) 동안 보관
+    모든 파일은 내용이 바뀐 경우에만 임시 파일 + rename으로 교체한다.
+    """
+
+    def __init__(self, directory='~/.kube', merged_file='config-oke', per_region_files=True, cache_ttl=3600):
+        self._lock = threading.Lock()
+        self.configure(directory, merged_file, per_region_files, cache_ttl)
+
+    def configure(self, directory='~/.kube', merged_file='config-oke', per_region_files=True, cache_ttl=3600):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.merged_path = os.path.join(self.directory, merged_file) if merged_file else None
+        self.per_region_files = per_region_files
+        self.cache_ttl = cache_ttl
+
+    @staticmethod
+    def context_name(region):
+        """병합 파일의 지역 컨텍스트/클러스터/사용자 이름"""
+        return f'oke-{region}'
+
+    def region_path(self, region):
+        return os.path.join(self.directory, f'config-{region}')
+
+    def _cache_path(self, cluster_id, token_version):
+        return os.path.join(self.directory, CACHE_DIRECTORY, content_digest(f'{cluster_id}:{token_version}') + '.json')
+
+    def cached(self, cluster_id, token_version, ignore_ttl=False):
+        """
+        캐시된 kubeconfig 내용. 없거나 cache_ttl이 지났으면 None.
+        ignore_ttl이 True이면 (preview 등 조회를 생략하는 경우) 만료된 캐시도 반환한다.
+        """
+        try:
+            with open(self._cache_path(cluster_id, token_version)) as cache_file:
+                entry = json.load(cache_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not ignore_ttl and time.time() - entry.get('fetched_at', 0) > self.cache_ttl:
+            return None
+        return entry.get('content')
+
+    def cache(self, cluster_id, token_version, content):
+        """조회한 kubeconfig를 캐시에 기록 (cache_ttl이 0이면 캐시하지 않음)"""
+        if self.cache_ttl > 0 and content:
+            entry = {'cluster_id': cluster_id, 'token_version': token_version, 'fetched_at': time.time()}
+            write_atomic(self._cache_path(cluster_id, token_version), json.dumps({**entry, 'content': content}))
+
+    @contextmanager
+    def _merged_lock(self):
+        """스레드 잠금 + (POSIX) 잠금 파일에 대한 flock: 동시에 실행되는 지역 스택 프로세스 간 갱신 직렬화"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            with open(f'{self.merged_path}.lock', 'w') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def save(self, region, content):
+        """
+        지역 kubeconfig 저장.
+
+        Returns:
+            list[str]: 실제로 쓴 파일 경로 (내용이 같아 건너뛴 파일은 제외)
+        """
+        written = []
+        if self.per_region_files:
+            path = self.region_path(region)
+            if write_if_changed(path, content):
+                written.append(path)
+        if self.merged_path and self._merge(region, content):
+            written.append(self.merged_path)
+
+        if written:
+            logger.info(f'Kubeconfig for {region} saved to: {", ".join(written)}')
+        else:
+            logger.info(f'Kubeconfig for {region} unchanged, skipped writing')
+        return written
+
+    def prune(self, regions):
+        """
+        병합 파일에서 설정에 없는 지역의 항목(oke-<region>)을 제거.
+        config.json에서 빠진 지역의 컨텍스트가 남아 삭제된 클러스터를 가리키지 않도록 한다. (다른 이름의 항목은 유지)
+        regions는 이번 실행의 선택 지역이 아니라 config.json의 전체 지역이어야 한다.
+
+        Returns:
+            list[str]: 제거한 항목 이름
+        """
+        if not self.merged_path:
+            return []
+        keep = {self.context_name(region) for region in regions}
+        with self._merged_lock():
+            try:
+                with open(self.merged_path) as merged_file:
+                    merged = yaml.safe_load(merged_file) or {}
+            except FileNotFoundError:
+                return []
+
+            removed = []
+            for key in ('clusters', 'users', 'contexts'):
+                entries = []
+                for entry in merged.get(key) or []:
+                    name = entry.get('name') or ''
+                    if name.startswith(self.context_name('')) and name not in keep:
+                        removed.append(name)
+                    else:
+                        entries.append(entry)
+                merged[key] = entries
+            if not removed:
+                return []
+            if merged.get('current-context') in removed:
+                contexts = merged['contexts']
+                merged['current-context'] = contexts[0]['name'] if contexts else ''
+            write_if_changed(self.merged_path, yaml.safe_dump(merged, default_flow_style=False, sort_keys=False))
+
+        removed = list(dict.fromkeys(removed))
+        logger.info(f'Removed kubeconfig entries of regions no longer configured: {", ".join(removed)}')
+        return removed
+
+    def _merge(self, region, content):
+        """병합 파일에서 지역 항목만 교체. 파일을 썼으면 True"""
+        name = self.context_name(region)
+        cluster, user, context = rename_entries(yaml.safe_load(content) or {}, name)
+
+        with self._merged_lock():
+            try:
+                with open(self.merged_path) as merged_file:
+                    merged = yaml.safe_load(merged_file) or {}
+            except FileNotFoundError:
+                merged = {}
+            merged.setdefault('apiVersion', 'v1')
+            merged.setdefault('kind', 'Config')
+            merged.setdefault('preferences', {})
+            for key, entry in (('clusters', cluster), ('users', user), ('contexts', context)):
+                merged[key] = merged.get(key) or []
+                _replace_entry(merged[key], entry)
+            # 사용자가 선택한 current-context는 유지
+            merged.setdefault('current-context', name)
+            content = yaml.safe_dump(merged, default_flow_style=False, sort_keys=False)
+            return write_if_changed(self.merged_path, content)
+
+
+kubeconfig_store = KubeconfigStore()
@@ -1,10 +1,10 @@
 import pulumi_oci as oci
 
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
 from utils.resource_helper import create_resource
 
-logger = global_logger
+logger = get_logger(__name__)
 
 
 @apply_exception_handler
@@ -1,10 +1,13 @@
 import pulumi_oci as oci
 
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
 from utils.resource_helper import create_resource
 
-logger = global_logger
+logger = get_logger(__name__)
+
+# 지역별 구획 이름 (teardown sweeper가 구획을 찾을 때도 사용)
+COMPARTMENT_NAME_FORMAT = 'oke-{region}'
 
 
 @apply_exception_handler
@@ -21,6 +24,6 @@ class CompartmentManager:
             self.region,
             self.config.tenancy,  # 최상위 compartment_id
             None,
-            name=f'oke-{self.region}',  # Compartment 생성에 필요한 인수
+            name=COMPARTMENT_NAME_FORMAT.format(region=self.region),  # Compartment 생성에 필요한 인수
             description='An compartment created by Pulumi',
         )
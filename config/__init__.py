@@ -1,19 +1,29 @@
 from .config_dataclass import (
     Config,
+    ExportConfig,
     GatewayIDs,
+    IamConfig,
+    KubeconfigConfig,
     NodeConfig,
+    PeeringConfig,
     RegionResources,
     RouteTableIDs,
     SecurityListIDs,
     SubnetIDs,
 )
 from .config_manager import ConfigManager
+from .deployment_selection import DeploymentSelection
 
 __all__ = [
     'Config',
     'ConfigManager',
+    'DeploymentSelection',
+    'ExportConfig',
     'GatewayIDs',
+    'IamConfig',
+    'KubeconfigConfig',
     'NodeConfig',
+    'PeeringConfig',
     'RegionResources',
     'RouteTableIDs',
     'SecurityListIDs',
@@ -1,10 +1,19 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-import oci as oci_sdk  # type: ignore
-import pulumi_oci as oci  # type: ignore
-from cryptography.hazmat.primitives.asymmetric import rsa
 from pulumi import Output
 
+from utils.oci_client_registry import oci_client_registry
+
+from .deployment_selection import DeploymentSelection
+
+# 타입 힌트 전용 import (런타임에 무거운 SDK를 로드하지 않음)
+if TYPE_CHECKING:
+    import pulumi_oci as oci  # type: ignore
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
 
 @dataclass
 class NodeConfig:
@@ -36,12 +45,67 @@ class RegionResources:
     tenancy: str | None = None
     region_name: str | None = None
     key_file: str | None = None
+    profile: str | None = None
 
-    # 클라이언트 필드들 (Optional로 설정)
-    iam_client: oci_sdk.identity.IdentityClient | None = None
-    virtual_network_client: oci_sdk.core.VirtualNetworkClient | None = None
     provider: oci.Provider | None = None
 
+    # SDK 클라이언트는 필드로 보관하지 않고 레지스트리에서 처음 사용할 때 생성
+    @property
+    def iam_client(self):
+        return oci_client_registry.identity_client(self.profile)
+
+    @property
+    def virtual_network_client(self):
+        return oci_client_registry.virtual_network_client(self.profile)
+
+    @property
+    def network_load_balancer_client(self):
+        return oci_client_registry.network_load_balancer_client(self.profile)
+
+
+@dataclass
+class PeeringConfig:
+    # 'resource': 엣지별 동적 리소스로 상태 관리, 'apply': 매 실행마다 Output.apply에서 일괄 연결
+    mode: str = 'resource'
+    # 동시에 처리할 피어링 엣지 수
+    max_workers: int = 4
+    # limit_scope('tenancy' 또는 'region') 단위 동시 처리 한도
+    per_scope_limit: int = 2
+    limit_scope: str = 'tenancy'
+    # RPC 상태 대기 최대 시간(초)
+    wait_timeout: int = 300
+
+
+@dataclass
+class IamConfig:
+    # 동시에 정책을 적용할 테넌시 수
+    max_workers: int = 4
+    # 테넌시별 Identity API 호출 속도 (초당 요청 수)와 순간 허용량
+    requests_per_second: float = 2.0
+    burst: int = 5
+    # 429(Too Many Requests) 응답 시 최대 재시도 횟수
+    max_retries: int = 5
+
+
+@dataclass
+class ExportConfig:
+    # 'all', 'none', 'types', 'inventory' (utils.stack_exports.EXPORT_MODES)
+    mode: str = 'inventory'
+    # types 모드에서 최상위 출력으로 export할 리소스 타입 (예: Vcn, Cluster, PublicIp)
+    types: list[str] = field(default_factory=list)
+
+
+@dataclass
+class KubeconfigConfig:
+    # kubeconfig 파일을 저장할 디렉토리
+    directory: str = '~/.kube'
+    # 지역별 컨텍스트(oke-<region>)를 모은 병합 kubeconfig 파일 이름 (빈 문자열이면 병합 파일을 쓰지 않음)
+    merged_file: str = 'config-oke'
+    # 지역별 kubeconfig 파일(config-<region>)도 함께 저장할지 여부 (기존 파일을 쓰는 스크립트를 위해 기본값 True)
+    per_region_files: bool = True
+    # 조회한 kubeconfig를 (cluster_id, token_version) 기준으로 재사용할 시간(초). 0이면 캐시하지 않음
+    cache_ttl: int = 3600
+
 
 @dataclass
 class Config:
@@ -60,6 +124,12 @@ class Config:
     )
     regions: dict[str, RegionResources] = field(default_factory=dict)
     home_region: str | None = None
+    peering: PeeringConfig = field(default_factory=PeeringConfig)
+    iam: IamConfig = field(default_factory=IamConfig)
+    exports: ExportConfig = field(default_factory=ExportConfig)
+    kubeconfig: KubeconfigConfig = field(default_factory=KubeconfigConfig)
+    # 이번 실행의 배포 대상 지역/단계 (ConfigManager에서 설정)
+    selection: DeploymentSelection = field(default_factory=DeploymentSelection)
 
 
 @dataclass
@@ -1,38 +1,50 @@
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import oci as oci_sdk  # type: ignore
 import pulumi
 import pulumi_oci as oci  # type: ignore
 
+from utils.error_context import annotate_error, error_boundary
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
+from utils.oci_client_registry import oci_client_registry
 
-from . import Config, NodeConfig, RegionResources
+from . import Config, ExportConfig, IamConfig, KubeconfigConfig, NodeConfig, PeeringConfig, RegionResources
+from .deployment_selection import resolve_selection
+from .topology_planner import TopologyPlanner
 
-logger = global_logger
+logger = get_logger(__name__)
 
 
 @apply_exception_handler
 class ConfigManager:
     def __init__(self, config_path='config.json'):
         self.config_path = config_path
-        self.configs = self._load_config()
+        # 설정 로드 실패는 여기서 한 번만 로깅 (지역/단계 정보는 예외에 첨부됨)
+        with error_boundary(reraise=True, layer='config'):
+            self.configs = self._load_config()
 
     def _convert_peer_map(self, data):
-        """peer_map을 bidirectional peer map으로 변환"""
-        if not isinstance(data, dict) or not all(isinstance(value, list) for value in data.values()):
-            raise ValueError('Invalid input data. Expected a dictionary with list values.')
-
-        result = {}
-        for key, values in data.items():
-            if not values:
-                result[key] = []
-            else:
-                for value in values:
-                    result.setdefault(key, set()).add(value)
-                    result.setdefault(value, set()).add(key)
-        return {key: list(values) for key, values in result.items()}
+        """peer_map을 bidirectional peer map으로 변환 (입력 순서 유지)"""
+        return TopologyPlanner([], peer_map=data).plan().peer_bi_map
+
+    def _plan_topology(self, config_data):
+        """topology 설정(mesh/hub_spoke/ring) 또는 peer_map을 피어링 계획으로 전개"""
+        plan = TopologyPlanner(
+            list(config_data.get('regions', {})),
+            topology=config_data.get('topology'),
+            peer_map=config_data.get('peer_map', {}),
+        ).plan()
+        logger.info(
+            'Peering topology: %s (%d edge(s), %d RPC(s), %d DRG(s))',
+            plan.mode,
+            plan.edge_count,
+            plan.rpc_count,
+            plan.drg_count,
+        )
+        return plan
 
     def _get_pulumi_config_value(self, key, is_secret=False):
         """Pulumi Config에서 값을 가져옵니다"""
@@ -43,7 +55,7 @@ class ConfigManager:
             else:
                 return config.require(key)
         except Exception as e:
-            logger.warning(f'Failed to get Pulumi config value for {key}: {e}')
+            logger.warning('Failed to get Pulumi config value for %s: %s', key, e)
             return None
 
     def _load_config(self):
@@ -65,44 +77,142 @@ class ConfigManager:
                         'pulumi config set --secret ssh_public_key "your-ssh-key"'
                     )
 
+                # 피어링 토폴로지 전개
+                topology_plan = self._plan_topology(config_data)
+
+                # 배포 대상 지역/단계 결정 (선택되지 않은 지역은 초기화하지 않음)
+                selection = resolve_selection(config_data.get('regions', {}), topology_plan.peer_bi_map)
+                self._log_selection(selection)
+                # preview가 아닌 부분 실행은 명시적으로 허용한 경우에만 진행
+                selection.check_partial_allowed(dry_run=pulumi.runtime.is_dry_run())
+
                 # NodeConfig 및 RegionResources를 OCI config 정보로 초기화
                 configs = Config(
-                    peer_map=config_data.get('peer_map', {}),
-                    peer_bi_map=self._convert_peer_map(config_data.get('peer_map', {})),
+                    peer_map=topology_plan.peer_map,
+                    peer_bi_map=topology_plan.peer_bi_map,
                     node=NodeConfig(
                         **config_data.get('node'),
                         ssh_public_key=os.getenv('SSH_PUBLIC_KEY'),
                     ),
-                    regions={
-                        region: self._initialize_region_resources(region, region_data)
-                        for region, region_data in config_data.get('regions', {}).items()
-                    },
+                    regions=self._initialize_regions(
+                        config_data.get('regions', {}),
+                        config_data.get('region_init_workers', 0),
+                        selection,
+                    ),
                     home_region=config_data.get('home_region', ''),
+                    peering=PeeringConfig(**config_data.get('peering', {})),
+                    iam=IamConfig(**config_data.get('iam', {})),
+                    exports=ExportConfig(**config_data.get('exports', {})),
+                    kubeconfig=KubeconfigConfig(**config_data.get('kubeconfig', {})),
+                    selection=selection,
                 )
                 # logging config
-                logger.info(f'{"-" * 30} Loaded Configurations {"-" * 30}')
+                logger.info('%s Loaded Configurations %s', '-' * 30, '-' * 30)
                 for config_name, config_data in configs.__dict__.items():
                     if config_name == 'regions':
+                        # 지역별 상세 설정은 지역 수만큼 길어지므로 DEBUG 레벨 (OKE_LOG_LEVELS=config=DEBUG)
+                        logger.info('regions: %s', list(config_data))
+                        logger.info('-' * 64)
                         for region, region_resources in config_data.items():
-                            logger.info(f'{region}: {region_resources}')
-                            logger.info('-' * 64)
+                            logger.debug('%s: %s', region, region_resources)
                     else:
-                        logger.info(f'{config_name}: {config_data}')
+                        logger.info('%s: %s', config_name, config_data)
                         logger.info('-' * 64)
                 return configs
 
         except (FileNotFoundError, json.JSONDecodeError, TypeError) as e:
-            logger.error(f'Failed to load configuration: {e}')
+            annotate_error(e, config_path=self.config_path)
+            raise
+
+    def _log_selection(self, selection):
+        """배포 대상 지역/단계 로깅"""
+        logger.info(
+            'Deployment selection (%s): regions=%s, layers=%s',
+            selection.stack_mode,
+            selection.regions,
+            list(selection.layers),
+        )
+        if selection.peer_only_regions:
+            logger.info('Peer regions loaded without resources: %s', selection.peer_only_regions)
+        if selection.skip_cluster_regions:
+            logger.info('Cluster layer skipped for: %s', selection.skip_cluster_regions)
+        if selection.partial:
+            logger.warning(
+                'Partial deployment: resources of unselected regions/layers and clusters of skipped regions '
+                'are not declared in this run. '
+                'Use "pulumi up --target" with OKE_ALLOW_PARTIAL=1 to avoid deleting them.'
+            )
+
+    def _initialize_regions(self, regions_data, max_workers=0, selection=None):
+        """
+        지역 리소스 초기화.
+        selection이 주어지면 선택된 지역만 Provider까지 초기화하고, 선택된 지역의 피어는 프로파일 정보만 로드한다.
+        그 밖의 지역은 초기화하지 않는다.
+        max_workers가 2 이상이면 프로파일 로드를 스레드 풀에서 병렬로 수행한다.
+        Provider 등록은 Pulumi 엔진 스레드에서만 가능하므로 원래 지역 순서대로 순차 수행한다.
+        """
+        if selection is None:
+            regions = list(regions_data)
+        else:
+            needed = {*selection.regions, *selection.peer_only_regions}
+            regions = [region for region in regions_data if region in needed]
+        timings = {}
+
+        def load_profile(region):
+            started = time.perf_counter()
+            oci_config = self._load_region_profile(region)
+            timings[region] = {'profile': time.perf_counter() - started}
+            return oci_config
+
+        if max_workers and max_workers > 1 and len(regions) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(regions))) as executor:
+                # map은 입력 순서대로 결과를 반환하므로 리소스 이름/순서가 바뀌지 않음
+                oci_configs = list(executor.map(load_profile, regions))
+        else:
+            oci_configs = [load_profile(region) for region in regions]
+
+        region_resources = {}
+        for region, oci_config in zip(regions, oci_configs, strict=True):
+            started = time.perf_counter()
+            region_resources[region] = self._initialize_region_resources(
+                region,
+                regions_data[region],
+                oci_config,
+                create_provider=selection is None or selection.layer_enabled('network', region),
+            )
+            timings[region]['provider'] = time.perf_counter() - started
+
+        self._log_region_timings(timings, max_workers)
+        return region_resources
+
+    def _log_region_timings(self, timings, max_workers):
+        """지역별 초기화 소요 시간 로깅 (느린 지역 순)"""
+        mode = f'parallel(max_workers={max_workers})' if max_workers and max_workers > 1 else 'sequential'
+        logger.info('Region initialization timings (%s):', mode)
+        logger.info('%-12s%14s%14s%12s', 'region', 'profile(ms)', 'provider(ms)', 'total(ms)')
+        for region, timing in sorted(timings.items(), key=lambda item: -sum(item[1].values())):
+            profile_ms = timing.get('profile', 0) * 1000
+            provider_ms = timing.get('provider', 0) * 1000
+            logger.info('%-12s%14.1f%14.1f%12.1f', region, profile_ms, provider_ms, profile_ms + provider_ms)
+
+    def _load_region_profile(self, region):
+        """프로파일명(= region)으로 ~/.oci/config 로드 (스레드 안전)"""
+        try:
+            return oci_client_registry.get_config(region)
+        except Exception as e:
+            annotate_error(e, region=region, step='load_profile')
             raise
 
-    def _initialize_region_resources(self, region, region_data):
-        """프로파일명을 기준으로 ~/.oci/config에서 지역별 리소스 초기화"""
+    def _initialize_region_resources(self, region, region_data, oci_config=None, create_provider=True):
+        """
+        프로파일명을 기준으로 ~/.oci/config에서 지역별 리소스 초기화.
+        create_provider가 False이면 (피어 정보 조회용 지역) Provider를 등록하지 않는다.
+        """
         try:
-            # 프로파일명은 region과 동일하게 사용
-            oci_config = oci_sdk.config.from_file(profile_name=region)
-            iam_client = oci_sdk.identity.IdentityClient(oci_config)
-            virtual_network_client = oci_sdk.core.VirtualNetworkClient(oci_config)
-            provider = oci.Provider(f'provider_{region}', config_file_profile=region)
+            # 프로파일명은 region과 동일하게 사용 (SDK 클라이언트는 레지스트리에서 지연 생성)
+            if oci_config is None:
+                oci_config = self._load_region_profile(region)
+            provider = oci.Provider(f'provider_{region}', config_file_profile=region) if create_provider else None
 
             return RegionResources(
                 **region_data,
@@ -111,10 +221,9 @@ class ConfigManager:
                 tenancy=oci_config['tenancy'],
                 region_name=oci_config['region'],
                 key_file=oci_config['key_file'],
-                iam_client=iam_client,
-                virtual_network_client=virtual_network_client,
+                profile=region,
                 provider=provider,
             )
         except Exception as e:
-            logger.error(f'Failed to initialize region resources for {region}: {e}')
+            annotate_error(e, region=region, step='initialize_region_resources')
             raise
@@ -0,0 +1,174 @@
+import json
+import os
+from dataclasses import dataclass, field, replace
+
+import pulumi
+
+# 배포 단계 (cluster/peering은 network 단계의 결과를 사용)
+LAYERS = ('network', 'cluster', 'peering')
+
+# fleet: 단일 스택에 전체 구성, region: 지역 1개 스택 (구획/네트워크/클러스터), peering: 피어링/IAM 스택
+STACK_MODES = ('fleet', 'region', 'peering')
+
+# Pulumi config 키 -> 환경 변수 이름
+SETTING_ENV_VARS = {
+    'regions': 'OKE_REGIONS',
+    'exclude_regions': 'OKE_EXCLUDE_REGIONS',
+    'layers': 'OKE_LAYERS',
+    'skip_cluster_regions': 'OKE_SKIP_CLUSTER_REGIONS',
+    'stack_mode': 'OKE_STACK_MODE',
+    'stack_region': 'OKE_STACK_REGION',
+    # fleet 스택에서 일부 지역/단계만 실제로 배포(up)하려면 1 (선언되지 않은 지역/단계의 리소스가 삭제됨)
+    'allow_partial': 'OKE_ALLOW_PARTIAL',
+    # 트레이스 파일 경로 ('1'이면 oke-trace.json, utils.tracing 참고)
+    'trace': 'OKE_TRACE',
+}
+
+
+def get_setting(key, env_var=None, default=None):
+    """
+    실행 설정값 조회. 환경 변수가 있으면 우선 사용하고, 없으면 Pulumi config 값을 사용한다.
+    (예: OKE_REGIONS=se pulumi up, pulumi config set regions se,os)
+    """
+    env_var = env_var or SETTING_ENV_VARS.get(key)
+    value = os.getenv(env_var) if env_var else None
+    if value is None:
+        value = pulumi.Config().get(key)
+    return default if value in (None, '') else value
+
+
+def _as_list(value):
+    """'a,b' / '["a", "b"]' / 리스트 형식의 설정값을 리스트로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith('['):
+            value = json.loads(value)
+        else:
+            value = value.split(',')
+    return [item.strip() for item in value if item and item.strip()]
+
+
+@dataclass
+class DeploymentSelection:
+    # 이번 실행에서 리소스를 구성할 지역 (config.json 순서 유지)
+    regions: list[str] = field(default_factory=list)
+    # 선택된 지역의 피어이지만 선택되지 않은 지역 (프로파일 정보만 로드, Provider/리소스 없음)
+    peer_only_regions: list[str] = field(default_factory=list)
+    layers: tuple[str, ...] = LAYERS
+    # 클러스터 단계를 건너뛸 지역 (기존 클러스터는 삭제됨)
+    skip_cluster_regions: list[str] = field(default_factory=list)
+    stack_mode: str = 'fleet'
+    # config.json의 전체 지역 (부분 실행 판단 기준)
+    all_regions: list[str] = field(default_factory=list)
+
+    @property
+    def partial(self):
+        """
+        기존 리소스를 삭제할 수 있는 부분 실행 여부 (선택되지 않은 지역/단계, 클러스터를 건너뛰는 지역).
+        fleet 스택은 선택 범위, 지역 스택은 클러스터 단계를 건너뛰는 경우가 해당된다.
+        """
+        if self.stack_mode == 'fleet' and (set(self.regions) != set(self.all_regions) or self.layers != LAYERS):
+            return True
+        # 클러스터 단계를 건너뛰는 지역은 기존 클러스터/노드 풀이 삭제됨
+        return 'cluster' in self.layers and any(region in self.skip_cluster_regions for region in self.regions)
+
+    def check_partial_allowed(self, dry_run=False):
+        """
+        부분 실행(fleet 스택의 일부 지역/단계, skip_cluster_regions)은 선언되지 않은 리소스를 삭제하므로,
+        preview가 아닌 실행은 allow_partial(OKE_ALLOW_PARTIAL=1) 설정이 있을 때만 허용한다.
+        (Pulumi 프로그램은 --target 여부를 알 수 없으므로 --target 실행에도 같은 설정이 필요)
+        """
+        if not self.partial or dry_run:
+            return
+        if str(get_setting('allow_partial', default='')).lower() not in ('1', 'true', 'yes'):
+            raise ValueError(
+                f'Refusing partial deployment of the {self.stack_mode} stack '
+                f'(regions={self.regions}, layers={list(self.layers)}, '
+                f'skip_cluster_regions={self.skip_cluster_regions}): '
+                'resources of unselected regions/layers and clusters of skipped regions would be deleted. '
+                'Set OKE_ALLOW_PARTIAL=1 (or "pulumi config set allow_partial true") together with --target, '
+                'or use per-region stacks (stack_mode=region).'
+            )
+
+    def is_selected(self, region):
+        return region in self.regions
+
+    def layer_enabled(self, layer, region=None):
+        if layer not in self.layers:
+            return False
+        if layer == 'cluster' and region in self.skip_cluster_regions:
+            return False
+        return region is None or self.is_selected(region)
+
+    def filter_peer_map(self, peer_map):
+        """양쪽 지역이 모두 선택된 엣지만 남긴 peer_map"""
+        return {
+            region: [peer for peer in peers if self.is_selected(peer)]
+            for region, peers in peer_map.items()
+            if self.is_selected(region)
+        }
+
+    def peering_configs(self, configs):
+        """피어링/IAM 단계에서 사용할 설정 (선택된 지역 사이의 엣지만 포함)"""
+        return replace(
+            configs,
+            peer_map=self.filter_peer_map(configs.peer_map),
+            peer_bi_map=self.filter_peer_map(configs.peer_bi_map),
+        )
+
+
+def resolve_selection(all_regions, peer_bi_map):
+    """
+    Pulumi config/환경 변수의 regions, exclude_regions, layers, skip_cluster_regions 설정으로 배포 대상 결정.
+    설정이 없으면 모든 지역, 모든 단계를 대상으로 한다.
+
+    stack_mode에 따라 대상이 제한된다.
+    - region: stack_region 지역 1개의 network/cluster 단계
+    - peering: 선택된 지역 사이의 peering 단계 (RPC ID는 지역 스택에서 StackReference로 조회)
+    """
+    all_regions = list(all_regions)
+    stack_mode = get_setting('stack_mode', default='fleet')
+    if stack_mode not in STACK_MODES:
+        raise ValueError(f'Invalid stack_mode: {stack_mode}. Expected one of {STACK_MODES}.')
+
+    included = _as_list(get_setting('regions')) or all_regions
+    excluded = _as_list(get_setting('exclude_regions')) or []
+    layers = _as_list(get_setting('layers')) or list(LAYERS)
+    skip_cluster_regions = _as_list(get_setting('skip_cluster_regions')) or []
+
+    if stack_mode == 'region':
+        stack_region = get_setting('stack_region')
+        if not stack_region:
+            raise ValueError('stack_region must be set when stack_mode is "region".')
+        included = [stack_region]
+        layers = [layer for layer in layers if layer != 'peering']
+    elif stack_mode == 'peering':
+        layers = ['peering']
+
+    unknown = [region for region in [*included, *excluded, *skip_cluster_regions] if region not in all_regions]
+    if unknown:
+        raise ValueError(f'Unknown regions in deployment selection: {unknown}')
+    invalid_layers = [layer for layer in layers if layer not in LAYERS]
+    if invalid_layers:
+        raise ValueError(f'Invalid layers: {invalid_layers}. Expected any of {LAYERS}.')
+    # peering 스택은 network 단계 대신 지역 스택의 결과를 StackReference로 사용
+    needs_network = any(layer in layers for layer in ('cluster', 'peering'))
+    if stack_mode != 'peering' and needs_network and 'network' not in layers:
+        raise ValueError('cluster and peering layers require the network layer.')
+
+    regions = [region for region in all_regions if region in included and region not in excluded]
+    peer_only_regions = [
+        region
+        for region in all_regions
+        if region not in regions and any(region in peer_bi_map.get(selected, []) for selected in regions)
+    ]
+    return DeploymentSelection(
+        regions=regions,
+        peer_only_regions=peer_only_regions,
+        layers=tuple(layer for layer in LAYERS if layer in layers),
+        skip_cluster_regions=skip_cluster_regions,
+        stack_mode=stack_mode,
+        all_regions=all_regions,
+    )
@@ -0,0 +1,92 @@
+from dataclasses import dataclass, field
+
+TOPOLOGY_MODES = ('mesh', 'hub_spoke', 'ring')
+
+
+@dataclass
+class TopologyPlan:
+    mode: str = 'custom'
+    # 요청(requestor) -> 수락(acceptor) 방향의 피어링 엣지
+    peer_map: dict[str, list[str]] = field(default_factory=dict)
+    # 지역별로 RPC/DRG 라우트/보안 규칙이 필요한 상대 지역
+    peer_bi_map: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def edge_count(self):
+        return sum(len(peers) for peers in self.peer_map.values())
+
+    @property
+    def rpc_count(self):
+        return sum(len(peers) for peers in self.peer_bi_map.values())
+
+    @property
+    def drg_count(self):
+        return sum(1 for peers in self.peer_bi_map.values() if peers)
+
+
+class TopologyPlanner:
+    """
+    config.json의 topology 설정을 최소한의 피어링 엣지 집합으로 전개하는 클래스.
+
+    - mesh: 모든 지역 쌍을 연결 (O(n²))
+    - hub_spoke: 각 지역을 hub 지역에만 연결 (O(n))
+    - ring: 인접한 지역끼리 원형으로 연결 (O(n))
+    topology 설정이 없으면 peer_map을 그대로 사용한다 (부분 메시).
+    """
+
+    def __init__(self, regions, topology=None, peer_map=None):
+        self.topology = topology or {}
+        # topology.regions가 지정되면 해당 지역만 토폴로지에 참여
+        self.regions = list(self.topology.get('regions') or regions)
+        self.peer_map = peer_map or {}
+
+        unknown = [region for region in self.regions if region not in regions]
+        if unknown:
+            raise ValueError(f'Unknown regions in topology: {unknown}')
+
+    def _mesh_edges(self):
+        return [(region, peer) for index, region in enumerate(self.regions) for peer in self.regions[index + 1 :]]
+
+    def _hub_spoke_edges(self):
+        hub = self.topology.get('hub')
+        if hub not in self.regions:
+            raise ValueError(f'hub_spoke topology requires a hub region in {self.regions}, got: {hub}')
+        # spoke가 요청 측, hub가 수락 측
+        return [(region, hub) for region in self.regions if region != hub]
+
+    def _ring_edges(self):
+        if len(self.regions) < 3:
+            return self._mesh_edges()
+        return [(region, self.regions[(index + 1) % len(self.regions)]) for index, region in enumerate(self.regions)]
+
+    def _custom_edges(self):
+        if not isinstance(self.peer_map, dict) or not all(isinstance(value, list) for value in self.peer_map.values()):
+            raise ValueError('Invalid input data. Expected a dictionary with list values.')
+        return [(region, peer) for region, peers in self.peer_map.items() for peer in peers]
+
+    def plan(self):
+        """토폴로지를 피어링 엣지/양방향 피어 맵으로 전개"""
+        mode = self.topology.get('mode', 'custom')
+        if mode == 'custom':
+            edges = self._custom_edges()
+        elif mode in TOPOLOGY_MODES:
+            edges = getattr(self, f'_{mode}_edges')()
+        else:
+            raise ValueError(f'Invalid topology mode: {mode}. Expected one of {TOPOLOGY_MODES}.')
+
+        peer_map, peer_bi_map = {}, {}
+        for region, peer in edges:
+            if region == peer:
+                continue
+            peers = peer_map.setdefault(region, [])
+            if peer not in peers:
+                peers.append(peer)
+            for fr, to in ((region, peer), (peer, region)):
+                bi_peers = peer_bi_map.setdefault(fr, [])
+                if to not in bi_peers:
+                    bi_peers.append(to)
+
+        # 피어가 없는 지역도 빈 리스트로 포함 (peer_map에 명시된 빈 지역 포함)
+        for region in [*self.regions, *self.peer_map]:
+            peer_bi_map.setdefault(region, [])
+        return TopologyPlan(mode=mode, peer_map=peer_map, peer_bi_map=peer_bi_map)
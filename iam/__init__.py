@@ -1,3 +1,4 @@
 from .iam_manager import IamManager
+from .iam_policy_resource import IamPolicyResourceManager
 
-__all__ = ['IamManager']
+__all__ = ['IamManager', 'IamPolicyResourceManager']
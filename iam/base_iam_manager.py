@@ -1,15 +1,31 @@
-import oci as oci_sdk  # type: ignore
+from dataclasses import dataclass, field
 
+from utils.error_context import annotate_error
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
+from utils.waiter import wait_until
 
-logger = global_logger
+logger = get_logger(__name__)
+
+
+@dataclass
+class PolicySpec:
+    # 정책을 생성할 때 사용할 OCI 프로파일(지역)과 정책이 위치할 테넌시
+    region: str
+    tenancy_id: str
+    name: str
+    description: str
+    statements: list[str] = field(default_factory=list)
+    # 테넌시별로 통합할 때 사용할 정책 이름 (예: 'AllowRemotePeering_Requestor')
+    group_name: str | None = None
 
 
 @apply_exception_handler
 class BaseIamManager:
     def create_policy(self, iam_client, compartment_id, policy_name, description, statements):
         """IAM 정책 생성 (이미 존재하는 경우 예외처리)"""
+        import oci as oci_sdk  # type: ignore
+
         try:
             policy_details = oci_sdk.identity.models.CreatePolicyDetails(
                 compartment_id=compartment_id,
@@ -17,12 +33,46 @@ class BaseIamManager:
                 description=description,
                 statements=statements,
             )
-            iam_client.create_policy(policy_details)
-            logger.info(f'IAM policy {policy_name} created successfully.')
+            policy = iam_client.create_policy(policy_details).data
+            self.wait_policy_active(iam_client, policy.id, policy_name)
+            logger.info('IAM policy %s created successfully.', policy_name)
         except oci_sdk.exceptions.ServiceError as e:
             if e.status == 409:  # Conflict
-                logger.info(f'IAM policy {policy_name} already exists.')
+                logger.info('IAM policy %s already exists.', policy_name)
             else:
-                logger.error(f'Failed to create policy {policy_name}: {e}')
+                annotate_error(e, policy=policy_name)
                 raise e
         return policy_details
+
+    def update_policy(self, iam_client, policy_id, policy_name, description, statements):
+        """기존 IAM 정책의 설명/구문 갱신"""
+        import oci as oci_sdk  # type: ignore
+
+        policy_details = oci_sdk.identity.models.UpdatePolicyDetails(description=description, statements=statements)
+        iam_client.update_policy(policy_id, policy_details)
+        self.wait_policy_active(iam_client, policy_id, policy_name)
+        logger.info('IAM policy %s updated successfully.', policy_name)
+        return policy_details
+
+    def delete_policy(self, iam_client, policy_id, policy_name):
+        """IAM 정책 삭제 (이미 삭제된 경우 무시)"""
+        import oci as oci_sdk  # type: ignore
+
+        try:
+            iam_client.delete_policy(policy_id)
+            logger.info('IAM policy %s deleted successfully.', policy_name)
+        except oci_sdk.exceptions.ServiceError as e:
+            if e.status != 404:
+                annotate_error(e, policy=policy_name)
+                raise e
+
+    def wait_policy_active(self, iam_client, policy_id, policy_name):
+        """정책이 ACTIVE가 될 때까지 대기 (ACTIVE가 되어야 이후 피어링 요청에서 권한이 적용됨)"""
+        return wait_until(
+            lambda: iam_client.get_policy(policy_id).data,
+            lambda details: details.lifecycle_state == 'ACTIVE',
+            is_failed=lambda details: details.lifecycle_state in ('DELETING', 'DELETED', 'INACTIVE'),
+            timeout=120,
+            initial_delay=1,
+            description=f'IAM policy {policy_name}',
+        )
@@ -1,10 +1,10 @@
 from config import Config
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
 
-from .base_iam_manager import BaseIamManager
+from .base_iam_manager import BaseIamManager, PolicySpec
 
-logger = global_logger
+logger = get_logger(__name__)
 
 
 @apply_exception_handler
@@ -39,15 +39,12 @@ class CrossTenancyPolicyManager(BaseIamManager):
 
         return policy_name, description, statements
 
-    def create_policies(self, region, peer):
+    def generate_policies(self, region, peer):
         """
-        테넌시 간 전체 리소스 관리 권한을 요청하는 IAM 정책 생성.
+        테넌시 간 전체 리소스 관리 권한을 요청하는 IAM 정책 명세 생성 (Requestor, Acceptor).
         """
-        logger.info(f'Creating Cross Tenancy policies: Requestor - {region}, Acceptor - {peer}')
         policy_name_suffix = f'{region}_{peer}'
 
-        fr_iam_client = self.regions[region].iam_client
-        to_iam_client = self.regions[peer].iam_client
         fr_tenancy_id = self.regions[region].tenancy
         to_tenancy_id = self.regions[peer].tenancy
         fr_admin_group_id = self.regions[region].admin_group_id
@@ -62,14 +59,32 @@ class CrossTenancyPolicyManager(BaseIamManager):
             'acceptor', fr_admin_group_id, fr_tenancy_id, policy_name_suffix
         )
 
-        # 정책 생성 - 상위 클래스의 create_policy 메서드 사용
-        self.create_policy(fr_iam_client, fr_tenancy_id, fr_policy_name, fr_description, fr_statements)
-        self.create_policy(to_iam_client, to_tenancy_id, to_policy_name, to_description, to_statements)
+        return [
+            PolicySpec(
+                region,
+                fr_tenancy_id,
+                fr_policy_name,
+                fr_description,
+                fr_statements,
+                group_name=fr_policy_name.removesuffix(f'_{policy_name_suffix}'),
+            ),
+            PolicySpec(
+                peer,
+                to_tenancy_id,
+                to_policy_name,
+                to_description,
+                to_statements,
+                group_name=to_policy_name.removesuffix(f'_{policy_name_suffix}'),
+            ),
+        ]
 
-    def create_all_policies(self):
+    def all_policy_specs(self):
         """
-        각 테넌시 관리 정책을 한 번에 설정하는 함수.
+        각 테넌시 관리 정책 명세를 한 번에 생성하는 함수.
         """
-        for region, peers in self.peer_bi_map.items():
-            for peer in peers:
-                self.create_policies(region, peer)
+        return [
+            spec
+            for region, peers in self.peer_bi_map.items()
+            for peer in peers
+            for spec in self.generate_policies(region, peer)
+        ]
@@ -1,11 +1,18 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from config import Config
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
+from utils.rate_limit import RateLimitedClient, RateLimiterRegistry
+from utils.tracing import tracer
 
 from .cross_tenancy_policy_manager import CrossTenancyPolicyManager
+from .policy_planner import LEGACY_POLICY_PATTERN, PolicyPlanner
+from .policy_reconciler import PolicyReconciler
 from .rpc_policy_manager import RpcPolicyManager
 
-logger = global_logger
+logger = get_logger(__name__)
 
 
 @apply_exception_handler
@@ -16,11 +23,87 @@ class IamManager:
         self.peer_map = configs.peer_map
         self.cross_tenancy_policy_manager = CrossTenancyPolicyManager(configs)
         self.rpc_policy_manager = RpcPolicyManager(configs)
+        self.policy_planner = PolicyPlanner()
+        self.policy_reconciler = PolicyReconciler()
+        # 테넌시별 Identity API 호출 속도 제한 (429 방지)
+        self.iam_settings = configs.iam
+        self.rate_limiters = RateLimiterRegistry(self.iam_settings.requests_per_second, self.iam_settings.burst)
+        # 테넌시별 IAM 준비는 한 번만 수행 (여러 엣지가 같은 테넌시를 공유)
+        self._ready_tenancies = set()
+        self._tenancy_locks = {}
+        self._locks_guard = threading.Lock()
+        self._tenancy_specs = None
+        # 일부 지역만 반영하는 실행(지역/계층 선택, 실패한 지역 제외)의 정책 명세에는 다른 지역의 구문이 빠져 있으므로
+        # 기존 정책을 덮어쓰거나 이전 정책을 삭제하지 않고 없는 정책만 생성
+        self.full_scope = not configs.selection.partial
+
+    def tenancy_policy_specs(self):
+        """
+        피어링에 필요한 엣지별 정책 명세를 테넌시/역할별 통합 정책으로 묶어 반환.
+        """
+        if self._tenancy_specs is not None:
+            return self._tenancy_specs
+        if not self.peer_map:
+            return {}
+        specs = self.cross_tenancy_policy_manager.all_policy_specs() + self.rpc_policy_manager.all_policy_specs()
+        self._tenancy_specs = self.policy_planner.plan(specs)
+        return self._tenancy_specs
+
+    def create_tenancy_iam(self, tenancy_id, specs):
+        """테넌시 1개의 정책을 현재 상태와 비교하여 필요한 생성/갱신만 수행"""
+        if not specs:
+            return {}
+        iam_client = RateLimitedClient(
+            self.regions[specs[0].region].iam_client,
+            self.rate_limiters.get(tenancy_id),
+            self.iam_settings.max_retries,
+        )
+        with tracer.span('iam.tenancy', category='iam', region=specs[0].region, policies=len(specs)):
+            return self.policy_reconciler.reconcile_all(
+                iam_client,
+                tenancy_id,
+                [(spec.name, spec.description, spec.statements) for spec in specs],
+                prune_pattern=LEGACY_POLICY_PATTERN if self.full_scope else None,
+                update_existing=self.full_scope,
+            )
+
+    def ensure_tenancy_iam(self, tenancy_id, specs=None):
+        """
+        테넌시의 피어링 정책이 준비되었는지 확인하고, 아직이면 생성 (테넌시당 한 번).
+        여러 스레드에서 동시에 호출되어도 같은 테넌시의 정책은 한 번만 생성된다.
+        """
+        with self._locks_guard:
+            lock = self._tenancy_locks.setdefault(tenancy_id, threading.Lock())
+        with lock:
+            if tenancy_id in self._ready_tenancies:
+                return
+            if specs is None:
+                specs = self.tenancy_policy_specs().get(tenancy_id, [])
+            self.create_tenancy_iam(tenancy_id, specs)
+            self._ready_tenancies.add(tenancy_id)
 
     def create_all_iam(self):
-        """모든 IAM 정책 생성"""
-        if self.peer_map:
-            self.cross_tenancy_policy_manager.create_all_policies()
-            self.rpc_policy_manager.create_all_policies()
+        """
+        모든 IAM 정책 생성.
+        테넌시끼리는 서로 독립적이므로 워커 풀에서 병렬로 처리하고, 실패는 모아서 마지막에 보고한다.
+        """
+        tenancy_specs = self.tenancy_policy_specs()
+        if not tenancy_specs:
+            return
+
+        errors = {}
+        max_workers = max(min(self.iam_settings.max_workers, len(tenancy_specs)), 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.ensure_tenancy_iam, tenancy_id, specs): tenancy_id
+                for tenancy_id, specs in tenancy_specs.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[futures[future]] = e
 
+        if errors:
+            raise RuntimeError(f'Failed to apply IAM policies in {len(errors)} tenancy(ies): {list(errors)}')
         logger.info('All IAM resources created successfully.')
@@ -0,0 +1,147 @@
+import re
+import threading
+
+from pulumi.dynamic import CreateResult, DiffResult, ReadResult, Resource, ResourceProvider, UpdateResult
+
+from config import Config
+from utils.exception_handler import apply_exception_handler
+from utils.logger import get_logger
+from utils.tracing import provider_span
+
+from .iam_manager import IamManager
+from .policy_planner import LEGACY_POLICY_PATTERN
+
+logger = get_logger(__name__)
+
+# 정책이 위치할 테넌시/생성에 사용할 프로파일이 바뀌면 새로 생성
+REPLACE_KEYS = ('tenancy_id', 'profile')
+
+
+# 동적 프로바이더 프로세스 안에서 테넌시별 Identity API 호출 속도를 제한
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def _rate_limited_client(props):
+    from utils.oci_client_registry import oci_client_registry
+    from utils.rate_limit import RateLimitedClient, TokenBucket
+
+    with _rate_limiters_lock:
+        if props['tenancy_id'] not in _rate_limiters:
+            _rate_limiters[props['tenancy_id']] = TokenBucket(props['requests_per_second'], props['burst'])
+        bucket = _rate_limiters[props['tenancy_id']]
+    return RateLimitedClient(oci_client_registry.identity_client(props['profile']), bucket, props['max_retries'])
+
+
+def _ensure_policies(props):
+    from .policy_reconciler import PolicyReconciler
+
+    prune_pattern = props.get('prune_pattern')
+    with provider_span('iam.tenancy', region=props['profile'], policies=len(props['policies'])):
+        PolicyReconciler().reconcile_all(
+            _rate_limited_client(props),
+            props['tenancy_id'],
+            [(policy['name'], policy['description'], policy['statements']) for policy in props['policies']],
+            prune_pattern=re.compile(prune_pattern) if prune_pattern else None,
+            update_existing=props.get('update_existing', True),
+        )
+
+
+class TenancyPolicyProvider(ResourceProvider):
+    """
+    테넌시 1개의 피어링 IAM 정책을 준비하는 동적 프로바이더.
+    해당 테넌시의 피어링 엣지는 이 리소스가 생성된 이후에만 연결된다.
+    """
+
+    def create(self, props):
+        _ensure_policies(props)
+        return CreateResult(id_=props['tenancy_id'], outs=props)
+
+    def diff(self, _id, olds, news):
+        replaces = [key for key in REPLACE_KEYS if olds.get(key) != news.get(key)]
+        # 이전 정책 삭제 패턴이 추가/변경되면 기존 상태에서도 update를 실행하여 이전 정책을 정리
+        changes = bool(replaces) or any(
+            olds.get(key) != news.get(key) for key in ('policies', 'prune_pattern', 'update_existing')
+        )
+        return DiffResult(changes=changes, replaces=replaces, delete_before_replace=True)
+
+    def update(self, _id, _olds, news):
+        # 추가/변경된 정책만 생성/갱신되고, 통합 전 엣지별 정책은 삭제됨
+        _ensure_policies(news)
+        return UpdateResult(outs=news)
+
+    def read(self, id_, props):
+        """
+        refresh 시 테넌시의 실제 정책을 조회하여 outs['policies']에 기록.
+        삭제되었거나 구문이 바뀐 정책은 계획과 달라지므로 다음 up에서 다시 생성/갱신된다.
+        """
+        from .policy_reconciler import PolicyReconciler, _normalize_statements
+
+        reconciler = PolicyReconciler()
+        reconciler.prefetch(_rate_limited_client(props), props['tenancy_id'])
+        live_policies = []
+        for policy in props.get('policies') or []:
+            current = reconciler.get(props['tenancy_id'], policy['name'])
+            if current is None:
+                logger.info('IAM policy %s no longer exists in tenancy %s.', policy['name'], props['tenancy_id'])
+                continue
+            statements = list(current.statements or [])
+            # 공백 차이만 있으면 계획된 구문을 유지하여 불필요한 diff를 만들지 않음
+            if _normalize_statements(statements) == _normalize_statements(policy['statements']):
+                statements = policy['statements']
+            live_policies.append({'name': current.name, 'description': current.description, 'statements': statements})
+        return ReadResult(id_=id_, outs={**props, 'policies': live_policies})
+
+    def delete(self, _id, props):
+        # 정책은 다른 스택/수동 설정과 공유될 수 있으므로 상태에서만 제거
+        logger.info('IAM policies of tenancy %s removed from state.', props.get('tenancy_id'))
+
+
+class TenancyPolicies(Resource):
+    """테넌시 1개의 피어링 IAM 정책 묶음을 나타내는 동적 리소스"""
+
+    def __init__(self, name, props, opts=None):
+        super().__init__(TenancyPolicyProvider(), name, props, opts)
+
+
+@apply_exception_handler
+class IamPolicyResourceManager:
+    """테넌시마다 TenancyPolicies 리소스를 생성하는 클래스"""
+
+    def __init__(self, configs: Config):
+        self.configs = configs
+        self.iam_manager = IamManager(configs)
+
+    def create_tenancy_policies(self, tenancy_id, specs):
+        """테넌시 1개의 TenancyPolicies 리소스 생성 (정책 생성은 첫 번째 명세의 프로파일 사용)"""
+        profile = specs[0].region
+        return TenancyPolicies(
+            f'{profile}-peering-iam',
+            {
+                'tenancy_id': tenancy_id,
+                'profile': profile,
+                'requests_per_second': self.configs.iam.requests_per_second,
+                'burst': self.configs.iam.burst,
+                'max_retries': self.configs.iam.max_retries,
+                'policies': [
+                    {'name': spec.name, 'description': spec.description, 'statements': spec.statements}
+                    for spec in specs
+                ],
+                # 일부 지역만 반영하는 실행에서는 기존 정책 갱신/이전 정책 삭제를 하지 않음
+                'prune_pattern': LEGACY_POLICY_PATTERN.pattern if self.iam_manager.full_scope else None,
+                'update_existing': self.iam_manager.full_scope,
+            },
+        )
+
+    def create_all_tenancy_policies(self):
+        """
+        테넌시별 TenancyPolicies 리소스 생성.
+
+        Returns:
+            dict: {tenancy_id: TenancyPolicies}
+        """
+        return {
+            tenancy_id: self.create_tenancy_policies(tenancy_id, specs)
+            for tenancy_id, specs in self.iam_manager.tenancy_policy_specs().items()
+            if specs
+        }
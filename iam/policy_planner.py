@@ -0,0 +1,126 @@
+import re
+
+from .base_iam_manager import PolicySpec
+
+# OCI 정책 1개에 포함할 수 있는 최대 구문 수
+MAX_STATEMENTS_PER_POLICY = 50
+
+DEFINE_PATTERN = re.compile(r'^Define\s+(tenancy|group)\s+(\w+)\s+as\s+(\S+)$', re.IGNORECASE)
+REFERENCE_PATTERN = re.compile(r'\b(tenancy|group)\s+(\w+)\b', re.IGNORECASE)
+
+# 통합 이전의 엣지별 정책(<역할>_<region>_<peer>)과 분할된 통합 정책(<역할>_<n>)의 이름.
+# 현재 계획에 없는 정책은 통합 정책이 ACTIVE가 된 뒤 PolicyReconciler가 삭제한다.
+LEGACY_POLICY_PATTERN = re.compile(
+    r'^(AllowRemotePeering_Requestor|AllowRemotePeering_Acceptor|Cross_Tenant_Admin_Policy_Acceptor)_.+$'
+)
+
+
+class _ConsolidatedPolicy:
+    """테넌시/역할 1개의 통합 정책 구성 상태 (별칭 할당, 구문 중복 제거)"""
+
+    def __init__(self, spec):
+        self.region = spec.region
+        self.tenancy_id = spec.tenancy_id
+        self.name = spec.group_name or spec.name
+        self.description = spec.description
+        # (kind, ocid) -> 통합 정책 내 별칭
+        self.aliases = {}
+        # (kind, 통합 정책 내 별칭) -> Define 구문
+        self.defines = {}
+        # 구문 -> 필요한 (kind, 별칭) 목록, 입력 순서 유지
+        self.statements = {}
+
+    def _alias_for(self, kind, name, ocid):
+        key = (kind.lower(), ocid)
+        if key not in self.aliases:
+            used = {alias for (alias_kind, _), alias in self.aliases.items() if alias_kind == key[0]}
+            alias, index = name, 1
+            while alias in used:
+                index += 1
+                alias = f'{name}{index}'
+            self.aliases[key] = alias
+            self.defines[(key[0], alias)] = f'Define {kind} {alias} as {ocid}'
+        return self.aliases[key]
+
+    def add(self, spec):
+        """정책 명세 1개의 구문을 별칭을 바꿔가며 통합"""
+        renames = {}
+        for statement in spec.statements:
+            matched = DEFINE_PATTERN.match(statement.strip())
+            if matched:
+                kind, name, ocid = matched.groups()
+                renames[(kind.lower(), name)] = self._alias_for(kind, name, ocid)
+
+        for statement in spec.statements:
+            statement = ' '.join(statement.split())
+            if DEFINE_PATTERN.match(statement):
+                continue
+            required = []
+
+            def rename(matched, required=required):
+                kind, name = matched.group(1), matched.group(2)
+                alias = renames.get((kind.lower(), name))
+                if alias is None:
+                    return matched.group(0)
+                required.append((kind.lower(), alias))
+                return f'{kind} {alias}'
+
+            statement = REFERENCE_PATTERN.sub(rename, statement)
+            self.statements.setdefault(statement, list(dict.fromkeys(required)))
+
+    def chunks(self, max_statements):
+        """구문을 정책 최대 구문 수에 맞게 분할 (각 조각에는 필요한 Define 구문을 함께 포함)"""
+        chunks, current, current_defines = [], [], {}
+        for statement, required in self.statements.items():
+            new_defines = [key for key in required if key not in current_defines]
+            if current and len(current) + len(current_defines) + len(new_defines) + 1 > max_statements:
+                chunks.append((current_defines, current))
+                current, current_defines = [], {}
+                new_defines = list(required)
+            for key in new_defines:
+                current_defines[key] = self.defines[key]
+            current.append(statement)
+        if current:
+            chunks.append((current_defines, current))
+        return [[*defines.values(), *statements] for defines, statements in chunks]
+
+
+class PolicyPlanner:
+    """
+    엣지별 IAM 정책 명세를 테넌시/역할별 통합 정책으로 변환하는 클래스.
+
+    - 같은 테넌시, 같은 역할(group_name)의 구문을 하나의 정책으로 묶는다.
+    - 같은 OCID를 가리키는 Define 구문은 하나로 합치고, 서로 다른 OCID에는 고유한 별칭을 부여한다.
+    - 중복된 Define/Endorse/Admit/Allow 구문은 제거한다.
+    - 구문 수가 max_statements를 넘으면 '<이름>_2', '<이름>_3' ... 으로 분할한다.
+    """
+
+    def __init__(self, max_statements=MAX_STATEMENTS_PER_POLICY):
+        self.max_statements = max_statements
+
+    def plan(self, specs):
+        """
+        Returns:
+            dict: {tenancy_id: [PolicySpec]}
+        """
+        consolidated = {}
+        for spec in specs:
+            key = (spec.tenancy_id, spec.group_name or spec.name)
+            if key not in consolidated:
+                consolidated[key] = _ConsolidatedPolicy(spec)
+            consolidated[key].add(spec)
+
+        tenancy_specs = {}
+        for (tenancy_id, _), policy in consolidated.items():
+            for index, statements in enumerate(policy.chunks(self.max_statements), start=1):
+                tenancy_specs.setdefault(tenancy_id, []).append(
+                    PolicySpec(
+                        policy.region,
+                        tenancy_id,
+                        policy.name if index == 1 else f'{policy.name}_{index}',
+                        policy.description,
+                        statements,
+                        group_name=policy.name,
+                    )
+                )
+        return tenancy_specs
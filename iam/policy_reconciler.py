@@ -0,0 +1,134 @@
+import threading
+
+from utils.exception_handler import apply_exception_handler
+from utils.logger import get_logger
+
+from .base_iam_manager import BaseIamManager
+
+logger = get_logger(__name__)
+
+
+def _normalize_statements(statements):
+    return [' '.join(statement.split()) for statement in statements or []]
+
+
+@apply_exception_handler
+class PolicyReconciler(BaseIamManager):
+    """
+    IAM 정책 diff 기반 동기화.
+
+    테넌시별로 list_policies를 페이지네이션하여 한 번만 조회하고 정책 이름으로 인덱싱한 뒤,
+    원하는 정책 명세와 비교하여 필요한 생성/갱신만 호출한다. (변경이 없으면 쓰기 호출 0회)
+    원하는 정책이 모두 ACTIVE이면 같은 스냅샷에서 prune_pattern에 맞는 이전 정책(통합 전 엣지별 정책 등)을 삭제한다.
+    """
+
+    def __init__(self):
+        self._policies = {}
+        self._loaded = set()
+        self._lock = threading.Lock()
+
+    def prefetch(self, iam_client, tenancy_id):
+        """테넌시(루트 compartment)의 모든 정책을 조회하여 이름으로 인덱싱 (테넌시당 한 번)"""
+        from oci.pagination import list_call_get_all_results  # type: ignore
+
+        with self._lock:
+            if tenancy_id in self._loaded:
+                return
+            self._loaded.add(tenancy_id)
+
+        try:
+            policies = list_call_get_all_results(iam_client.list_policies, compartment_id=tenancy_id).data
+        except Exception:
+            # 실패한 테넌시는 다시 조회할 수 있도록 제거
+            with self._lock:
+                self._loaded.discard(tenancy_id)
+            raise
+
+        with self._lock:
+            for policy in policies:
+                if policy.lifecycle_state not in ('DELETING', 'DELETED'):
+                    self._policies[(tenancy_id, policy.name)] = policy
+        logger.info('Prefetched %d IAM policies in tenancy %s', len(policies), tenancy_id)
+
+    def get(self, tenancy_id, policy_name):
+        """스냅샷에서 정책 조회 (없으면 None)"""
+        return self._policies.get((tenancy_id, policy_name))
+
+    def reconcile(self, iam_client, tenancy_id, policy_name, description, statements, update_existing=True):
+        """
+        정책 1개를 원하는 상태로 맞춤.
+        update_existing이 False이면 없는 정책만 생성하고, 내용이 다른 기존 정책은 그대로 둔다.
+
+        Returns:
+            str: 'created', 'updated', 'unchanged' 또는 'skipped'
+        """
+        self.prefetch(iam_client, tenancy_id)
+        current = self.get(tenancy_id, policy_name)
+
+        if current is None:
+            self.create_policy(iam_client, tenancy_id, policy_name, description, statements)
+            return 'created'
+
+        same_statements = _normalize_statements(current.statements) == _normalize_statements(statements)
+        if current.description == description and same_statements:
+            logger.debug('IAM policy %s is up to date.', policy_name)
+            if current.lifecycle_state != 'ACTIVE':
+                self.wait_policy_active(iam_client, current.id, policy_name)
+            return 'unchanged'
+
+        if not update_existing:
+            logger.warning('IAM policy %s differs from the plan; not updated in a partial run.', policy_name)
+            return 'skipped'
+
+        self.update_policy(iam_client, current.id, policy_name, description, statements)
+        return 'updated'
+
+    def prune(self, iam_client, tenancy_id, pattern, keep_names):
+        """
+        스냅샷에서 이름이 pattern에 맞고 keep_names에 없는 정책을 삭제.
+
+        Returns:
+            int: 삭제한 정책 수
+        """
+        with self._lock:
+            stale = [
+                policy
+                for (policy_tenancy_id, policy_name), policy in self._policies.items()
+                if policy_tenancy_id == tenancy_id and pattern.match(policy_name) and policy_name not in keep_names
+            ]
+        for policy in stale:
+            self.delete_policy(iam_client, policy.id, policy.name)
+            with self._lock:
+                self._policies.pop((tenancy_id, policy.name), None)
+        return len(stale)
+
+    def reconcile_all(self, iam_client, tenancy_id, policies, prune_pattern=None, update_existing=True):
+        """
+        테넌시 1개의 정책 목록을 동기화.
+        생성/갱신은 정책이 ACTIVE가 될 때까지 기다리므로, 모든 정책이 반영된 뒤에만 이전 정책을 삭제한다.
+
+        Args:
+            policies: (name, description, statements) 튜플 목록
+            prune_pattern: 삭제할 이전 정책 이름 패턴 (re.Pattern, None이면 삭제하지 않음)
+            update_existing: False이면 없는 정책만 생성 (일부 지역만 반영하는 실행에서 다른 지역의 구문 보존)
+
+        Returns:
+            dict: {'created': n, 'updated': n, 'unchanged': n, 'skipped': n, 'deleted': n}
+        """
+        counts = dict.fromkeys(('created', 'updated', 'unchanged', 'skipped', 'deleted'), 0)
+        for policy_name, description, statements in policies:
+            state = self.reconcile(iam_client, tenancy_id, policy_name, description, statements, update_existing)
+            counts[state] += 1
+        if prune_pattern is not None:
+            keep_names = {policy_name for policy_name, _, _ in policies}
+            counts['deleted'] = self.prune(iam_client, tenancy_id, prune_pattern, keep_names)
+        logger.info(
+            'IAM policies in tenancy %s: %d created, %d updated, %d unchanged, %d skipped, %d deleted',
+            tenancy_id,
+            counts['created'],
+            counts['updated'],
+            counts['unchanged'],
+            counts['skipped'],
+            counts['deleted'],
+        )
+        return counts
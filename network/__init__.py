@@ -1,5 +1,6 @@
 from .network_manager import NetworkManager
 from .public_ip import PublicIpManager
 from .remote_peering_connection import RemotePeeringConnector
+from .remote_peering_resource import RemotePeeringResourceManager
 
-__all__ = ['NetworkManager', 'PublicIpManager', 'RemotePeeringConnector']
+__all__ = ['NetworkManager', 'PublicIpManager', 'RemotePeeringConnector', 'RemotePeeringResourceManager']
@@ -1,5 +1,6 @@
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
+from utils.tracing import tracer
 
 from .gateway import GatewayManager
 from .remote_peering_connection import RemotePeeringConnectionManager
@@ -8,7 +9,7 @@ from .security import SecurityListManager
 from .subnet import SubnetManager
 from .vcn import VCNManager
 
-logger = global_logger
+logger = get_logger(__name__)
 
 
 @apply_exception_handler
@@ -22,58 +23,66 @@ class NetworkManager:
 
     def create_network(self):
         # Step 1: VCN 생성
-        vcn_manager = VCNManager(self.region, self.config, self.compartment_id)
-        vcn_id = vcn_manager.create_vcn()
+        with tracer.span('network.vcn', category='declare', region=self.region):
+            vcn_manager = VCNManager(self.region, self.config, self.compartment_id)
+            vcn_id = vcn_manager.create_vcn()
 
         # Step 2: 게이트웨이 생성 (인터넷, NAT, 서비스, 동적라우팅)
-        gateway_manager = GatewayManager(self.region, self.config, self.compartment_id, vcn_id, self.peers)
-        gateway_ids = gateway_manager.create_gateways()
+        with tracer.span('network.gateways', category='declare', region=self.region):
+            gateway_manager = GatewayManager(self.region, self.config, self.compartment_id, vcn_id, self.peers)
+            gateway_ids = gateway_manager.create_gateways()
 
         remote_peering_connection_ids = {}
         #  Step 2.5: 리모트 피어링 커넥션 생성
         if self.peers:
-            remote_peering_connection_manager = RemotePeeringConnectionManager(
+            with tracer.span(
+                'network.remote_peering_connections', category='declare', region=self.region, peers=len(self.peers)
+            ):
+                remote_peering_connection_manager = RemotePeeringConnectionManager(
+                    self.region,
+                    self.config,
+                    self.compartment_id,
+                    gateway_ids,
+                    self.regions,
+                    self.peers,
+                )
+                remote_peering_connection_ids = remote_peering_connection_manager.create_remote_peering_connections()
+
+        # Step 3: 라우트 테이블 생성 (프라이빗, 퍼블릭)
+        with tracer.span('network.route_tables', category='declare', region=self.region):
+            route_table_manager = RouteTableManager(
                 self.region,
                 self.config,
                 self.compartment_id,
+                vcn_id,
                 gateway_ids,
                 self.regions,
                 self.peers,
             )
-            remote_peering_connection_ids = remote_peering_connection_manager.create_remote_peering_connections()
-
-        # Step 3: 라우트 테이블 생성 (프라이빗, 퍼블릭)
-        route_table_manager = RouteTableManager(
-            self.region,
-            self.config,
-            self.compartment_id,
-            vcn_id,
-            gateway_ids,
-            self.regions,
-            self.peers,
-        )
-        route_table_ids = route_table_manager.create_route_tables()
+            route_table_ids = route_table_manager.create_route_tables()
 
         # Step 4: 보안 리스트 생성 (노드, K8s API, 서비스 로드 밸런서)
-        security_list_manager = SecurityListManager(
-            self.region,
-            self.config,
-            self.compartment_id,
-            vcn_id,
-            self.regions,
-            self.peers,
-        )
-        security_list_ids = security_list_manager.create_security_lists()
+        with tracer.span('network.security_lists', category='declare', region=self.region):
+            security_list_manager = SecurityListManager(
+                self.region,
+                self.config,
+                self.compartment_id,
+                vcn_id,
+                self.regions,
+                self.peers,
+            )
+            security_list_ids = security_list_manager.create_security_lists()
 
         # Step 5: 서브넷 생성 (서비스 로드 밸런서, 노드, K8s API)
-        subnet_manager = SubnetManager(
-            self.region,
-            self.config,
-            self.compartment_id,
-            vcn_id,
-            route_table_ids,
-            security_list_ids,
-        )
-        subnet_ids = subnet_manager.create_subnets()
+        with tracer.span('network.subnets', category='declare', region=self.region):
+            subnet_manager = SubnetManager(
+                self.region,
+                self.config,
+                self.compartment_id,
+                vcn_id,
+                route_table_ids,
+                security_list_ids,
+            )
+            subnet_ids = subnet_manager.create_subnets()
 
         return vcn_id, subnet_ids, remote_peering_connection_ids
@@ -0,0 +1,86 @@
+import threading
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 목록에서 제외할 NLB 상태 (이미 삭제되어 서브넷 삭제를 막지 않음)
+IGNORED_LIFECYCLE_STATES = ('DELETED',)
+
+
+def iter_network_load_balancers(nlb_client, compartment_id, ignored_states=IGNORED_LIFECYCLE_STATES, **filters):
+    """
+    compartment의 NLB 요약 정보를 페이지 단위로 지연 조회하는 generator.
+    다음 페이지는 앞 페이지를 모두 소비한 뒤에만 요청하므로, 필요한 NLB를 찾으면 중간에 멈출 수 있다.
+
+    Args:
+        nlb_client: NetworkLoadBalancerClient
+        compartment_id (str): 조회할 compartment OCID
+        ignored_states (tuple): 건너뛸 lifecycle_state
+        **filters: list_network_load_balancers 필터 (예: lifecycle_state, display_name)
+    """
+    from oci.pagination import list_call_get_all_results_generator  # type: ignore
+
+    for nlb in list_call_get_all_results_generator(
+        nlb_client.list_network_load_balancers, 'record', compartment_id=compartment_id, **filters
+    ):
+        if nlb.lifecycle_state not in ignored_states:
+            yield nlb
+
+
+class NlbInventory:
+    """
+    compartment 단위 NLB 인벤토리.
+
+    compartment마다 NLB 목록을 모든 페이지에 걸쳐 한 번만 조회하고 서브넷 ID로 인덱싱하여,
+    서브넷별 확인(SubnetManager.check_nlb)과 다른 삭제 전 확인이 같은 스냅샷을 사용한다.
+    """
+
+    def __init__(self):
+        self._by_subnet = {}
+        self._lock = threading.Lock()
+        self._load_locks = {}
+
+    def _load(self, nlb_client, compartment_id):
+        """compartment의 서브넷 ID 인덱스 (같은 compartment는 동시에 요청해도 한 번만 조회)"""
+        with self._lock:
+            index = self._by_subnet.get(compartment_id)
+            if index is not None:
+                return index
+            load_lock = self._load_locks.setdefault(compartment_id, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                index = self._by_subnet.get(compartment_id)
+            if index is not None:
+                return index
+
+            index = {}
+            count = 0
+            for nlb in iter_network_load_balancers(nlb_client, compartment_id):
+                index.setdefault(nlb.subnet_id, []).append(nlb)
+                count += 1
+            with self._lock:
+                self._by_subnet[compartment_id] = index
+            logger.info(f'Indexed {count} NLB(s) in {len(index)} subnet(s) of compartment {compartment_id}')
+            return index
+
+    def by_subnet(self, nlb_client, compartment_id, subnet_id):
+        """서브넷에 연결된 NLB 목록"""
+        return list(self._load(nlb_client, compartment_id).get(subnet_id, []))
+
+    def in_compartment(self, nlb_client, compartment_id):
+        """compartment의 모든 NLB 목록 (서브넷 ID 순)"""
+        index = self._load(nlb_client, compartment_id)
+        return [nlb for subnet_id in sorted(index) for nlb in index[subnet_id]]
+
+    def invalidate(self, compartment_id=None):
+        """NLB를 생성/삭제한 뒤 다시 조회하도록 스냅샷 제거 (compartment_id가 없으면 전체)"""
+        with self._lock:
+            if compartment_id is None:
+                self._by_subnet.clear()
+            else:
+                self._by_subnet.pop(compartment_id, None)
+
+
+nlb_inventory = NlbInventory()
@@ -1,9 +1,11 @@
 import pulumi
 import pulumi_oci as oci
 
-from utils.logger import global_logger
+from utils.logger import get_logger, quiet_mode, resource_log_counter
+from utils.resource_helper import parented_options
+from utils.stack_exports import stack_exporter
 
-logger = global_logger
+logger = get_logger(__name__)
 
 
 class PublicIpManager:
@@ -19,9 +21,17 @@ class PublicIpManager:
             compartment_id=self.compartment_id,
             display_name='nlb-ip',
             lifetime='RESERVED',
-            opts=pulumi.ResourceOptions(provider=self.config.provider),
+            opts=parented_options(pulumi.ResourceOptions(provider=self.config.provider)),
         )
 
-        public_ip.ip_address.apply(lambda public_ip: public_ip)
-        pulumi.export(f'{self.region}-public_ip_address', public_ip.ip_address)
-        public_ip.ip_address.apply(lambda ip_value: logger.info(f'public_ip_address created with ID: {ip_value}'))
+        stack_exporter.record(
+            self.region,
+            'public_ip_address',
+            'PublicIp',
+            public_ip.ip_address,
+            output_name=f'{self.region}-public_ip_address',
+        )
+        if quiet_mode():
+            resource_log_counter.add('declared', 'PublicIp')
+        else:
+            public_ip.ip_address.apply(lambda ip_value: logger.info('public_ip_address created with ID: %s', ip_value))
@@ -1,16 +1,123 @@
-# import time
-
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import oci as oci_sdk
 import pulumi_oci as oci
 
 from config import Config
+from utils.error_context import annotate_error
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
 from utils.resource_helper import create_resource
+from utils.tracing import tracer
+from utils.waiter import wait_until
+
+from .rpc_state_cache import RpcStateCache
+
+logger = get_logger(__name__)
+
+# 연결이 더 진행될 수 없는 RPC 피어링 상태
+FAILED_PEERING_STATUSES = ('INVALID', 'REVOKED')
+
+
+def connect_remote_peering_connection(
+    virtual_network_client,
+    rpc_id,
+    peer_rpc_id,
+    peer_region_name,
+    wait_timeout=300,
+    rpc_details=None,
+    rpc_name=None,
+):
+    """
+    RPC를 상대 RPC와 연결하고 PEERED 상태가 될 때까지 대기.
+    rpc_details가 주어지면 (스냅샷 등) 상태 조회 API 호출을 생략한다.
 
-logger = global_logger
+    Returns:
+        str: 'already-peered', 'connected' 또는 'conflict'
+    """
+    import oci as oci_sdk  # type: ignore
+
+    rpc_name = rpc_name or rpc_id
+    try:
+        if rpc_details is None:
+            rpc_details = virtual_network_client.get_remote_peering_connection(rpc_id).data  # type: ignore
+        rpc_status = rpc_details.lifecycle_state
+        peering_status = rpc_details.peering_status
+
+        if rpc_status == 'AVAILABLE' and rpc_details.peer_id == peer_rpc_id and peering_status == 'PEERED':
+            logger.info('RPC %s is already connected to %s. Skipping.', rpc_name, peer_rpc_id)
+            return 'already-peered'
+
+        elif rpc_status != 'AVAILABLE':
+            logger.info('RPC %s is in %s state. Waiting for it to become available...', rpc_name, rpc_status)
+            wait_until(
+                lambda: virtual_network_client.get_remote_peering_connection(rpc_id).data,
+                lambda details: details.lifecycle_state == 'AVAILABLE',
+                is_failed=lambda details: details.lifecycle_state in ('TERMINATING', 'TERMINATED'),
+                timeout=wait_timeout,
+                description=f'RPC {rpc_id}',
+            )
+
+        connect_rpc_details = oci_sdk.core.models.ConnectRemotePeeringConnectionsDetails(
+            peer_id=peer_rpc_id,
+            peer_region_name=peer_region_name,
+        )
+        virtual_network_client.connect_remote_peering_connections(
+            remote_peering_connection_id=rpc_id,
+            connect_remote_peering_connections_details=connect_rpc_details,
+        )
+        # 연결 요청 후 PEERED 상태가 될 때까지 대기
+        wait_until(
+            lambda: virtual_network_client.get_remote_peering_connection(rpc_id).data,
+            lambda details: details.peering_status == 'PEERED',
+            is_failed=lambda details: details.peering_status in FAILED_PEERING_STATUSES,
+            timeout=wait_timeout,
+            description=f'Peering of RPC {rpc_id}',
+        )
+        logger.info('RPC %s to %s in region %s connected Successfully.', rpc_name, peer_rpc_id, peer_region_name)
+        return 'connected'
+    except oci_sdk.exceptions.ServiceError as e:
+        if e.status == 409:  # Conflict
+            logger.info('RPC %s is already connected or being connected. Verifying its peer...', rpc_name)
+            verify_peered(virtual_network_client, rpc_id, peer_rpc_id, wait_timeout, rpc_name)
+            return 'conflict'
+        else:
+            annotate_error(e, rpc=rpc_name)
+            raise e
+
+
+def verify_peered(virtual_network_client, rpc_id, peer_rpc_id, wait_timeout=300, rpc_name=None):
+    """
+    연결 요청이 409(Conflict)로 거절된 RPC가 기대한 상대 RPC와 PEERED 상태인지 확인.
+    연결이 진행 중이면 PEERED가 될 때까지 대기하고, 다른 RPC와 연결되었거나 실패 상태이면 예외를 던진다.
+    """
+    rpc_name = rpc_name or rpc_id
+
+    def is_failed(details):
+        connected_elsewhere = details.peer_id is not None and details.peer_id != peer_rpc_id
+        return (
+            connected_elsewhere
+            or details.peering_status in FAILED_PEERING_STATUSES
+            or details.lifecycle_state in ('TERMINATING', 'TERMINATED')
+        )
+
+    try:
+        wait_until(
+            lambda: virtual_network_client.get_remote_peering_connection(rpc_id).data,
+            lambda details: details.peer_id == peer_rpc_id and details.peering_status == 'PEERED',
+            is_failed=is_failed,
+            timeout=wait_timeout,
+            description=f'Peering of RPC {rpc_name}',
+        )
+    except RuntimeError as e:
+        details = virtual_network_client.get_remote_peering_connection(rpc_id).data
+        error = RuntimeError(
+            f'RPC {rpc_name} rejected the connection to {peer_rpc_id} (409): '
+            f'peer_id={details.peer_id}, peering_status={details.peering_status}'
+        )
+        annotate_error(error, rpc=rpc_name)
+        raise error from e
 
 
 @apply_exception_handler
@@ -44,10 +151,14 @@ class RemotePeeringConnectionManager:
 
 @apply_exception_handler
 class RemotePeeringConnector:
-    def __init__(self, region_rpcs, peer_map, configs: Config):
+    def __init__(self, region_rpcs, peer_map, configs: Config, region_compartments=None, iam_manager=None):
         self.region_rpcs = region_rpcs
         self.peer_map = peer_map
         self.configs = configs
+        self.region_compartments = region_compartments or {}
+        # 주어지면 엣지마다 양쪽 테넌시의 IAM 정책을 (테넌시당 한 번) 준비한 뒤 연결
+        self.iam_manager = iam_manager
+        self.rpc_state = RpcStateCache()
 
     def connect_peer(
         self,
@@ -61,57 +172,114 @@ class RemotePeeringConnector:
         """
         RPC 연결을 처리하는 함수.
         """
+        # RPC 상태 확인 (스냅샷에 없으면 개별 조회)
+        return connect_remote_peering_connection(
+            virtual_network_client,
+            rpc_id,
+            peer_rpc_id,
+            peer_region_name,
+            wait_timeout=self.configs.peering.wait_timeout,
+            rpc_details=self.rpc_state.get(rpc_id),
+            rpc_name=f'rpc_{region}_{peer}',
+        )
+
+    def _scope_key(self, region):
+        """동시 처리 한도를 적용할 단위(tenancy 또는 region) 키"""
+        if self.configs.peering.limit_scope == 'region':
+            return region
+        return self.configs.regions[region].tenancy
+
+    def _connect_edge(self, region, peer, scope_semaphores):
+        """
+        피어링 엣지 1개 연결 (요청 측 scope의 동시 처리 한도 적용).
+        예외를 던지지 않고 (status, elapsed, error) 형태로 결과를 반환한다.
+        """
+        started = time.perf_counter()
         try:
-            # RPC 상태 확인
-            rpc_details = virtual_network_client.get_remote_peering_connection(rpc_id).data  # type: ignore
-            rpc_status = rpc_details.lifecycle_state
-            peering_status = rpc_details.peering_status
-
-            if rpc_status == 'AVAILABLE' and rpc_details.peer_id == peer_rpc_id and peering_status == 'PEERED':
-                print(f'RPC {rpc_id} is already connected to {peer_rpc_id}. Skipping.')
-                return
-
-            elif rpc_status == 'PENDING':
-                print(f'RPC {rpc_id} is in PENDING state. Waiting for it to become available...')
-                time.sleep(60)  # 대기 시간 설정 (예: 60초)
-                rpc_details = virtual_network_client.get_remote_peering_connection(rpc_id).data  # type: ignore
-                if rpc_details.lifecycle_state != 'AVAILABLE':
-                    raise Exception(f'RPC {rpc_id} is still not available after waiting.')
-
-            rpc_name = f'rpc_{region}_{peer}'
-            connect_rpc_details = oci_sdk.core.models.ConnectRemotePeeringConnectionsDetails(
-                peer_id=peer_rpc_id,
-                peer_region_name=peer_region_name,
-            )
-            virtual_network_client.connect_remote_peering_connections(
-                remote_peering_connection_id=rpc_id,
-                connect_remote_peering_connections_details=connect_rpc_details,
+            with tracer.span('peering.edge', category='peering', region=region, peer=peer) as span:
+                rpc_id = self.region_rpcs[region][peer]
+                peer_rpc_id = self.region_rpcs[peer][region]
+                peer_region_name = self.configs.regions[peer].region_name
+                if self.iam_manager:
+                    for tenancy_id in dict.fromkeys(
+                        [self.configs.regions[region].tenancy, self.configs.regions[peer].tenancy]
+                    ):
+                        self.iam_manager.ensure_tenancy_iam(tenancy_id)
+                with scope_semaphores[self._scope_key(region)]:
+                    status = self.connect_peer(
+                        self.configs.regions[region].virtual_network_client,
+                        region,
+                        rpc_id,
+                        peer,
+                        peer_rpc_id,
+                        peer_region_name,
+                    )
+                span.set_tag('result', status)
+            return status, time.perf_counter() - started, None
+        except Exception as e:
+            return 'failed', time.perf_counter() - started, str(e)
+
+    def _prefetch_region(self, region):
+        with tracer.span('peering.prefetch_rpc_states', category='peering', region=region):
+            self.rpc_state.prefetch(
+                self.configs.regions[region].virtual_network_client, self.region_compartments[region]
             )
-            logger.info(f'RPC {region} to {peer_rpc_id} in region {peer_region_name} connected Successfully.')
-        except oci_sdk.exceptions.ServiceError as e:
-            if e.status == 409:  # Conflict
-                logger.info(f'IAM policy {rpc_name} already exists.')
+
+    def prefetch_rpc_states(self, regions, executor):
+        """요청 측 지역별 compartment의 RPC 목록을 병렬로 한 번씩 조회 (O(regions) list 호출)"""
+        futures = {
+            executor.submit(self._prefetch_region, region): region
+            for region in regions
+            if self.region_compartments.get(region)
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                # 스냅샷 실패 시 해당 지역은 엣지별 개별 조회로 처리
+                logger.warning('Failed to prefetch RPC states for %s: %s', futures[future], e)
+
+    def _log_summary(self, results):
+        """엣지별 피어링 결과 요약 테이블 로깅"""
+        logger.info('%s Peering Summary %s', '-' * 30, '-' * 30)
+        logger.info('%-12s%-12s%-16s%12s  error', 'requestor', 'acceptor', 'status', 'elapsed(s)')
+        for (region, peer), (status, elapsed, error) in sorted(results.items()):
+            if error:
+                logger.info('%-12s%-12s%-16s%12.1f  %s', region, peer, status, elapsed, error)
             else:
-                logger.error(f'Failed to create policy {rpc_name}: {e}')
-                raise e
+                logger.info('%-12s%-12s%-16s%12.1f', region, peer, status, elapsed)
+        failed = sum(1 for status, _, _ in results.values() if status == 'failed')
+        logger.info('%d edge(s) processed, %d failed', len(results), failed)
 
     def connect_all_peers(self):
         """
         모든 RPC 연결을 처리하는 함수.
+        독립적인 엣지는 워커 풀에서 병렬로 연결하고, 실패는 엣지별로 수집하여 마지막에 한 번에 보고한다.
         """
-        for region, peers in self.peer_map.items():
-            if len(peers) == 0:
-                continue
-            virtual_network_client = self.configs.regions[region].virtual_network_client
-            for peer in peers:
-                rpc_id = self.region_rpcs[region][peer]
-                peer_rpc_id = self.region_rpcs[peer][region]
-                peer_region_name = self.configs.regions[peer].region_name
-                self.connect_peer(
-                    virtual_network_client,
-                    region,
-                    rpc_id,
-                    peer,
-                    peer_rpc_id,
-                    peer_region_name,
-                )
+        edges = [(region, peer) for region, peers in self.peer_map.items() for peer in peers]
+        if not edges:
+            return {}
+
+        settings = self.configs.peering
+        scope_semaphores = {
+            self._scope_key(region): threading.BoundedSemaphore(max(settings.per_scope_limit, 1))
+            for region in {region for region, _ in edges}
+        }
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(min(settings.max_workers, len(edges)), 1)) as executor:
+            self.prefetch_rpc_states({region for region, _ in edges}, executor)
+            futures = {
+                executor.submit(self._connect_edge, region, peer, scope_semaphores): (region, peer)
+                for region, peer in edges
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        self._log_summary(results)
+        failed_edges = [
+            f'{region}->{peer}' for (region, peer), (status, _, _) in results.items() if status == 'failed'
+        ]
+        if failed_edges:
+            raise RuntimeError(f'Failed to connect {len(failed_edges)} peering edge(s): {", ".join(failed_edges)}')
+        return results
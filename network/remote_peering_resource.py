@@ -0,0 +1,150 @@
+import threading
+
+import pulumi
+from pulumi.dynamic import CreateResult, DiffResult, ReadResult, Resource, ResourceProvider
+
+from config import Config
+from utils.exception_handler import apply_exception_handler
+from utils.logger import get_logger
+from utils.tracing import provider_span
+
+logger = get_logger(__name__)
+
+# 엣지 식별에 사용되는 입력값 (변경 시 연결을 새로 맺어야 함)
+REPLACE_KEYS = ('profile', 'rpc_id', 'peer_rpc_id', 'peer_region_name')
+
+# refresh 시 엣지가 연결된 것으로 보는 RPC 피어링 상태 (PENDING은 연결 진행 중)
+LIVE_PEERING_STATUSES = ('PEERED', 'PENDING')
+
+# 동적 프로바이더 프로세스 안에서 scope(테넌시/리전)별 동시 연결 수를 제한
+_scope_semaphores = {}
+_scope_lock = threading.Lock()
+
+
+def _scope_semaphore(scope, limit):
+    with _scope_lock:
+        if scope not in _scope_semaphores:
+            _scope_semaphores[scope] = threading.BoundedSemaphore(max(int(limit or 1), 1))
+        return _scope_semaphores[scope]
+
+
+class RemotePeeringProvider(ResourceProvider):
+    """
+    RPC 피어링 엣지(ConnectRemotePeeringConnections)를 Pulumi 상태로 관리하는 동적 프로바이더.
+    """
+
+    def create(self, props):
+        from utils.oci_client_registry import oci_client_registry
+
+        from .remote_peering_connection import connect_remote_peering_connection
+
+        with provider_span('peering.edge', region=props['profile'], edge=props.get('edge_name')) as span:
+            virtual_network_client = oci_client_registry.virtual_network_client(props['profile'])
+            with _scope_semaphore(props.get('scope') or props['profile'], props.get('scope_limit')):
+                status = connect_remote_peering_connection(
+                    virtual_network_client,
+                    props['rpc_id'],
+                    props['peer_rpc_id'],
+                    props['peer_region_name'],
+                    wait_timeout=props.get('wait_timeout') or 300,
+                    rpc_name=props.get('edge_name'),
+                )
+            span.set_tag('result', status)
+        return CreateResult(id_=f'{props["rpc_id"]}:{props["peer_rpc_id"]}', outs={**props, 'status': status})
+
+    def diff(self, _id, olds, news):
+        replaces = [key for key in REPLACE_KEYS if olds.get(key) != news.get(key)]
+        # 대기 시간/동시성 설정 변경은 연결 자체에 영향이 없으므로 diff에서 제외
+        return DiffResult(changes=bool(replaces), replaces=replaces, delete_before_replace=True)
+
+    def read(self, id_, props):
+        """
+        refresh 시 RPC의 실제 피어링 상태를 조회하여 outs['status']에 기록.
+        RPC가 삭제되었거나 상대 RPC와의 연결이 끊어졌으면 빈 ID를 반환하여 상태에서 제거 (다음 up에서 다시 연결)
+        """
+        import oci as oci_sdk  # type: ignore
+
+        from utils.oci_client_registry import oci_client_registry
+
+        virtual_network_client = oci_client_registry.virtual_network_client(props['profile'])
+        try:
+            rpc_details = virtual_network_client.get_remote_peering_connection(props['rpc_id']).data
+        except oci_sdk.exceptions.ServiceError as e:
+            if e.status != 404:
+                raise
+            rpc_details = None
+
+        if (
+            rpc_details is None
+            or rpc_details.lifecycle_state in ('TERMINATING', 'TERMINATED')
+            or rpc_details.peer_id != props['peer_rpc_id']
+            or rpc_details.peering_status not in LIVE_PEERING_STATUSES
+        ):
+            logger.info('Peering edge %s is no longer connected, removed from state.', props.get('edge_name'))
+            return ReadResult(id_='', outs={})
+        return ReadResult(id_=id_, outs={**props, 'status': rpc_details.peering_status})
+
+    def delete(self, _id, props):
+        # RPC 간 연결은 별도의 해제 API가 없으며 RPC가 삭제될 때 함께 해제된다.
+        # 엣지는 두 RPC에 의존하므로 Pulumi가 RPC보다 먼저 이 리소스를 삭제한다.
+        logger.info('Peering edge %s removed from state.', props.get('edge_name'))
+
+
+class RemotePeering(Resource):
+    """RPC 피어링 엣지 1개를 나타내는 동적 리소스"""
+
+    status: pulumi.Output[str]
+
+    def __init__(self, name, props, opts=None):
+        super().__init__(RemotePeeringProvider(), name, {**props, 'status': None}, opts)
+
+
+@apply_exception_handler
+class RemotePeeringResourceManager:
+    """peer_map의 엣지마다 RemotePeering 리소스를 생성하는 클래스"""
+
+    def __init__(self, region_rpcs, peer_map, configs: Config, tenancy_policies=None):
+        self.region_rpcs = region_rpcs
+        self.peer_map = peer_map
+        self.configs = configs
+        # {tenancy_id: TenancyPolicies} - 엣지는 양쪽 테넌시의 IAM 정책이 준비된 후에 연결
+        self.tenancy_policies = tenancy_policies or {}
+
+    def _scope_key(self, region):
+        if self.configs.peering.limit_scope == 'region':
+            return region
+        return self.configs.regions[region].tenancy
+
+    def create_peering(self, region, peer):
+        """
+        엣지(region -> peer) 1개에 대한 RemotePeering 리소스 생성.
+        엣지는 자신의 두 RPC와 양쪽 테넌시의 IAM 정책에만 의존하므로,
+        다른 지역의 RPC/클러스터 생성을 기다리지 않고 바로 연결을 시작한다.
+        """
+        edge_name = f'{region}-{peer}'
+        tenancies = dict.fromkeys([self.configs.regions[region].tenancy, self.configs.regions[peer].tenancy])
+        iam_dependencies = [
+            self.tenancy_policies[tenancy] for tenancy in tenancies if tenancy in self.tenancy_policies
+        ]
+        return RemotePeering(
+            f'{edge_name}-peering',
+            {
+                'edge_name': edge_name,
+                'profile': region,
+                'rpc_id': self.region_rpcs[region][peer],
+                'peer_rpc_id': self.region_rpcs[peer][region],
+                'peer_region_name': self.configs.regions[peer].region_name,
+                'wait_timeout': self.configs.peering.wait_timeout,
+                'scope': self._scope_key(region),
+                'scope_limit': self.configs.peering.per_scope_limit,
+            },
+            opts=pulumi.ResourceOptions(depends_on=iam_dependencies),
+        )
+
+    def create_peering_resources(self):
+        """모든 엣지의 RemotePeering 리소스 생성"""
+        return {
+            (region, peer): self.create_peering(region, peer)
+            for region, peers in self.peer_map.items()
+            for peer in peers
+        }
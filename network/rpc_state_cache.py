@@ -0,0 +1,54 @@
+import threading
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RpcStateCache:
+    """
+    RPC 상태 스냅샷 캐시.
+
+    compartment(+DRG) 단위로 list_remote_peering_connections를 페이지네이션하여 한 번만 조회하고,
+    RPC ID로 인덱싱하여 엣지별 get_remote_peering_connection 호출을 대체한다.
+    """
+
+    def __init__(self):
+        self._rpcs = {}
+        self._loaded = set()
+        self._lock = threading.Lock()
+
+    def prefetch(self, virtual_network_client, compartment_id, drg_id=None):
+        """compartment(+DRG)의 모든 RPC를 조회하여 인덱싱 (같은 키는 한 번만 조회)"""
+        from oci.pagination import list_call_get_all_results  # type: ignore
+
+        key = (compartment_id, drg_id)
+        with self._lock:
+            if key in self._loaded:
+                return
+            self._loaded.add(key)
+
+        kwargs = {'compartment_id': compartment_id}
+        if drg_id:
+            kwargs['drg_id'] = drg_id
+        try:
+            rpcs = list_call_get_all_results(virtual_network_client.list_remote_peering_connections, **kwargs).data
+        except Exception:
+            # 실패한 키는 다시 조회할 수 있도록 제거
+            with self._lock:
+                self._loaded.discard(key)
+            raise
+
+        with self._lock:
+            for rpc in rpcs:
+                self._rpcs[rpc.id] = rpc
+        logger.info('Prefetched %d RPC(s) in compartment %s', len(rpcs), compartment_id)
+
+    def get(self, rpc_id):
+        """스냅샷에서 RPC 조회 (없으면 None)"""
+        return self._rpcs.get(rpc_id)
+
+    def update(self, rpc):
+        """개별 조회 결과로 스냅샷 갱신"""
+        with self._lock:
+            self._rpcs[rpc.id] = rpc
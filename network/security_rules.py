@@ -0,0 +1,322 @@
+import ipaddress
+from dataclasses import dataclass
+from functools import cache
+
+import pulumi_oci as oci
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 보안 리스트 1개의 방향(ingress/egress)별 최대 규칙 수 (OCI 서비스 한도)
+MAX_RULES_PER_DIRECTION = 200
+
+INGRESS = 'ingress'
+EGRESS = 'egress'
+
+# OCI 프로토콜 번호
+ALL = 'all'
+ICMP = '1'
+TCP = '6'
+UDP = '17'
+
+CIDR_BLOCK = 'CIDR_BLOCK'
+SERVICE_CIDR_BLOCK = 'SERVICE_CIDR_BLOCK'
+
+# 규칙 대상(source/destination) 이름. peers는 피어 지역마다 규칙 1개로 전개된다.
+ANYWHERE = 'anywhere'
+NODE_SUBNET = 'node_subnet'
+K8S_API_SUBNET = 'k8s_api_subnet'
+SERVICES = 'services'
+PEERS = 'peers'
+
+PATH_DISCOVERY = (3, 4)
+
+
+@dataclass(frozen=True)
+class RuleSpec:
+    """규칙 테이블의 항목 (target은 대상 이름, description의 {peer}는 피어 지역으로 치환)"""
+
+    direction: str
+    target: str
+    protocol: str
+    ports: tuple[int, int] | None = None
+    icmp: tuple[int, int | None] | None = None
+    description: str = ''
+    stateless: bool = False
+
+
+@dataclass(frozen=True)
+class SecurityRule:
+    """대상이 CIDR로 확정된 규칙. description은 중복/포함 비교에 사용하지 않는다."""
+
+    direction: str
+    cidr: str
+    cidr_type: str
+    protocol: str
+    ports: tuple[int, int] | None = None
+    icmp: tuple[int, int | None] | None = None
+    stateless: bool = False
+    description: str = ''
+
+    @property
+    def key(self):
+        return (self.direction, self.cidr, self.cidr_type, self.protocol, self.ports, self.icmp, self.stateless)
+
+    def _network(self):
+        return ipaddress.ip_network(self.cidr, strict=False) if self.cidr_type == CIDR_BLOCK else None
+
+    def sort_key(self):
+        """정렬 기준: 대상 종류, 주소(prefix가 짧은 것부터), 프로토콜, 포트/ICMP"""
+        network = self._network()
+        target = (int(network.network_address), network.prefixlen, '') if network else (0, 0, self.cidr)
+        return (
+            self.cidr_type,
+            target,
+            self.protocol != ALL,
+            self.protocol,
+            self.ports or (0, 0),
+            tuple(-1 if value is None else value for value in self.icmp or ()),
+            self.stateless,
+        )
+
+    def covers(self, other):
+        """other가 허용하는 트래픽을 이 규칙이 모두 허용하면 True (같은 방향/stateless끼리만 비교)"""
+        if (self.direction, self.cidr_type, self.stateless) != (other.direction, other.cidr_type, other.stateless):
+            return False
+        network, other_network = self._network(), other._network()
+        if network is None:
+            if self.cidr != other.cidr:
+                return False
+        elif other_network.version != network.version or not other_network.subnet_of(network):
+            return False
+
+        if self.protocol == ALL:
+            return True
+        if self.protocol != other.protocol:
+            return False
+        if self.protocol in (TCP, UDP):
+            return self.ports is None or (
+                other.ports is not None and self.ports[0] <= other.ports[0] and other.ports[1] <= self.ports[1]
+            )
+        if self.protocol == ICMP:
+            if self.icmp is None:
+                return True
+            if other.icmp is None or self.icmp[0] != other.icmp[0]:
+                return False
+            return self.icmp[1] is None or self.icmp[1] == other.icmp[1]
+        return False
+
+
+# 노드 서브넷 보안 리스트
+NODE_SECURITY_RULES = (
+    RuleSpec(INGRESS, K8S_API_SUBNET, ICMP, icmp=PATH_DISCOVERY, description='Path discovery'),
+    RuleSpec(INGRESS, ANYWHERE, TCP, ports=(22, 22), description='Inbound SSH traffic to worker nodes'),
+    RuleSpec(
+        INGRESS,
+        NODE_SUBNET,
+        ALL,
+        description='Allow pods on one worker node to communicate with pods on other worker nodes',
+    ),
+    RuleSpec(INGRESS, K8S_API_SUBNET, TCP, description='TCP access from Kubernetes Control Plane'),
+    RuleSpec(INGRESS, PEERS, ALL, description='Allow communication with peer {peer}'),
+    RuleSpec(
+        EGRESS,
+        K8S_API_SUBNET,
+        TCP,
+        ports=(12250, 12250),
+        description='Kubernetes worker to control plane communication',
+    ),
+    RuleSpec(EGRESS, ANYWHERE, ALL, description='Worker Nodes access to Internet'),
+    RuleSpec(EGRESS, K8S_API_SUBNET, TCP, ports=(6443, 6443), description='Access to Kubernetes API Endpoint'),
+    RuleSpec(EGRESS, K8S_API_SUBNET, ICMP, icmp=PATH_DISCOVERY, description='Path discovery'),
+    RuleSpec(EGRESS, ANYWHERE, ICMP, icmp=PATH_DISCOVERY, description='ICMP Access from Kubernetes Control Plane'),
+    RuleSpec(
+        EGRESS,
+        SERVICES,
+        TCP,
+        ports=(443, 443),
+        description='Allow nodes to communicate with OKE to ensure correct start-up and continued functioning',
+    ),
+    RuleSpec(
+        EGRESS,
+        NODE_SUBNET,
+        ALL,
+        description='Allow pods on one worker node to communicate with pods on other worker nodes',
+    ),
+    RuleSpec(EGRESS, PEERS, ALL, description='Worker Nodes access to peer {peer}'),
+)
+
+# Kubernetes API 엔드포인트 서브넷 보안 리스트
+K8S_API_SECURITY_RULES = (
+    RuleSpec(
+        INGRESS,
+        NODE_SUBNET,
+        TCP,
+        ports=(12250, 12250),
+        description='Kubernetes worker to control plane communication',
+    ),
+    RuleSpec(
+        INGRESS,
+        NODE_SUBNET,
+        TCP,
+        ports=(6443, 6443),
+        description='Kubernetes worker to Kubernetes API endpoint communication',
+    ),
+    RuleSpec(INGRESS, ANYWHERE, TCP, ports=(6443, 6443), description='External access to Kubernetes API endpoint'),
+    RuleSpec(INGRESS, NODE_SUBNET, ICMP, icmp=PATH_DISCOVERY, description='Path discovery'),
+    RuleSpec(EGRESS, NODE_SUBNET, ICMP, icmp=PATH_DISCOVERY, description='Path discovery'),
+    RuleSpec(
+        EGRESS,
+        SERVICES,
+        TCP,
+        ports=(443, 443),
+        description='Allow Kubernetes Control Plane to communicate with OKE',
+    ),
+    RuleSpec(EGRESS, NODE_SUBNET, TCP, description='All traffic to worker nodes'),
+)
+
+
+@dataclass
+class CompiledRules:
+    name: str
+    ingress: list
+    egress: list
+    duplicates: int = 0
+    # 더 넓은 규칙에 포함되지만 유지된 규칙 수
+    shadowed: int = 0
+
+
+class SecurityRuleCompiler:
+    """
+    규칙 테이블을 지역의 CIDR로 전개하여 보안 리스트 규칙으로 컴파일 (Args 변환은 to_args).
+
+    - 동일한 규칙만 제거 (description만 다른 규칙 포함, 테이블에서 먼저 나온 description 유지)
+    - 더 넓은 규칙(대상 CIDR/프로토콜/포트 범위를 포함)에 가려지는 규칙도 명시적으로 선언되었으므로 유지 (개수만 보고)
+    - 정렬 기준(SecurityRule.sort_key)에 따라 정렬하여 피어 순서 등이 바뀌어도 같은 결과를 만든다
+    - 방향별 규칙 수가 MAX_RULES_PER_DIRECTION을 넘으면 배포 전에 ValueError
+    """
+
+    def __init__(self, region, config, regions, peers=None):
+        self.region = region
+        self.peers = list(peers or [])
+        self.targets = {
+            ANYWHERE: ('0.0.0.0/0', CIDR_BLOCK),
+            NODE_SUBNET: (config.node_subnet_cidr_block, CIDR_BLOCK),
+            K8S_API_SUBNET: (config.k8s_api_subnet_cidr_block, CIDR_BLOCK),
+            SERVICES: (config.service_cidr, SERVICE_CIDR_BLOCK),
+        }
+        self.peer_cidrs = {peer: regions[peer].vcn_cidr_block for peer in self.peers}
+
+    def expand(self, spec):
+        """RuleSpec을 SecurityRule로 전개 (peers는 피어마다 1개)"""
+        if spec.target == PEERS:
+            targets = [(cidr, CIDR_BLOCK, peer) for peer, cidr in self.peer_cidrs.items()]
+        else:
+            targets = [(*self.targets[spec.target], None)]
+        return [
+            SecurityRule(
+                direction=spec.direction,
+                cidr=cidr,
+                cidr_type=cidr_type,
+                protocol=spec.protocol,
+                ports=spec.ports,
+                icmp=spec.icmp,
+                stateless=spec.stateless,
+                description=spec.description.format(peer=peer),
+            )
+            for cidr, cidr_type, peer in targets
+        ]
+
+    def compile(self, name, specs):
+        """규칙 테이블 1개를 컴파일 (결과 규칙은 SecurityRule 목록)"""
+        unique = {}
+        expanded = 0
+        for spec in specs:
+            for rule in self.expand(spec):
+                expanded += 1
+                unique.setdefault(rule.key, rule)
+        rules = list(unique.values())
+
+        # 넓은 규칙부터 확인하여 다른 규칙에 포함되는 규칙 수를 셈 (포함 관계는 추이적이므로 가려지지 않은 규칙과 비교)
+        broadest = []
+        shadowed = 0
+        for rule in sorted(rules, key=_breadth_key):
+            if any(broader.covers(rule) for broader in broadest):
+                shadowed += 1
+            else:
+                broadest.append(rule)
+
+        compiled = CompiledRules(
+            name=name,
+            ingress=sorted((rule for rule in rules if rule.direction == INGRESS), key=SecurityRule.sort_key),
+            egress=sorted((rule for rule in rules if rule.direction == EGRESS), key=SecurityRule.sort_key),
+            duplicates=expanded - len(rules),
+            shadowed=shadowed,
+        )
+        for direction in (INGRESS, EGRESS):
+            count = len(getattr(compiled, direction))
+            if count > MAX_RULES_PER_DIRECTION:
+                raise ValueError(
+                    f'Security list {name} in {self.region} has {count} {direction} rules '
+                    f'(limit {MAX_RULES_PER_DIRECTION} per direction)'
+                )
+        logger.debug(
+            'Security list %s-%s: %d ingress / %d egress rule(s) (%d duplicate dropped, %d covered by broader rules)',
+            self.region,
+            name,
+            len(compiled.ingress),
+            len(compiled.egress),
+            compiled.duplicates,
+            compiled.shadowed,
+        )
+        return compiled
+
+
+def _breadth_key(rule):
+    """포함 관계 확인 순서: 대상 CIDR이 넓은 것, 프로토콜/포트 제한이 없는 것부터"""
+    network = rule._network()
+    ports = rule.ports or (0, 65535)
+    return (
+        network.prefixlen if network else 0,
+        rule.protocol != ALL,
+        -(ports[1] - ports[0]),
+        rule.icmp is not None,
+        rule.icmp is not None and rule.icmp[1] is not None,
+        rule.sort_key(),
+    )
+
+
+@cache
+def to_args(rule):
+    """
+    SecurityRule을 SecurityList 규칙 Args로 변환.
+    같은 규칙(지역 간 공통 규칙 포함)은 Args 객체를 한 번만 만든다.
+    """
+    if rule.direction == INGRESS:
+        rule_args, tcp_args, udp_args, icmp_args = (
+            oci.core.SecurityListIngressSecurityRuleArgs,
+            oci.core.SecurityListIngressSecurityRuleTcpOptionsArgs,
+            oci.core.SecurityListIngressSecurityRuleUdpOptionsArgs,
+            oci.core.SecurityListIngressSecurityRuleIcmpOptionsArgs,
+        )
+        target = {'source': rule.cidr, 'source_type': rule.cidr_type}
+    else:
+        rule_args, tcp_args, udp_args, icmp_args = (
+            oci.core.SecurityListEgressSecurityRuleArgs,
+            oci.core.SecurityListEgressSecurityRuleTcpOptionsArgs,
+            oci.core.SecurityListEgressSecurityRuleUdpOptionsArgs,
+            oci.core.SecurityListEgressSecurityRuleIcmpOptionsArgs,
+        )
+        target = {'destination': rule.cidr, 'destination_type': rule.cidr_type}
+
+    options = {}
+    if rule.ports and rule.protocol == TCP:
+        options['tcp_options'] = tcp_args(min=rule.ports[0], max=rule.ports[1])
+    elif rule.ports and rule.protocol == UDP:
+        options['udp_options'] = udp_args(min=rule.ports[0], max=rule.ports[1])
+    elif rule.icmp and rule.protocol == ICMP:
+        options['icmp_options'] = icmp_args(type=rule.icmp[0], code=rule.icmp[1])
+    if rule.stateless:
+        options['stateless'] = True
+    return rule_args(description=rule.description, protocol=rule.protocol, **target, **options)
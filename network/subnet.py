@@ -1,13 +1,15 @@
-import oci as oci_sdk
 import pulumi
 import pulumi_oci as oci
 
 from config import RouteTableIDs, SecurityListIDs, SubnetIDs
 from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.logger import get_logger
 from utils.resource_helper import create_resource
+from utils.tracing import tracer
 
-logger = global_logger
+from .nlb_inventory import nlb_inventory
+
+logger = get_logger(__name__)
 
 
 @apply_exception_handler
@@ -48,34 +50,31 @@ class SubnetManager:
         return subnet_id
 
     def create_oci_client(self):
-        """OCI 클라이언트 생성"""
-        oci_config = oci_sdk.config.from_file(profile_name=self.region)
-        return oci_sdk.network_load_balancer.NetworkLoadBalancerClient(oci_config)
+        """레지스트리에서 공유 NLB 클라이언트 조회"""
+        return self.config.network_load_balancer_client
 
     def check_nlb(self, subnet_id):
-        """서브넷에 연결된 NLB 조회"""
+        """서브넷에 연결된 NLB 조회 (compartment 단위 NLB 인벤토리의 서브넷 인덱스 사용)"""
 
         # Pulumi Output 객체를 처리하기 위한 apply 사용
         def delete_nlb(compartment_id, subnet_id):
-            try:
-                nlb_client = self.create_oci_client()
+            import oci as oci_sdk  # type: ignore
 
-                # 컴파트먼트 내 모든 NLB 목록 가져오기
-                response = nlb_client.list_network_load_balancers(compartment_id=compartment_id)
-                nlb_list = response.data.items  # type: ignore # data 속성에서 NLB 리스트 가져오기
+            with tracer.span('network.check_nlb', region=self.region):
+                try:
+                    nlbs = nlb_inventory.by_subnet(self.create_oci_client(), compartment_id, subnet_id)
 
-                # 서브넷과 연결된 NLB 삭제
-                for nlb in nlb_list:
-                    if nlb.subnet_id == subnet_id:
+                    # 서브넷과 연결된 NLB 삭제
+                    for nlb in nlbs:
                         logger.info(
                             f'Before delete service-lb Subnet, have to delete NLB: {nlb.display_name}({nlb.id})'
                         )
                         # nlb_client.delete_network_load_balancer(network_load_balancer_id=nlb.id)
 
-            except oci_sdk.exceptions.ServiceError as e:
-                print(f'Service error: {e.message}')
-            except Exception as e:
-                print(f'An error occurred: {e!s}')
+                except oci_sdk.exceptions.ServiceError as e:
+                    logger.warning(f'Failed to list NLBs in {self.region}: {e.message}')
+                except Exception as e:
+                    logger.warning(f'Failed to check NLBs in {self.region}: {e!s}')
 
         # compartment_id와 subnet_ocid가 Pulumi Output 객체라면 apply를 통해 값을 전달
         pulumi.Output.all(self.compartment_id, subnet_id).apply(lambda args: delete_nlb(args[0], args[1]))
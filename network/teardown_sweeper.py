@@ -0,0 +1,379 @@
+import json
+import os
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from cluster.kubeconfig_store import kubeconfig_store
+from compartment.compartment_manager import COMPARTMENT_NAME_FORMAT
+from utils.logger import get_logger
+from utils.oci_client_registry import oci_client_registry
+from utils.tracing import tracer
+from utils.waiter import wait_until
+
+from .nlb_inventory import nlb_inventory
+
+logger = get_logger(__name__)
+
+# 서브넷 삭제를 막는 리소스 종류 (VNIC은 NLB/LB 삭제 후 남은 것만 확인)
+BLOCKER_KINDS = ('nlb', 'lb', 'vnic')
+
+# 이미 삭제되어 서브넷 삭제를 막지 않는 상태
+_GONE_STATES = ('DELETED', 'DETACHED', 'TERMINATED')
+
+NOT_FOUND_STATUS = 404
+
+# 아직 삭제되지 않아 CCM(cloud-controller-manager)이 서비스 NLB/LB를 관리하고 있을 수 있는 클러스터 상태
+LIVE_CLUSTER_STATES = ['CREATING', 'ACTIVE', 'UPDATING']
+
+# OKE가 클러스터 리소스(CCM이 만든 NLB/LB 포함)에 붙이는 시스템 태그 네임스페이스
+OKE_SYSTEM_TAG_NAMESPACE = 'orcl-containerengine'
+
+# CCM은 서비스 UID를 NLB/LB 이름으로 사용 (load-balancer-name-prefix 어노테이션의 접두사 허용)
+_CCM_NAME_PATTERN = re.compile(r'(^|.*-)[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+
+KUBECTL_TIMEOUT = 600
+
+
+@dataclass
+class SubnetBlocker:
+    """서브넷 삭제를 막는 리소스 1개"""
+
+    region: str
+    kind: str
+    resource_id: str
+    name: str
+    subnet_id: str
+    # VNIC: 분리할 attachment ID (인스턴스의 주 VNIC처럼 분리할 수 없으면 None)
+    attachment_id: str | None = None
+    # 제거하지 않는 이유 (CCM이 만들지 않은 NLB/LB, 분리할 수 없는 VNIC 등)
+    skip_reason: str | None = None
+
+
+@dataclass
+class SweepResult:
+    blocker: SubnetBlocker
+    # 'deleted', 'detached', 'planned'(dry run), 'skipped', 'failed'
+    status: str
+    elapsed: float = 0.0
+    error: str | None = None
+
+
+def _get_or_none(get_func, resource_id):
+    """get_* 결과 (삭제되어 404이면 None)"""
+    import oci as oci_sdk  # type: ignore
+
+    try:
+        return get_func(resource_id).data
+    except oci_sdk.exceptions.ServiceError as e:
+        if e.status == NOT_FOUND_STATUS:
+            return None
+        raise
+
+
+def is_ccm_created(load_balancer):
+    """OKE 클러스터의 CCM이 서비스(type: LoadBalancer)용으로 만든 NLB/LB인지 (시스템 태그 또는 이름으로 판단)"""
+    if OKE_SYSTEM_TAG_NAMESPACE in (getattr(load_balancer, 'system_tags', None) or {}):
+        return True
+    return bool(_CCM_NAME_PATTERN.match(load_balancer.display_name or ''))
+
+
+class TeardownSweeper:
+    """
+    destroy 전에 선택된 지역의 모든 서브넷에서 삭제를 막는 리소스(NLB, LB, 남은 VNIC)를 찾아 병렬로 제거.
+
+    Kubernetes가 만든 서비스 NLB/LB는 Pulumi 상태에 없으므로 서브넷 삭제가 OCI API 타임아웃까지 멈춘다.
+    지역별 탐색과 리소스별 삭제/대기를 하나의 스레드 풀(max_workers)에서 수행하여
+    지역 순서대로 기다리지 않고 한 번에 정리한다.
+
+    1. 지역 구획에 삭제되지 않은 클러스터가 있으면 kubeconfig(oke-<region> 컨텍스트)로 LoadBalancer 서비스를
+       먼저 삭제하여 CCM이 NLB/LB를 정리하게 함 (CCM이 다시 만들거나 삭제 중인 리소스와 충돌하지 않도록)
+    2. 지역별로 구획(oke-<region>)의 서브넷에서 CCM이 만든 NLB/LB만 찾아 삭제 후 DELETED가 될 때까지 대기
+       (사용자가 만든 NLB/LB는 삭제하지 않고 skipped로 보고)
+    3. NLB/LB의 VNIC이 사라진 뒤 서브넷에 남은 VNIC 중 분리 가능한(보조) VNIC을 분리 후 대기
+       (인스턴스의 주 VNIC은 노드 풀과 함께 Pulumi가 삭제하므로 건너뜀. 클러스터가 남아 있는 지역은 분리하지 않음)
+    """
+
+    def __init__(self, regions, max_workers=8, wait_timeout=1200, kinds=BLOCKER_KINDS, dry_run=False):
+        self.regions = list(regions)
+        self.max_workers = max(max_workers, 1)
+        self.wait_timeout = wait_timeout
+        self.kinds = tuple(kinds)
+        self.dry_run = dry_run
+        # 클러스터가 남아 있는 지역 (_find_lb_blockers에서 확인)
+        self._live_cluster_regions = set()
+
+    def sweep(self):
+        """
+        모든 지역의 서브넷 차단 리소스를 제거.
+
+        Returns:
+            list[SweepResult]: 리소스별 처리 결과 (탐색 실패한 지역은 kind='region'인 failed 결과)
+        """
+        results = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            subnets, failures = self._discover_subnets(executor)
+            results += failures
+
+            blockers, failures = self._find_all(executor, subnets, self._find_lb_blockers)
+            results += failures + self._remove_all(executor, blockers)
+            # 삭제된 NLB가 다른 확인에서 보이지 않도록 인벤토리 스냅샷 제거
+            nlb_inventory.invalidate()
+
+            if 'vnic' in self.kinds:
+                blockers, failures = self._find_all(executor, subnets, self._find_vnic_blockers)
+                results += failures + self._remove_all(executor, blockers)
+        return results
+
+    def _find_all(self, executor, subnets, finder):
+        """지역별 finder(region, region_subnets)를 병렬 실행. 실패한 지역은 failed 결과로 반환"""
+
+        def find(region):
+            try:
+                with tracer.span(f'sweep.{finder.__name__.strip("_")}', category='sweep', region=region):
+                    return finder(region, subnets[region]), None
+            except Exception as e:
+                logger.error(f'Failed to find subnet blockers in {region}: {e}')
+                return [], SweepResult(SubnetBlocker(region, 'region', '-', region, '-'), 'failed', error=str(e))
+
+        blockers, failures = [], []
+        for region_blockers, failure in executor.map(find, subnets):
+            blockers += region_blockers
+            if failure is not None:
+                failures.append(failure)
+        return blockers, failures
+
+    def _discover_subnets(self, executor):
+        """지역별 (compartment_id, {subnet_id: subnet}) 병렬 조회"""
+
+        def discover(region):
+            try:
+                with tracer.span('sweep.discover', category='sweep', region=region):
+                    return region, self._region_subnets(region), None
+            except Exception as e:
+                logger.error(f'Failed to discover subnets in {region}: {e}')
+                return region, None, e
+
+        subnets, failures = {}, []
+        for region, region_subnets, error in executor.map(discover, self.regions):
+            if error is not None:
+                blocker = SubnetBlocker(region, 'region', '-', region, '-')
+                failures.append(SweepResult(blocker, 'failed', error=str(error)))
+            elif region_subnets is not None:
+                subnets[region] = region_subnets
+        return subnets, failures
+
+    def _region_subnets(self, region):
+        """지역 구획과 서브넷 (구획이 없으면 None)"""
+        from oci.pagination import list_call_get_all_results  # type: ignore
+
+        tenancy = oci_client_registry.get_config(region)['tenancy']
+        compartments = list_call_get_all_results(
+            oci_client_registry.identity_client(region).list_compartments,
+            compartment_id=tenancy,
+            name=COMPARTMENT_NAME_FORMAT.format(region=region),
+            lifecycle_state='ACTIVE',
+        ).data
+        if not compartments:
+            logger.info(f'No compartment for {region}, nothing to sweep')
+            return None
+
+        compartment_id = compartments[0].id
+        subnets = list_call_get_all_results(
+            oci_client_registry.virtual_network_client(region).list_subnets, compartment_id=compartment_id
+        ).data
+        return compartment_id, {subnet.id: subnet for subnet in subnets if subnet.lifecycle_state not in _GONE_STATES}
+
+    def _find_lb_blockers(self, region, region_subnets):
+        """서브넷에 연결된 NLB/LB"""
+        from oci.pagination import list_call_get_all_results_generator  # type: ignore
+
+        compartment_id, subnets = region_subnets
+        clusters = self._live_clusters(region, compartment_id)
+        if clusters:
+            self._live_cluster_regions.add(region)
+            if 'nlb' in self.kinds or 'lb' in self.kinds:
+                self._delete_lb_services(region, clusters)
+                nlb_inventory.invalidate(compartment_id)
+
+        def blocker(kind, load_balancer, subnet_id):
+            skip_reason = None if is_ccm_created(load_balancer) else 'not created by OKE, delete it manually'
+            return SubnetBlocker(
+                region, kind, load_balancer.id, load_balancer.display_name, subnet_id, skip_reason=skip_reason
+            )
+
+        blockers = []
+        if 'nlb' in self.kinds:
+            nlb_client = oci_client_registry.network_load_balancer_client(region)
+            for nlb in nlb_inventory.in_compartment(nlb_client, compartment_id):
+                if nlb.subnet_id in subnets:
+                    blockers.append(blocker('nlb', nlb, nlb.subnet_id))
+        if 'lb' in self.kinds:
+            lb_client = oci_client_registry.load_balancer_client(region)
+            for lb in list_call_get_all_results_generator(
+                lb_client.list_load_balancers, 'record', compartment_id=compartment_id
+            ):
+                subnet_id = next((subnet_id for subnet_id in lb.subnet_ids or [] if subnet_id in subnets), None)
+                if subnet_id and lb.lifecycle_state not in _GONE_STATES:
+                    blockers.append(blocker('lb', lb, subnet_id))
+        return blockers
+
+    def _live_clusters(self, region, compartment_id):
+        """구획에서 삭제되지 않은 OKE 클러스터 목록"""
+        from oci.pagination import list_call_get_all_results  # type: ignore
+
+        return list_call_get_all_results(
+            oci_client_registry.container_engine_client(region).list_clusters,
+            compartment_id=compartment_id,
+            lifecycle_state=LIVE_CLUSTER_STATES,
+        ).data
+
+    def _kubectl(self, region, *args):
+        """지역 클러스터에 kubectl 실행 (병합 kubeconfig의 oke-<region> 컨텍스트, 없으면 지역별 kubeconfig)"""
+        if kubeconfig_store.merged_path and os.path.exists(kubeconfig_store.merged_path):
+            target = ['--kubeconfig', kubeconfig_store.merged_path, '--context', kubeconfig_store.context_name(region)]
+        elif os.path.exists(kubeconfig_store.region_path(region)):
+            target = ['--kubeconfig', kubeconfig_store.region_path(region)]
+        else:
+            raise RuntimeError(f'No kubeconfig for {region} in {kubeconfig_store.directory}')
+        try:
+            completed = subprocess.run(
+                ['kubectl', *target, *args], capture_output=True, text=True, timeout=KUBECTL_TIMEOUT + 60
+            )
+        except FileNotFoundError as e:
+            raise RuntimeError('kubectl is not installed') from e
+        if completed.returncode != 0:
+            raise RuntimeError(f'kubectl {args[0]} failed: {completed.stderr.strip()}')
+        return completed.stdout
+
+    def _delete_lb_services(self, region, clusters):
+        """
+        클러스터가 남아 있는 지역의 LoadBalancer 서비스를 삭제하고 CCM이 NLB/LB를 지울 때까지 대기.
+        서비스를 삭제할 수 없으면 CCM과 충돌하지 않도록 해당 지역의 NLB/LB를 제거하지 않는다.
+        """
+        names = ', '.join(cluster.name for cluster in clusters)
+        try:
+            listed = json.loads(self._kubectl(region, 'get', 'services', '--all-namespaces', '-o', 'json'))
+            services = [
+                service['metadata']
+                for service in listed['items']
+                if service.get('spec', {}).get('type') == 'LoadBalancer'
+            ]
+            if not services:
+                return
+            if self.dry_run:
+                logger.info(f'Would delete {len(services)} LoadBalancer service(s) of cluster {names} in {region}')
+                return
+            for namespace in sorted({service['namespace'] for service in services}):
+                service_names = [service['name'] for service in services if service['namespace'] == namespace]
+                with tracer.span('sweep.delete_services', category='sweep', region=region):
+                    # 서비스 finalizer는 CCM이 NLB/LB를 삭제한 뒤 제거되므로 kubectl delete가 그때까지 대기
+                    self._kubectl(
+                        region, 'delete', 'service', '-n', namespace, *service_names, f'--timeout={KUBECTL_TIMEOUT}s'
+                    )
+            logger.info(f'Deleted {len(services)} LoadBalancer service(s) of cluster {names} in {region}')
+        except Exception as e:
+            raise RuntimeError(
+                f'Cluster {names} in {region} is still running and its LoadBalancer services could not be deleted '
+                f'({e}); delete them or destroy the cluster first'
+            ) from e
+
+    def _find_vnic_blockers(self, region, region_subnets):
+        """서브넷에 남은 VNIC (private IP로 찾고, 인스턴스에 연결된 보조 VNIC만 분리 대상)"""
+        from oci.pagination import list_call_get_all_results  # type: ignore
+
+        compartment_id, subnets = region_subnets
+        virtual_network_client = oci_client_registry.virtual_network_client(region)
+        vnic_subnets = {}
+        for subnet_id in subnets:
+            for private_ip in list_call_get_all_results(
+                virtual_network_client.list_private_ips, subnet_id=subnet_id
+            ).data:
+                vnic_subnets.setdefault(private_ip.vnic_id, subnet_id)
+        if not vnic_subnets:
+            return []
+
+        attachments = {
+            attachment.vnic_id: attachment
+            for attachment in list_call_get_all_results(
+                oci_client_registry.compute_client(region).list_vnic_attachments, compartment_id=compartment_id
+            ).data
+            if attachment.vnic_id in vnic_subnets and attachment.lifecycle_state == 'ATTACHED'
+        }
+        blockers = []
+        for vnic_id, subnet_id in vnic_subnets.items():
+            attachment = attachments.get(vnic_id)
+            vnic = _get_or_none(virtual_network_client.get_vnic, vnic_id)
+            if vnic is None:
+                continue
+            # 인스턴스의 주 VNIC과 서비스 VNIC(attachment 없음)은 분리할 수 없음
+            attachment_id = attachment.id if attachment and not vnic.is_primary else None
+            if region in self._live_cluster_regions:
+                skip_reason = 'cluster still running'
+            elif attachment_id is None:
+                skip_reason = 'primary or service VNIC cannot be detached'
+            else:
+                skip_reason = None
+            blockers.append(
+                SubnetBlocker(region, 'vnic', vnic_id, vnic.display_name, subnet_id, attachment_id, skip_reason)
+            )
+        return blockers
+
+    def _remove_all(self, executor, blockers):
+        return list(executor.map(self._remove, blockers))
+
+    def _remove(self, blocker):
+        """리소스 1개를 삭제(분리)하고 사라질 때까지 대기"""
+        if blocker.skip_reason:
+            logger.info(
+                f'{blocker.kind.upper()} {blocker.name}({blocker.resource_id}) in {blocker.region} skipped: '
+                f'{blocker.skip_reason}'
+            )
+            return SweepResult(blocker, 'skipped', error=blocker.skip_reason)
+        if self.dry_run:
+            return SweepResult(blocker, 'planned')
+
+        started = time.perf_counter()
+        try:
+            with tracer.span('sweep.remove', category='sweep', region=blocker.region, kind=blocker.kind):
+                status = self._remove_blocker(blocker)
+            logger.info(f'{blocker.kind.upper()} {blocker.name}({blocker.resource_id}) in {blocker.region} {status}')
+            return SweepResult(blocker, status, time.perf_counter() - started)
+        except Exception as e:
+            logger.error(f'Failed to remove {blocker.kind} {blocker.name}({blocker.resource_id}): {e}')
+            return SweepResult(blocker, 'failed', time.perf_counter() - started, str(e))
+
+    def _remove_blocker(self, blocker):
+        import oci as oci_sdk  # type: ignore
+
+        region = blocker.region
+        if blocker.kind == 'nlb':
+            client = oci_client_registry.network_load_balancer_client(region)
+            delete, get, resource_id = (
+                client.delete_network_load_balancer,
+                client.get_network_load_balancer,
+                blocker.resource_id,
+            )
+        elif blocker.kind == 'lb':
+            client = oci_client_registry.load_balancer_client(region)
+            delete, get, resource_id = client.delete_load_balancer, client.get_load_balancer, blocker.resource_id
+        else:
+            client = oci_client_registry.compute_client(region)
+            delete, get, resource_id = client.detach_vnic, client.get_vnic_attachment, blocker.attachment_id
+
+        try:
+            delete(resource_id)
+        except oci_sdk.exceptions.ServiceError as e:
+            if e.status != NOT_FOUND_STATUS:
+                raise
+        wait_until(
+            lambda: _get_or_none(get, resource_id),
+            lambda details: details is None or details.lifecycle_state in _GONE_STATES,
+            is_failed=lambda details: details.lifecycle_state == 'FAILED',
+            timeout=self.wait_timeout,
+            initial_delay=5,
+            description=f'{blocker.kind.upper()} {blocker.name}',
+        )
+        return 'detached' if blocker.kind == 'vnic' else 'deleted'
@@ -0,0 +1,158 @@
+"""
+__main__ 모듈의 import 시간을 `python -X importtime`으로 측정하는 벤치마크 스크립트.
+
+import만으로는 실행 중 지연 import가 되살아난 경우를 잡을 수 없으므로, 기본적으로 import 후
+Pulumi mocks 환경에서 ConfigManager까지 생성하여 (실제 프로파일 로드 경로 포함) 무거운 모듈이 로드되는지 확인한다.
+
+사용 예시:
+    python scripts/bench_import_time.py
+    python scripts/bench_import_time.py --import-only
+    python scripts/bench_import_time.py --repeat 5 --output import_time.json --max-ms 800
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# __main__.py를 실행하지 않고 import만 수행 (run_name이 '__main__'이 아니므로 main()은 호출되지 않음)
+IMPORT_MAIN = "import runpy; runpy.run_path('__main__.py', run_name='__bench__')"
+
+# import 후 ConfigManager 생성까지 수행: config.json의 지역마다 프로파일을 가진 임시 OCI config로
+# 실제 프로파일 로드 경로(oci_client_registry.get_config)를 실행하고, Pulumi secret만 대체한다.
+CONSTRUCT_CONFIG_MANAGER = """
+import os, runpy, sys, tempfile
+import pulumi
+
+class Mocks(pulumi.runtime.Mocks):
+    def new_resource(self, args):
+        return [f'{args.name}_id', args.inputs]
+
+    def call(self, args):
+        return {}
+
+pulumi.runtime.set_mocks(Mocks(), project='oci-infrastructure', stack='bench', preview=True)
+main_globals = runpy.run_path('__main__.py', run_name='__bench__')
+
+from utils.oci_client_registry import oci_client_registry
+import json
+
+config_path = sys.argv[1]
+with open(config_path) as config_file:
+    regions = list(json.load(config_file).get('regions', {}))
+directory = tempfile.mkdtemp()
+key_file = os.path.join(directory, 'key.pem')
+open(key_file, 'w').close()
+with open(os.path.join(directory, 'config'), 'w') as oci_config:
+    for region in regions:
+        oci_config.write(
+            f'[{region}]\\nuser=ocid1.user.oc1..bench\\n'
+            'fingerprint=00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00\\n'
+            f'tenancy=ocid1.tenancy.oc1..bench\\nregion=bench-{region}-1\\nkey_file={key_file}\\n'
+        )
+oci_client_registry.config_file = os.path.join(directory, 'config')
+
+class BenchConfigManager(main_globals['ConfigManager']):
+    def _get_pulumi_config_value(self, key, is_secret=False):
+        return 'ssh-ed25519 AAAABENCH'
+
+BenchConfigManager(config_path=config_path)
+"""
+
+# 지연 로드되어야 하는 무거운 모듈 목록
+WATCHED_MODULES = ('oci', 'cryptography')
+
+
+def default_config_path():
+    """ConfigManager 생성에 사용할 config.json (없으면 config.json.example)"""
+    config_path = os.path.join(PROJECT_ROOT, 'config.json')
+    return config_path if os.path.exists(config_path) else os.path.join(PROJECT_ROOT, 'config.json.example')
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 파싱: {모듈명: (self_us, cumulative_us, depth)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        # 모듈명 앞의 공백 2칸이 중첩 깊이 1단계 (최상위는 공백 1칸)
+        name = name[1:].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def measure_once(python, config_path=None):
+    """import 시간 1회 측정 (config_path가 있으면 ConfigManager 생성까지 포함)"""
+    command = ['-c', IMPORT_MAIN] if config_path is None else ['-c', CONSTRUCT_CONFIG_MANAGER, config_path]
+    started = time.perf_counter()
+    result = subprocess.run(
+        [python, '-X', 'importtime', *command],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f'Import of __main__ failed:\n{result.stderr[-2000:]}')
+    # ConfigManager 생성 로그 등 importtime 이외의 출력은 파싱하지 않음
+
+    modules = parse_importtime(result.stderr)
+    # 최상위(depth 0) 모듈의 cumulative 합계가 전체 import 시간
+    total_us = sum(cumulative for _, cumulative, depth in modules.values() if depth == 0)
+    return {'wall_ms': wall_ms, 'import_ms': total_us / 1000, 'modules': modules}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure import time of __main__ with python -X importtime')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 횟수 (최솟값 기준으로 기록)')
+    parser.add_argument('--top', type=int, default=15, help='출력할 상위 모듈 수')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--max-ms', type=float, help='import 시간이 이 값을 넘으면 종료 코드 1 반환')
+    parser.add_argument('--python', default=sys.executable, help='측정에 사용할 python 실행 파일')
+    parser.add_argument('--import-only', action='store_true', help='ConfigManager를 생성하지 않고 import만 측정')
+    parser.add_argument('--config', default=default_config_path(), help='ConfigManager 생성에 사용할 config.json')
+    args = parser.parse_args()
+
+    config_path = None if args.import_only else os.path.abspath(args.config)
+    runs = [measure_once(args.python, config_path) for _ in range(max(args.repeat, 1))]
+    best = min(runs, key=lambda run: run['import_ms'])
+    top_modules = sorted(best['modules'].items(), key=lambda item: -item[1][1])[: args.top]
+
+    print(f'{"module":<40}{"cumulative(ms)":>16}{"self(ms)":>12}')
+    for name, (self_us, cumulative_us, _) in top_modules:
+        print(f'{name:<40}{cumulative_us / 1000:>16.1f}{self_us / 1000:>12.1f}')
+    print('-' * 68)
+    loaded = [name for name in WATCHED_MODULES if name in best['modules']]
+    print(f'import total: {best["import_ms"]:.1f} ms (min of {len(runs)}), process wall: {best["wall_ms"]:.1f} ms')
+    stage = 'import' if config_path is None else 'import + ConfigManager'
+    print(f'heavy modules loaded at {stage}: {", ".join(loaded) if loaded else "none"}')
+
+    result = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'config_manager': config_path is not None,
+        'import_ms': round(best['import_ms'], 1),
+        'import_ms_runs': [round(run['import_ms'], 1) for run in runs],
+        'wall_ms': round(best['wall_ms'], 1),
+        'heavy_modules_loaded': loaded,
+        'top_modules': {name: round(cumulative_us / 1000, 1) for name, (_, cumulative_us, _) in top_modules},
+    }
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(result, output_file, indent=2)
+        print(f'Result saved to: {args.output}')
+
+    if args.max_ms is not None and best['import_ms'] > args.max_ms:
+        print(f'Import time {best["import_ms"]:.1f} ms exceeds limit {args.max_ms:.1f} ms')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
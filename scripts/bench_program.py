@@ -0,0 +1,156 @@
+"""
+지역 수와 피어링 형태별로 __main__.main()의 리소스 그래프 구성 비용을 측정하는 벤치마크.
+
+Pulumi mocks(program_mocks)로 실제 OCI API/Pulumi 엔진 없이 실행하며,
+시나리오마다 별도 프로세스에서 wall time, peak RSS, 리소스 수, Output 콜백 수를 측정해 JSON으로 저장한다
+(기본 위치는 임시 디렉터리의 bench_program.json, --output으로 변경).
+
+피어링 형태:
+    mesh     모든 지역 쌍을 피어링 (엣지 n(n-1)/2)
+    partial  각 지역이 다음 PARTIAL_PEERS개 지역과 피어링 (엣지 약 n * PARTIAL_PEERS)
+    none     피어링 없음
+
+사용 예시:
+    python scripts/bench_program.py
+    python scripts/bench_program.py --mesh-limit 100
+    python scripts/bench_program.py --sizes 5 25 --shapes partial none --output before.json
+    python scripts/bench_program.py --baseline before.json --output after.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+
+from program_mocks import PROJECT_ROOT, run_isolated, synthetic_config
+
+SHAPES = ('mesh', 'partial', 'none')
+DEFAULT_SIZES = [5, 25, 100, 250]
+
+# partial 형태에서 지역마다 피어링할 다음 지역 수
+PARTIAL_PEERS = 2
+
+# 엣지가 O(n²)인 mesh는 이 지역 수까지만 실행 (--mesh-limit으로 조정, 25개 지역이면 엣지 300개)
+DEFAULT_MESH_LIMIT = 25
+
+# 작업 트리에 결과 파일이 남지 않도록 기본 저장 위치는 임시 디렉터리
+DEFAULT_OUTPUT = os.path.join(tempfile.gettempdir(), 'bench_program.json')
+
+METRIC_COLUMNS = ['resource_count', 'output_callbacks', 'wall_seconds', 'peak_rss_mb']
+
+
+def peer_map_for(shape, regions):
+    """피어링 형태에 맞는 peer_map (각 엣지는 앞쪽 지역에 한 번만 기록)"""
+    if shape == 'mesh':
+        return {region: regions[index + 1 :] for index, region in enumerate(regions[:-1])}
+    if shape == 'partial':
+        peer_map = {}
+        for index, region in enumerate(regions):
+            peers = {regions[(index + offset) % len(regions)] for offset in range(1, PARTIAL_PEERS + 1)}
+            # 지역 수가 적으면 같은 엣지가 양쪽에 기록되지 않도록 이미 기록된 엣지는 제외
+            peers = [peer for peer in peers if peer != region and region not in peer_map.get(peer, [])]
+            if peers:
+                peer_map[region] = sorted(peers)
+        return peer_map
+    return {}
+
+
+def git_revision():
+    """측정한 코드의 커밋 (결과 비교용)"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(region_count, shape, timeout):
+    regions = [f'r{index:03d}' for index in range(region_count)]
+    peer_map = peer_map_for(shape, regions)
+    metrics = {
+        'regions': region_count,
+        'shape': shape,
+        'edges': sum(len(peers) for peers in peer_map.values()),
+        'status': 'ok',
+    }
+    try:
+        metrics.update(run_isolated(synthetic_config(region_count, peer_map=peer_map), timeout=timeout))
+    except subprocess.TimeoutExpired:
+        metrics['status'] = 'timeout'
+    except RuntimeError as e:
+        metrics.update(status='failed', error=str(e).strip().splitlines()[-1])
+    return metrics
+
+
+def compare(results, baseline_path):
+    """기준 결과 파일과 같은 시나리오의 metric 변화율"""
+    with open(baseline_path) as baseline_file:
+        baseline = {
+            (metrics['regions'], metrics['shape']): metrics
+            for metrics in json.load(baseline_file)['results']
+            if metrics.get('status') == 'ok'
+        }
+    print(f'{"-" * 30} Compared to {baseline_path} {"-" * 30}')
+    print(f'{"regions":>8}{"shape":>10}' + ''.join(f'{column:>20}' for column in METRIC_COLUMNS))
+    for metrics in results:
+        before = baseline.get((metrics['regions'], metrics['shape']))
+        if not before or metrics['status'] != 'ok':
+            continue
+        changes = []
+        for column in METRIC_COLUMNS:
+            ratio = metrics[column] / before[column] if before[column] else None
+            changes.append(f'{ratio:.2f}x' if ratio is not None else '-')
+        print(f'{metrics["regions"]:>8}{metrics["shape"]:>10}' + ''.join(f'{change:>20}' for change in changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure program construction cost by region count and peering shape')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='측정할 지역 수')
+    parser.add_argument('--shapes', nargs='+', default=list(SHAPES), choices=SHAPES)
+    parser.add_argument(
+        '--mesh-limit', type=int, default=DEFAULT_MESH_LIMIT, help='mesh 형태를 실행할 최대 지역 수 (0이면 제한 없음)'
+    )
+    parser.add_argument('--timeout', type=int, default=1800, help='시나리오별 최대 실행 시간(초)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일 경로')
+    args = parser.parse_args()
+
+    results = []
+    for region_count in args.sizes:
+        for shape in args.shapes:
+            if shape == 'mesh' and args.mesh_limit and region_count > args.mesh_limit:
+                results.append({'regions': region_count, 'shape': shape, 'status': 'skipped'})
+                continue
+            metrics = run_scenario(region_count, shape, args.timeout)
+            results.append(metrics)
+            print(
+                f'regions={region_count} shape={shape} status={metrics["status"]} '
+                f'resources={metrics.get("resource_count")} wall={metrics.get("wall_seconds")}s',
+                flush=True,
+            )
+
+    columns = ['regions', 'shape', 'edges', 'status', *METRIC_COLUMNS]
+    print(''.join(f'{column:>18}' for column in columns))
+    for metrics in results:
+        print(''.join(f'{metrics.get(column, "-")!s:>18}' for column in columns))
+
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'results': results,
+    }
+    with open(args.output, 'w') as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f'Result saved to: {args.output}')
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+피어링 토폴로지(mesh / hub_spoke / ring)별 리소스 수와 프로그램 구성(preview) 시간을 비교하는 벤치마크.
+
+사용 예시:
+    python scripts/bench_topology.py
+    python scripts/bench_topology.py --sizes 5 20 --modes mesh ring --output topology.json
+    python scripts/bench_topology.py --plan-only   # mocks 실행 없이 계획상 리소스 수만 비교
+"""
+
+import argparse
+import json
+import time
+from types import SimpleNamespace
+
+from program_mocks import run_isolated, synthetic_config
+
+from config import IamConfig
+from config.topology_planner import TOPOLOGY_MODES, TopologyPlanner
+from iam import IamManager
+
+# 지역별 피어 1개당 추가되는 규칙 수 (RouteTableManager / SecurityListManager 기준)
+ROUTE_RULES_PER_PEER = 1
+SECURITY_RULES_PER_PEER = 1  # 노드 ingress (egress는 0.0.0.0/0 전체 허용 규칙에 포함되어 제거됨)
+
+
+def topology_for(mode, regions):
+    if mode == 'hub_spoke':
+        return {'mode': mode, 'hub': regions[0]}
+    return {'mode': mode}
+
+
+def plan_metrics(mode, region_count):
+    """토폴로지 계획 기준 리소스 수"""
+    config_data = synthetic_config(region_count)
+    regions = list(config_data['regions'])
+    started = time.perf_counter()
+    plan = TopologyPlanner(regions, topology_for(mode, regions)).plan()
+    plan_ms = (time.perf_counter() - started) * 1000
+    peer_links = sum(len(peers) for peers in plan.peer_bi_map.values())
+    # 가상 지역은 지역마다 별도 테넌시를 사용 (program_mocks.StubConfigManager와 동일)
+    iam_configs = SimpleNamespace(
+        regions={
+            region: SimpleNamespace(tenancy=f'ocid1.tenancy.oc1..{region}', admin_group_id=data['admin_group_id'])
+            for region, data in config_data['regions'].items()
+        },
+        peer_map=plan.peer_map,
+        peer_bi_map=plan.peer_bi_map,
+        iam=IamConfig(),
+    )
+    iam_policies = sum(len(specs) for specs in IamManager(iam_configs).tenancy_policy_specs().values())
+    return {
+        'edges': plan.edge_count,
+        'rpcs': plan.rpc_count,
+        'drgs': plan.drg_count,
+        'peer_route_rules': peer_links * ROUTE_RULES_PER_PEER,
+        'peer_security_rules': peer_links * SECURITY_RULES_PER_PEER,
+        'iam_policies': iam_policies,
+        'plan_ms': round(plan_ms, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare peering topologies by resource count and preview time')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5, 20, 50], help='비교할 지역 수')
+    parser.add_argument('--modes', nargs='+', default=list(TOPOLOGY_MODES), choices=TOPOLOGY_MODES)
+    parser.add_argument('--plan-only', action='store_true', help='mocks로 프로그램을 구성하지 않고 계획만 비교')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    results = []
+    for region_count in args.sizes:
+        for mode in args.modes:
+            metrics = {'regions': region_count, 'mode': mode, **plan_metrics(mode, region_count)}
+            if not args.plan_only:
+                regions = [f'r{index:03d}' for index in range(region_count)]
+                construct = run_isolated(synthetic_config(region_count, topology=topology_for(mode, regions)))
+                metrics.update(
+                    preview_seconds=construct['wall_seconds'],
+                    peak_rss_mb=construct['peak_rss_mb'],
+                    resource_count=construct['resource_count'],
+                )
+            results.append(metrics)
+
+    columns = ['regions', 'mode', 'edges', 'rpcs', 'peer_route_rules', 'peer_security_rules', 'iam_policies']
+    if not args.plan_only:
+        columns += ['resource_count', 'preview_seconds', 'peak_rss_mb']
+    print(''.join(f'{column:>20}' for column in columns))
+    for metrics in results:
+        print(''.join(f'{metrics[column]!s:>20}' for column in columns))
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+        print(f'Result saved to: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Pulumi mocks 환경에서 __main__.main()을 실행하여 리소스 그래프 구성 비용을 측정하는 공용 모듈.
+
+실제 OCI API/Pulumi 엔진 없이 동작하며, 각 시나리오는 깨끗한 측정을 위해 별도 프로세스에서 실행한다.
+
+단독 실행:
+    python scripts/program_mocks.py <config.json>   # 결과 metrics를 JSON으로 stdout에 출력
+"""
+
+import collections
+import json
+import os
+import resource
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+PROJECT_NAME = 'oci-infrastructure'
+STACK_NAME = 'bench'
+
+
+def synthetic_region_data(index):
+    """index번째 가상 지역의 config.json region 항목 (지역마다 겹치지 않는 /16 대역 사용)"""
+    octet = index % 250
+    return {
+        'availability_domain': f'BENCH:REGION-{index}-AD-1',
+        'service_cidr': f'all-r{index}-services-in-oracle-services-network',
+        'service_id': f'ocid1.service.oc1.r{index}.bench',
+        'image_id': f'ocid1.image.oc1.r{index}.bench',
+        'vcn_cidr_block': f'10.{octet}.0.0/16',
+        'node_subnet_cidr_block': f'10.{octet}.10.0/24',
+        'k8s_api_subnet_cidr_block': f'10.{octet}.20.0/24',
+        'service_lb_subnet_cidr_block': f'10.{octet}.30.0/24',
+        'admin_group_id': f'ocid1.group.oc1..r{index}',
+    }
+
+
+def synthetic_config(region_count, peer_map=None, topology=None):
+    """가상 지역 region_count개로 구성된 config.json 데이터 생성"""
+    regions = {f'r{index:03d}': synthetic_region_data(index) for index in range(region_count)}
+    config_data = {
+        'peer_map': peer_map or {},
+        'home_region': next(iter(regions), ''),
+        'node': {
+            'kubernetes_version': 'v1.32.1',
+            'node_pool_name': 'pool1',
+            'node_pool_size': 2,
+            'node_shape': 'VM.Standard.A1.Flex',
+            'node_memory_gbs': 12,
+            'node_ocpus': 2,
+        },
+        'regions': regions,
+    }
+    if topology:
+        config_data['topology'] = topology
+    return config_data
+
+
+def construct_program(config_path):
+    """현재 프로세스에서 mocks로 main()을 실행하고 metrics를 반환"""
+    import pulumi
+
+    resource_counts = collections.Counter()
+
+    class CountingMocks(pulumi.runtime.Mocks):
+        def new_resource(self, args):
+            resource_counts[args.typ] += 1
+            return [f'{args.name}_id', args.inputs]
+
+        def call(self, args):
+            return {}
+
+    pulumi.runtime.set_mocks(CountingMocks(), project=PROJECT_NAME, stack=STACK_NAME, preview=True)
+
+    # Output.apply 등록 수와 실제로 실행된 콜백 수
+    output_counts = collections.Counter()
+    original_apply = pulumi.Output.apply
+
+    def counting_apply(self, func, run_with_unknowns=False):
+        output_counts['applies'] += 1
+
+        def callback(value):
+            output_counts['callbacks'] += 1
+            return func(value)
+
+        return original_apply(self, callback, run_with_unknowns)
+
+    pulumi.Output.apply = counting_apply
+
+    main_globals = runpy.run_path(os.path.join(PROJECT_ROOT, '__main__.py'), run_name='__bench__')
+    config_manager_class = main_globals['ConfigManager']
+    main = main_globals['main']
+
+    class StubConfigManager(config_manager_class):
+        """~/.oci/config와 Pulumi secret 없이 동작하는 ConfigManager"""
+
+        def _get_pulumi_config_value(self, key, is_secret=False):
+            return 'ssh-ed25519 AAAABENCH'
+
+        def _load_region_profile(self, region):
+            return {
+                'user': f'ocid1.user.oc1..{region}',
+                'fingerprint': '00:00:00:00:00:00:00:00:00:00:00:00:00:00:00:00',
+                'tenancy': f'ocid1.tenancy.oc1..{region}',
+                'region': f'bench-{region}-1',
+                'key_file': '~/.oci/bench.pem',
+            }
+
+    # 피어링/IAM 단계는 실제 OCI API를 호출하므로 구성 비용 측정에서 제외
+    import stacks.programs
+
+    stacks.programs.connect_peering_connections = lambda *args, **kwargs: None
+
+    started = time.perf_counter()
+
+    @pulumi.runtime.test
+    def run():
+        main(StubConfigManager(config_path=config_path))
+        return pulumi.Output.from_input(None)
+
+    run()
+    wall_seconds = time.perf_counter() - started
+
+    return {
+        'wall_seconds': round(wall_seconds, 3),
+        # linux의 ru_maxrss 단위는 KB
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'resource_count': sum(resource_counts.values()),
+        'resource_counts': dict(sorted(resource_counts.items())),
+        'output_applies': output_counts['applies'],
+        'output_callbacks': output_counts['callbacks'],
+    }
+
+
+def run_isolated(config_data, timeout=None):
+    """별도 프로세스에서 construct_program을 실행하고 metrics를 반환"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        config_path = os.path.join(work_dir, 'config.json')
+        with open(config_path, 'w') as config_file:
+            json.dump(config_data, config_file)
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), config_path],
+            # app.log 등 실행 부산물은 임시 디렉토리에 생성
+            cwd=work_dir,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            check=False,
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f'Program construction failed:\n{result.stderr[-3000:]}')
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    metrics = construct_program(sys.argv[1])
+    print(json.dumps(metrics))
@@ -0,0 +1,3 @@
+from .programs import deploy_peering, deploy_region, region_stack_name, run_program
+
+__all__ = ['deploy_peering', 'deploy_region', 'region_stack_name', 'run_program']
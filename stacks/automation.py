@@ -0,0 +1,237 @@
+"""
+지역 스택(<prefix>-<region>)과 피어링 스택(<prefix>-peering)을 Automation API로 실행하는 드라이버.
+
+지역 스택은 서로 독립적이므로 --parallel 개수만큼 동시에 실행하고,
+피어링 스택은 지역 스택이 모두 성공한 뒤 실행한다. (destroy는 피어링 스택을 먼저 삭제하고,
+--regions로 일부 지역만 삭제할 때는 피어링 스택을 그 지역을 제외하고 up하여 해당 엣지만 제거한다)
+
+사용 예시:
+    python -m stacks.automation preview --prefix prod
+    python -m stacks.automation up --prefix prod --parallel 4 --base-stack prod
+    python -m stacks.automation up --prefix prod --regions se os --skip-peering
+    python -m stacks.automation destroy --prefix prod
+    python -m stacks.automation destroy --prefix prod --regions se  # se 엣지만 피어링 스택에서 제거 후 se 스택 삭제
+    python -m stacks.automation destroy --prefix prod --sweep
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .programs import region_stack_name
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ACTIONS = ('preview', 'up', 'refresh', 'destroy')
+
+# 스택 설정으로 지정하는 값이므로 드라이버 실행 환경의 환경 변수가 덮어쓰지 않도록 제거
+OVERRIDING_ENV_VARS = ('OKE_STACK_MODE', 'OKE_STACK_REGION', 'OKE_REGIONS', 'OKE_EXCLUDE_REGIONS')
+
+_print_lock = threading.Lock()
+
+
+def _print(stack_name, line):
+    with _print_lock:
+        print(f'[{stack_name}] {line.rstrip()}', flush=True)
+
+
+def load_regions(config_path):
+    """config.json의 지역 목록 (순서 유지)"""
+    with open(config_path) as config_file:
+        return list(json.load(config_file).get('regions', {}))
+
+
+def configure_kubeconfig(config_path):
+    """config.json의 kubeconfig 설정을 적용 (스윕이 남은 클러스터의 LoadBalancer 서비스를 삭제할 때 사용)"""
+    from cluster.kubeconfig_store import kubeconfig_store
+
+    with open(config_path) as config_file:
+        kubeconfig_store.configure(**json.load(config_file).get('kubeconfig', {}))
+
+
+_base_configs = {}
+_base_lock = threading.Lock()
+
+
+def base_stack_config(base_stack):
+    """기준 스택의 설정값 (한 번만 조회)"""
+    from pulumi import automation as auto
+
+    with _base_lock:
+        if base_stack not in _base_configs:
+            stack = auto.select_stack(stack_name=base_stack, work_dir=PROJECT_ROOT)
+            project = stack.workspace.project_settings().name
+            _base_configs[base_stack] = {
+                key.removeprefix(f'{project}:'): value.value for key, value in stack.get_all_config().items()
+            }
+        return _base_configs[base_stack]
+
+
+def prepare_stack(stack_name, settings, base_stack=None):
+    """스택을 생성/선택하고 stack_mode 등 설정을 기록"""
+    from pulumi import automation as auto
+
+    stack = auto.create_or_select_stack(stack_name=stack_name, work_dir=PROJECT_ROOT)
+    for key, value in settings.items():
+        stack.set_config(key, auto.ConfigValue(value=value))
+    # 기준 스택의 SSH 공개키(secret)를 복사
+    if base_stack and base_stack != stack_name:
+        ssh_public_key = base_stack_config(base_stack).get('ssh_public_key')
+        if ssh_public_key:
+            stack.set_config('ssh_public_key', auto.ConfigValue(value=ssh_public_key, secret=True))
+    return stack
+
+
+def run_stack(action, stack_name, settings, base_stack=None):
+    """
+    스택 1개에 action을 실행.
+
+    Returns:
+        dict: stack, status('succeeded'/'failed'), elapsed, changes, error
+    """
+    started = time.perf_counter()
+    result = {'stack': stack_name, 'status': 'succeeded', 'changes': {}, 'error': None}
+    try:
+        stack = prepare_stack(stack_name, settings, base_stack)
+
+        def on_output(line):
+            _print(stack_name, line)
+
+        if action == 'preview':
+            outcome = stack.preview(on_output=on_output)
+            result['changes'] = dict(outcome.change_summary or {})
+        elif action == 'up':
+            outcome = stack.up(on_output=on_output)
+            result['changes'] = dict(outcome.summary.resource_changes or {})
+        elif action == 'refresh':
+            outcome = stack.refresh(on_output=on_output)
+            result['changes'] = dict(outcome.summary.resource_changes or {})
+        else:
+            outcome = stack.destroy(on_output=on_output)
+            result['changes'] = dict(outcome.summary.resource_changes or {})
+    except Exception as e:
+        result.update(status='failed', error=str(e).strip().splitlines()[-1] if str(e).strip() else repr(e))
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+
+def run_region_stacks(action, prefix, regions, parallel, base_stack=None):
+    """지역 스택을 최대 parallel개씩 동시에 실행"""
+    results = []
+    with ThreadPoolExecutor(max_workers=max(min(parallel, len(regions)), 1)) as executor:
+        futures = [
+            executor.submit(
+                run_stack,
+                action,
+                region_stack_name(prefix, region),
+                {'stack_mode': 'region', 'stack_region': region},
+                base_stack,
+            )
+            for region in regions
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return results
+
+
+def run_peering_stack(action, prefix, base_stack=None, exclude_regions=None):
+    """
+    피어링 스택 실행.
+    --regions로 일부 지역만 실행해도 다른 엣지가 삭제되지 않도록 항상 전체 지역 스택을 참조한다.
+    exclude_regions가 주어지면 해당 지역이 포함된 엣지/IAM 정책만 제외한다 (일부 지역 destroy 전 단계).
+    """
+    return run_stack(
+        action,
+        f'{prefix}-peering',
+        {
+            'stack_mode': 'peering',
+            'region_stack_prefix': prefix,
+            # 스택 설정으로 저장되므로 제외할 지역이 없을 때도 이전 실행의 값을 비움
+            'exclude_regions': ','.join(exclude_regions or []),
+        },
+        base_stack,
+    )
+
+
+def run_sweep(regions, parallel):
+    """지역 스택 destroy 전 단계: 서브넷 차단 리소스를 최대 parallel개씩 제거 (결과는 스택 결과와 같은 형식)"""
+    from network.teardown_sweeper import TeardownSweeper
+
+    started = time.perf_counter()
+    results = TeardownSweeper(regions, max_workers=parallel).sweep()
+    failed = [result for result in results if result.status == 'failed']
+    changes = {}
+    for result in results:
+        changes[result.status] = changes.get(result.status, 0) + 1
+    return {
+        'stack': 'sweep',
+        'status': 'failed' if failed else 'succeeded',
+        'changes': changes,
+        'error': f'{len(failed)} blocker(s) failed: {failed[0].error}' if failed else None,
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def print_summary(results):
+    """스택별 실행 결과 요약"""
+    print(f'{"-" * 30} Stack Summary {"-" * 30}')
+    print(f'{"stack":<24}{"status":<12}{"elapsed(s)":>12}  changes / error')
+    for result in results:
+        detail = result['error'] or ', '.join(f'{op}={count}' for op, count in sorted(result['changes'].items()))
+        print(f'{result["stack"]:<24}{result["status"]:<12}{result["elapsed"]:>12.1f}  {detail}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run per-region stacks and the peering stack with the Automation API')
+    parser.add_argument('action', choices=ACTIONS)
+    parser.add_argument('--prefix', required=True, help='스택 이름 접두사 (예: prod -> prod-se, prod-peering)')
+    parser.add_argument('--regions', nargs='+', help='대상 지역 (기본값: config.json의 전체 지역)')
+    parser.add_argument('--parallel', type=int, default=4, help='동시에 실행할 지역 스택 수')
+    parser.add_argument('--skip-peering', action='store_true', help='피어링 스택을 실행하지 않음')
+    parser.add_argument('--base-stack', help='ssh_public_key 등 공통 설정을 복사할 기준 스택')
+    parser.add_argument(
+        '--sweep',
+        action='store_true',
+        help='destroy: 지역 스택 삭제 전에 서브넷 삭제를 막는 NLB/LB/VNIC을 병렬로 제거 (stacks.sweep)',
+    )
+    parser.add_argument('--config', default=os.path.join(PROJECT_ROOT, 'config.json'), help='config.json 경로')
+    args = parser.parse_args()
+
+    for env_var in OVERRIDING_ENV_VARS:
+        os.environ.pop(env_var, None)
+
+    all_regions = load_regions(args.config)
+    regions = args.regions or all_regions
+    unknown = [region for region in regions if region not in all_regions]
+    if unknown:
+        parser.error(f'Unknown regions: {unknown}')
+
+    results = []
+    if args.action == 'destroy':
+        # 피어링 엣지/IAM을 먼저 삭제한 뒤 지역 스택 삭제.
+        # 일부 지역만 삭제할 때는 피어링 스택을 삭제하지 않고, 해당 지역을 제외하고 up하여 그 지역의 엣지만 제거
+        if not args.skip_peering:
+            if set(regions) == set(all_regions):
+                results.append(run_peering_stack('destroy', args.prefix, args.base_stack))
+            else:
+                results.append(run_peering_stack('up', args.prefix, args.base_stack, exclude_regions=regions))
+        if args.sweep and all(result['status'] == 'succeeded' for result in results):
+            configure_kubeconfig(args.config)
+            results.append(run_sweep(regions, args.parallel))
+        if all(result['status'] == 'succeeded' for result in results):
+            results += run_region_stacks(args.action, args.prefix, regions, args.parallel, args.base_stack)
+    else:
+        results += run_region_stacks(args.action, args.prefix, regions, args.parallel, args.base_stack)
+        # 피어링 스택은 지역 스택의 출력(RPC ID)을 읽으므로 지역 스택이 모두 성공한 경우에만 실행
+        if not args.skip_peering and all(result['status'] == 'succeeded' for result in results):
+            results.append(run_peering_stack(args.action, args.prefix, args.base_stack))
+
+    print_summary(results)
+    sys.exit(0 if all(result['status'] == 'succeeded' for result in results) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import pulumi
+
+# ComponentResource 타입 토큰 (<package>:<module>:<type>)
+OKE_REGION_TYPE = 'oke:index:OkeRegion'
+REGION_NETWORK_TYPE = 'oke:network:RegionNetwork'
+REGION_CLUSTER_TYPE = 'oke:cluster:RegionCluster'
+
+
+class OkeRegion(pulumi.ComponentResource):
+    """
+    지역 1개의 리소스를 묶는 최상위 컴포넌트.
+    구획은 이 컴포넌트에, 네트워크/클러스터 리소스는 하위 컴포넌트에 속한다.
+    (pulumi up --target <urn> --target-dependents 로 지역 전체를 선택 가능)
+    """
+
+    def __init__(self, region, opts=None):
+        super().__init__(OKE_REGION_TYPE, region, None, opts)
+        self.region = region
+        self.register_outputs({})
+
+    def network(self):
+        """네트워크(VCN, 게이트웨이, 라우트/보안 규칙, 서브넷, RPC, Public IP) 하위 컴포넌트"""
+        return RegionNetwork(self.region, opts=pulumi.ResourceOptions(parent=self))
+
+    def cluster(self):
+        """OKE 클러스터/노드 풀 하위 컴포넌트"""
+        return RegionCluster(self.region, opts=pulumi.ResourceOptions(parent=self))
+
+
+class RegionNetwork(pulumi.ComponentResource):
+    def __init__(self, region, opts=None):
+        super().__init__(REGION_NETWORK_TYPE, f'{region}-network', None, opts)
+        self.register_outputs({})
+
+
+class RegionCluster(pulumi.ComponentResource):
+    def __init__(self, region, opts=None):
+        super().__init__(REGION_CLUSTER_TYPE, f'{region}-cluster', None, opts)
+        self.register_outputs({})
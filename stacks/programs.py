@@ -0,0 +1,197 @@
+from dataclasses import replace
+
+import pulumi
+
+from cluster.cluster_manager import ClusterManager
+from cluster.kubeconfig_store import kubeconfig_store
+from compartment import CompartmentManager
+from config import Config
+from config.deployment_selection import get_setting
+from iam import IamManager, IamPolicyResourceManager
+from network import NetworkManager, PublicIpManager, RemotePeeringConnector, RemotePeeringResourceManager
+from utils.error_context import error_boundary, error_report
+from utils.logger import get_logger
+from utils.resource_helper import resource_parent
+from utils.stack_exports import stack_exporter
+from utils.tracing import tracer
+
+from .components import OkeRegion
+
+logger = get_logger(__name__)
+
+# 지역 스택이 export하고 peering 스택이 StackReference로 읽는 출력 이름
+RPC_IDS_OUTPUT = 'rpc_ids'
+COMPARTMENT_ID_OUTPUT = 'compartment_id'
+
+
+def region_stack_name(prefix, region):
+    """지역 스택 이름 (예: prod-se)"""
+    return f'{prefix}-{region}'
+
+
+def deploy_region(region, configs: Config):
+    """
+    지역 1개의 구획, 네트워크, oke cluster 생성.
+
+    Returns:
+        dict: compartment_id, rpc_ids({peer: rpc_id}), public_ip, cluster_id(클러스터 단계를 건너뛰면 None)
+    """
+    config = configs.regions[region]
+    # 토폴로지 계획에 따른 피어 (peer_bi_map 순서는 regions 순서와 다를 수 있음)
+    peers = configs.peer_bi_map.get(region, [])
+    # 지역 리소스는 OkeRegion 컴포넌트 아래 구획 / 네트워크 / 클러스터 하위 트리로 등록
+    region_component = OkeRegion(region)
+    with resource_parent(region_component):
+        compartment_manager = CompartmentManager(region, config)
+        compartment_id = compartment_manager.create_compartment()
+
+    with resource_parent(region_component.network()):
+        network_manager = NetworkManager(region, config, compartment_id, configs.regions, peers)
+        vcn_id, subnet_ids, remote_peering_connection_ids = network_manager.create_network()
+        public_ip_manager = PublicIpManager(region, config, compartment_id)
+        public_ip = public_ip_manager.reserve_public_ip()
+
+    cluster_id = None
+    # skip_cluster_regions에 포함된 지역은 클러스터 단계를 건너뜀 (기존 클러스터는 삭제됨)
+    if configs.selection.layer_enabled('cluster', region):
+        with resource_parent(region_component.cluster()):
+            cluster_manager = ClusterManager(region, config, compartment_id, vcn_id, subnet_ids, configs.node)
+            cluster_id = cluster_manager.create_cluster()
+
+    return {
+        'compartment_id': compartment_id,
+        'rpc_ids': remote_peering_connection_ids,
+        'public_ip': public_ip,
+        'cluster_id': cluster_id,
+    }
+
+
+def deploy_peering(region_rpcs, compartment_ids, configs: Config):
+    """선택된 지역 사이의 피어링/IAM 구성 (양쪽 지역이 모두 선택된 엣지만 연결)"""
+    peering_configs = configs.selection.peering_configs(configs)
+    peer_map = peering_configs.peer_map
+    if configs.selection.partial:
+        logger.warning(
+            'Partial peering run: only missing IAM policies are created; '
+            'existing policies are updated and legacy policies pruned on the next full run.'
+        )
+    if configs.peering.mode == 'apply':
+        pulumi.Output.all(region_rpcs, compartment_ids).apply(
+            lambda outputs: connect_peering_connections(outputs[0], outputs[1], peer_map, peering_configs)
+        )
+    else:
+        # 테넌시별 IAM 정책과 엣지별 피어링을 동적 리소스로 상태에 기록.
+        # 각 엣지는 자신의 두 RPC가 생성되는 즉시 (다른 지역을 기다리지 않고) 연결된다.
+        tenancy_policies = IamPolicyResourceManager(peering_configs).create_all_tenancy_policies()
+        RemotePeeringResourceManager(
+            region_rpcs, peer_map, peering_configs, tenancy_policies
+        ).create_peering_resources()
+
+
+def connect_peering_connections(region_rpcs, compartment_ids, peer_map, configs):
+    logger.info('Connecting peering connections...')
+
+    # apply 콜백 안에서 실행되므로 실패는 여기서 한 번 기록한 뒤 Pulumi에 전달
+    with error_boundary(reraise=True, layer='peering'):
+        # IAM 정책은 엣지 연결 직전에 테넌시별로 한 번씩 생성
+        iam_manager = IamManager(configs)
+        remote_peering_connection_connector = RemotePeeringConnector(
+            region_rpcs, peer_map, configs, compartment_ids, iam_manager
+        )
+        remote_peering_connection_connector.connect_all_peers()
+
+
+def without_failed_regions(configs: Config):
+    """구성에 실패한 지역을 제외한 설정 (실패한 지역과의 피어링 엣지는 이번 실행에서 구성하지 않음)"""
+    failed = set(error_report.failed_regions())
+    if not failed:
+        return configs
+    logger.warning(f'Skipping peering edges of failed region(s): {sorted(failed)}')
+    regions = [region for region in configs.selection.regions if region not in failed]
+    return replace(configs, selection=replace(configs.selection, regions=regions))
+
+
+def fleet_program(configs: Config):
+    """단일 스택에 선택된 모든 지역과 피어링을 구성"""
+    region_rpcs, compartment_ids = {}, {}
+    for region in configs.selection.regions:
+        if not configs.selection.layer_enabled('network', region):
+            continue
+        # 한 지역의 실패가 다른 지역의 구성을 막지 않도록 지역별 오류 경계에서 처리
+        with error_boundary(region=region):
+            outputs = deploy_region(region, configs)
+            region_rpcs[region] = outputs['rpc_ids']
+            compartment_ids[region] = outputs['compartment_id']
+
+    if configs.selection.layer_enabled('peering'):
+        with error_boundary(layer='peering'):
+            deploy_peering(region_rpcs, compartment_ids, without_failed_regions(configs))
+
+
+def region_program(configs: Config):
+    """지역 스택: 지역 1개의 구획/네트워크/클러스터를 구성하고 peering 스택이 읽을 출력을 export"""
+    for region in configs.selection.regions:
+        with error_boundary(region=region):
+            outputs = deploy_region(region, configs)
+            pulumi.export(RPC_IDS_OUTPUT, outputs['rpc_ids'])
+            pulumi.export(COMPARTMENT_ID_OUTPUT, outputs['compartment_id'])
+            if outputs['cluster_id'] is not None:
+                pulumi.export('cluster_id', outputs['cluster_id'])
+
+
+def peering_program(configs: Config):
+    """
+    peering 스택: 지역 스택의 RPC/구획 ID를 StackReference로 읽어 피어링/IAM을 구성.
+    지역 스택 이름은 region_stack_prefix 설정(기본값: 현재 스택 이름에서 '-peering' 제거) + '-<region>'.
+    """
+    prefix = pulumi.Config().get('region_stack_prefix') or pulumi.get_stack().removesuffix('-peering')
+    organization = pulumi.get_organization()
+    project = pulumi.get_project()
+
+    region_rpcs, compartment_ids = {}, {}
+    for region in configs.selection.regions:
+        reference = pulumi.StackReference(
+            f'{organization}/{project}/{region_stack_name(prefix, region)}',
+        )
+        rpc_ids = reference.get_output(RPC_IDS_OUTPUT)
+        region_rpcs[region] = {
+            peer: rpc_ids.apply(lambda ids, peer=peer: ids[peer]) for peer in configs.peer_bi_map.get(region, [])
+        }
+        compartment_ids[region] = reference.get_output(COMPARTMENT_ID_OUTPUT)
+
+    with error_boundary(layer='peering'):
+        deploy_peering(region_rpcs, compartment_ids, configs)
+
+
+STACK_PROGRAMS = {
+    'fleet': fleet_program,
+    'region': region_program,
+    'peering': peering_program,
+}
+
+
+def run_program(configs: Config):
+    """stack_mode(fleet/region/peering)에 맞는 프로그램 실행"""
+    stack_exporter.configure(configs.exports.mode, configs.exports.types)
+    kubeconfig_store.configure(
+        configs.kubeconfig.directory,
+        configs.kubeconfig.merged_file,
+        configs.kubeconfig.per_region_files,
+        configs.kubeconfig.cache_ttl,
+    )
+    # config.json에서 빠진 지역의 병합 kubeconfig 항목 정리 (preview에서는 파일을 쓰지 않음).
+    # 선택된 지역이 아니라 config.json의 전체 지역 기준이므로 지역 스택/부분 실행에서도 다른 지역 항목은 유지됨
+    if not pulumi.runtime.is_dry_run():
+        try:
+            kubeconfig_store.prune(configs.selection.all_regions)
+        except Exception as e:
+            logger.warning(f'Failed to prune kubeconfig entries: {e}')
+    # trace 설정(OKE_TRACE)이 있으면 프로세스 종료 시 trace 파일과 요약 테이블을 남김
+    tracer.configure(get_setting('trace'))
+    with tracer.span('program', stack_mode=configs.selection.stack_mode):
+        STACK_PROGRAMS[configs.selection.stack_mode](configs)
+    # 지역별로 모은 오류를 한 번에 보고하고 실행을 실패 처리 (apply 콜백 오류는 종료 시 보고)
+    error_report.log_report()
+    error_report.raise_if_failed()
+    # inventory 모드: 프로그램에서 기록된 리소스 ID를 하나의 출력으로 export
+    stack_exporter.flush()
@@ -0,0 +1,66 @@
+"""
+destroy 전 단계: 선택된 지역의 서브넷 삭제를 막는 NLB/LB/남은 VNIC을 병렬로 제거하는 드라이버.
+
+Kubernetes 서비스가 만든 NLB/LB는 Pulumi 상태에 없어 서브넷 삭제가 OCI API 타임아웃까지 멈추므로,
+destroy 전에 실행하여 모든 지역을 한 번에 정리한다. (Pulumi 스택은 변경하지 않음)
+클러스터가 남아 있으면 config.json의 kubeconfig 설정으로 LoadBalancer 서비스를 먼저 삭제하고(kubectl 필요),
+CCM이 만든 NLB/LB만 제거한다.
+
+사용 예시:
+    python -m stacks.sweep --dry-run
+    python -m stacks.sweep --regions se os --parallel 8
+    python -m stacks.sweep --kinds nlb lb && pulumi destroy --yes
+"""
+
+import argparse
+import os
+import sys
+
+from network.teardown_sweeper import BLOCKER_KINDS, TeardownSweeper
+
+from .automation import PROJECT_ROOT, configure_kubeconfig, load_regions
+
+
+def print_summary(results, dry_run=False):
+    """리소스별 처리 결과 요약"""
+    print(f'{"-" * 30} Sweep Summary{" (dry run)" if dry_run else ""} {"-" * 30}')
+    if not results:
+        print('No subnet blockers found.')
+        return
+    print(f'{"region":<12}{"kind":<8}{"status":<10}{"elapsed(s)":>12}  resource / error')
+    for result in sorted(results, key=lambda result: (result.blocker.region, result.blocker.kind)):
+        blocker = result.blocker
+        detail = f'{blocker.name} ({blocker.resource_id})' + (f': {result.error}' if result.error else '')
+        print(f'{blocker.region:<12}{blocker.kind:<8}{result.status:<10}{result.elapsed:>12.1f}  {detail}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remove NLBs, load balancers and VNICs that block subnet deletion')
+    parser.add_argument('--regions', nargs='+', help='대상 지역 (기본값: config.json의 전체 지역)')
+    parser.add_argument('--parallel', type=int, default=8, help='동시에 탐색/삭제할 작업 수')
+    parser.add_argument('--kinds', nargs='+', choices=BLOCKER_KINDS, default=list(BLOCKER_KINDS), help='제거할 종류')
+    parser.add_argument('--wait-timeout', type=int, default=1200, help='리소스별 삭제 대기 시간(초)')
+    parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상만 출력')
+    parser.add_argument('--config', default=os.path.join(PROJECT_ROOT, 'config.json'), help='config.json 경로')
+    args = parser.parse_args()
+
+    all_regions = load_regions(args.config)
+    regions = args.regions or all_regions
+    unknown = [region for region in regions if region not in all_regions]
+    if unknown:
+        parser.error(f'Unknown regions: {unknown}')
+
+    configure_kubeconfig(args.config)
+    results = TeardownSweeper(
+        regions,
+        max_workers=args.parallel,
+        wait_timeout=args.wait_timeout,
+        kinds=args.kinds,
+        dry_run=args.dry_run,
+    ).sweep()
+    print_summary(results, args.dry_run)
+    sys.exit(1 if any(result.status == 'failed' for result in results) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+import pytest
+
+from config import Config
+from config.deployment_selection import SETTING_ENV_VARS, DeploymentSelection, resolve_selection
+
+ALL_REGIONS = ['se', 'os', 'to', 'sy']
+PEER_BI_MAP = {'se': ['os', 'to'], 'os': ['se'], 'to': ['se'], 'sy': []}
+
+
+@pytest.fixture(autouse=True)
+def clean_settings(monkeypatch):
+    """실행 환경의 OKE_* 설정이 테스트에 영향을 주지 않도록 제거"""
+    for env_var in SETTING_ENV_VARS.values():
+        monkeypatch.delenv(env_var, raising=False)
+    return monkeypatch
+
+
+def test_defaults_select_every_region_and_layer():
+    selection = resolve_selection(ALL_REGIONS, PEER_BI_MAP)
+
+    assert selection.regions == ALL_REGIONS
+    assert selection.layers == ('network', 'cluster', 'peering')
+    assert not selection.partial
+
+
+def test_selected_regions_keep_config_order_and_load_their_peers(clean_settings):
+    clean_settings.setenv('OKE_REGIONS', 'os,se')
+
+    selection = resolve_selection(ALL_REGIONS, PEER_BI_MAP)
+
+    assert selection.regions == ['se', 'os']
+    assert selection.peer_only_regions == ['to']
+    assert selection.partial
+
+
+def test_exclude_regions_accepts_json_lists(clean_settings):
+    clean_settings.setenv('OKE_EXCLUDE_REGIONS', '["sy"]')
+
+    assert resolve_selection(ALL_REGIONS, PEER_BI_MAP).regions == ['se', 'os', 'to']
+
+
+@pytest.mark.parametrize(
+    ('env', 'message'),
+    [
+        ({'OKE_REGIONS': 'xx'}, 'Unknown regions'),
+        ({'OKE_LAYERS': 'network,dns'}, 'Invalid layers'),
+        ({'OKE_LAYERS': 'cluster'}, 'require the network layer'),
+        ({'OKE_STACK_MODE': 'global'}, 'Invalid stack_mode'),
+        ({'OKE_STACK_MODE': 'region'}, 'stack_region must be set'),
+    ],
+)
+def test_rejects_invalid_settings(clean_settings, env, message):
+    for env_var, value in env.items():
+        clean_settings.setenv(env_var, value)
+
+    with pytest.raises(ValueError, match=message):
+        resolve_selection(ALL_REGIONS, PEER_BI_MAP)
+
+
+def test_region_stack_selects_one_region_without_peering(clean_settings):
+    clean_settings.setenv('OKE_STACK_MODE', 'region')
+    clean_settings.setenv('OKE_STACK_REGION', 'os')
+
+    selection = resolve_selection(ALL_REGIONS, PEER_BI_MAP)
+
+    assert (selection.regions, selection.layers) == (['os'], ('network', 'cluster'))
+    # 지역 스택은 다른 지역을 선언하지 않는 것이 정상이므로 부분 실행이 아님
+    assert not selection.partial
+
+
+def test_peering_stack_only_runs_the_peering_layer(clean_settings):
+    clean_settings.setenv('OKE_STACK_MODE', 'peering')
+    clean_settings.setenv('OKE_EXCLUDE_REGIONS', 'to')
+
+    selection = resolve_selection(ALL_REGIONS, PEER_BI_MAP)
+
+    assert selection.layers == ('peering',)
+    assert not selection.partial
+
+
+@pytest.mark.parametrize(
+    ('selection', 'partial'),
+    [
+        (DeploymentSelection(regions=ALL_REGIONS, all_regions=ALL_REGIONS), False),
+        (DeploymentSelection(regions=['se'], all_regions=ALL_REGIONS), True),
+        (DeploymentSelection(regions=ALL_REGIONS, all_regions=ALL_REGIONS, layers=('network',)), True),
+        (DeploymentSelection(regions=ALL_REGIONS, all_regions=ALL_REGIONS, skip_cluster_regions=['se']), True),
+        (
+            DeploymentSelection(
+                regions=['se'], all_regions=ALL_REGIONS, stack_mode='region', skip_cluster_regions=['se']
+            ),
+            True,
+        ),
+        # 클러스터 단계를 실행하지 않으면 건너뛸 클러스터도 없음
+        (
+            DeploymentSelection(
+                regions=['os'],
+                all_regions=ALL_REGIONS,
+                stack_mode='region',
+                layers=('network',),
+                skip_cluster_regions=['os'],
+            ),
+            False,
+        ),
+    ],
+)
+def test_partial_runs(selection, partial):
+    assert selection.partial is partial
+
+
+def test_partial_up_requires_opt_in(clean_settings):
+    selection = DeploymentSelection(regions=ALL_REGIONS, all_regions=ALL_REGIONS, skip_cluster_regions=['se'])
+
+    selection.check_partial_allowed(dry_run=True)
+    with pytest.raises(ValueError, match='Refusing partial deployment'):
+        selection.check_partial_allowed()
+
+    clean_settings.setenv('OKE_ALLOW_PARTIAL', '1')
+    selection.check_partial_allowed()
+
+
+def test_layer_enabled_honors_skipped_clusters():
+    selection = DeploymentSelection(regions=['se', 'os'], all_regions=ALL_REGIONS, skip_cluster_regions=['os'])
+
+    assert selection.layer_enabled('cluster', 'se')
+    assert not selection.layer_enabled('cluster', 'os')
+    assert not selection.layer_enabled('network', 'to')
+    assert selection.layer_enabled('peering')
+
+
+def test_peering_configs_keep_edges_between_selected_regions():
+    selection = DeploymentSelection(regions=['se', 'os'], all_regions=ALL_REGIONS)
+    configs = Config(peer_map={'se': ['os', 'to']}, peer_bi_map=PEER_BI_MAP)
+
+    peering_configs = selection.peering_configs(configs)
+
+    assert peering_configs.peer_map == {'se': ['os']}
+    assert peering_configs.peer_bi_map == {'se': ['os'], 'os': ['se']}
+    assert configs.peer_map == {'se': ['os', 'to']}
@@ -0,0 +1,105 @@
+import logging
+
+import pytest
+
+from utils import error_context
+from utils.error_context import (
+    ErrorReport,
+    annotate_error,
+    error_boundary,
+    with_error_boundary,
+)
+from utils.exception_handler import apply_exception_handler
+
+
+@pytest.fixture
+def report(monkeypatch):
+    """전역 error_report 대신 테스트마다 새 보고서 사용"""
+    fresh = ErrorReport()
+    monkeypatch.setattr(error_context, 'error_report', fresh)
+    return fresh
+
+
+def call_api():
+    raise ValueError('vcn limit exceeded')
+
+
+@apply_exception_handler
+class FakeNetworkManager:
+    def __init__(self, region):
+        self.region = region
+
+    def create_vcn(self):
+        return call_api()
+
+
+def test_annotate_error_keeps_innermost_fields():
+    error = ValueError('boom')
+
+    annotate_error(error, region='se', step='inner')
+    annotate_error(error, region='os', layer='network', ignored=None)
+
+    assert error.oke_error_context == {'region': 'se', 'step': 'inner', 'layer': 'network'}
+
+
+def test_boundary_records_manager_step_and_region(report):
+    with error_boundary(layer='network'):
+        FakeNetworkManager('se').create_vcn()
+
+    (entry,) = report.entries
+    assert (entry.region, entry.manager, entry.step) == ('se', 'FakeNetworkManager', 'create_vcn')
+    assert entry.error == 'ValueError: vcn limit exceeded'
+    assert entry.location == 'se/FakeNetworkManager.create_vcn'
+
+
+def test_nested_boundaries_log_an_error_once(report, caplog):
+    with caplog.at_level(logging.ERROR), error_boundary(region='se'):
+        with error_boundary(reraise=True, region='se', layer='cluster'):
+            raise ValueError('node pool failed')
+
+    assert len(report.entries) == 1
+    assert sum('Failed at' in record.getMessage() for record in caplog.records) == 1
+
+
+def test_boundary_swallows_errors_so_other_regions_continue(report):
+    for region in ('se', 'os', 'to'):
+        with error_boundary(region=region):
+            if region != 'os':
+                raise RuntimeError(f'{region} failed')
+
+    assert report.failed_regions() == ['se', 'to']
+    with pytest.raises(RuntimeError, match=r'2 error\(s\) during deployment in region\(s\): se, to'):
+        report.raise_if_failed()
+
+
+def test_wrapped_callbacks_record_and_reraise(report):
+    callback = with_error_boundary(lambda value: 1 / value, region='os', step='apply')
+
+    assert callback(2) == 0.5
+    with pytest.raises(ZeroDivisionError):
+        callback(0)
+    assert report.entries[0].region == 'os'
+    assert report.entries[0].step == 'apply'
+
+
+def test_log_report_only_reports_new_entries(report, caplog):
+    with error_boundary(region='se'):
+        raise RuntimeError('first')
+
+    with caplog.at_level(logging.ERROR):
+        report.log_report()
+        report.log_report()
+        first = caplog.text
+        with error_boundary(region='os'):
+            raise RuntimeError('second')
+        caplog.clear()
+        report.log_report()
+
+    assert first.count('Error Report (1 error(s))') == 1
+    assert 'RuntimeError: second' in caplog.text
+    assert 'RuntimeError: first' not in caplog.text
+
+
+def test_empty_report_does_not_fail(report):
+    report.log_report()
+    report.raise_if_failed()
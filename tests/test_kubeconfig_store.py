@@ -0,0 +1,141 @@
+import importlib
+import os
+import stat
+
+import pytest
+import yaml
+
+from cluster.kubeconfig_store import KubeconfigStore, rename_entries, write_if_changed
+
+# cluster 패키지가 같은 이름의 kubeconfig_store 인스턴스를 export하므로 모듈은 importlib로 가져옴
+store_module = importlib.import_module('cluster.kubeconfig_store')
+
+
+def oke_kubeconfig(cluster_id, server):
+    return yaml.safe_dump(
+        {
+            'apiVersion': 'v1',
+            'kind': 'Config',
+            'clusters': [{'name': f'cluster-{cluster_id}', 'cluster': {'server': server}}],
+            'users': [{'name': f'user-{cluster_id}', 'user': {'exec': {'command': 'oci'}}}],
+            'contexts': [
+                {'name': f'context-{cluster_id}', 'context': {'cluster': f'cluster-{cluster_id}', 'user': 'x'}}
+            ],
+            'current-context': f'context-{cluster_id}',
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return KubeconfigStore(directory=str(tmp_path))
+
+
+def load(path):
+    with open(path) as file:
+        return yaml.safe_load(file)
+
+
+def names(merged, key):
+    return [entry['name'] for entry in merged[key]]
+
+
+def test_save_writes_region_file_and_merged_context(store):
+    written = store.save('se', oke_kubeconfig('c1', 'https://se'))
+
+    assert written == [store.region_path('se'), store.merged_path]
+    merged = load(store.merged_path)
+    assert names(merged, 'contexts') == ['oke-se']
+    assert merged['contexts'][0]['context'] == {'cluster': 'oke-se', 'user': 'oke-se'}
+    assert merged['current-context'] == 'oke-se'
+    assert stat.S_IMODE(os.stat(store.merged_path).st_mode) == 0o600
+
+
+def test_unchanged_content_is_not_rewritten(store):
+    content = oke_kubeconfig('c1', 'https://se')
+    store.save('se', content)
+
+    assert store.save('se', content) == []
+
+
+def test_merge_replaces_only_the_region_entry(store):
+    store.save('se', oke_kubeconfig('c1', 'https://se'))
+    store.save('os', oke_kubeconfig('c2', 'https://os'))
+    store.save('se', oke_kubeconfig('c3', 'https://se-new'))
+
+    merged = load(store.merged_path)
+    assert names(merged, 'clusters') == ['oke-se', 'oke-os']
+    assert merged['clusters'][0]['cluster']['server'] == 'https://se-new'
+    # 처음 선택된 current-context 유지
+    assert merged['current-context'] == 'oke-se'
+
+
+def test_prune_removes_unconfigured_regions_and_keeps_user_entries(store):
+    store.save('se', oke_kubeconfig('c1', 'https://se'))
+    store.save('os', oke_kubeconfig('c2', 'https://os'))
+    merged = load(store.merged_path)
+    merged['contexts'].append({'name': 'my-kind', 'context': {'cluster': 'kind', 'user': 'kind'}})
+    with open(store.merged_path, 'w') as file:
+        yaml.safe_dump(merged, file, sort_keys=False)
+
+    removed = store.prune(['os'])
+
+    assert removed == ['oke-se']
+    merged = load(store.merged_path)
+    assert names(merged, 'contexts') == ['oke-os', 'my-kind']
+    assert names(merged, 'clusters') == ['oke-os']
+    # 제거된 컨텍스트가 current-context였으면 남은 컨텍스트로 변경
+    assert merged['current-context'] == 'oke-os'
+
+
+def test_prune_keeps_every_configured_region(store):
+    for region in ('se', 'os'):
+        store.save(region, oke_kubeconfig(region, f'https://{region}'))
+
+    assert store.prune(['se', 'os', 'to']) == []
+
+
+def test_prune_without_merged_file_is_a_no_op(tmp_path):
+    assert KubeconfigStore(directory=str(tmp_path), merged_file='').prune(['se']) == []
+    assert KubeconfigStore(directory=str(tmp_path)).prune(['se']) == []
+
+
+def test_per_region_files_can_be_disabled(tmp_path):
+    store = KubeconfigStore(directory=str(tmp_path), per_region_files=False)
+
+    assert store.save('se', oke_kubeconfig('c1', 'https://se')) == [store.merged_path]
+    assert not os.path.exists(store.region_path('se'))
+
+
+def test_cache_honors_ttl(store, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(store_module.time, 'time', lambda: now)
+    store.cache('cluster-1', '2.0.0', 'kubeconfig')
+
+    assert store.cached('cluster-1', '2.0.0') == 'kubeconfig'
+    assert store.cached('cluster-1', '1.0.0') is None
+
+    now += store.cache_ttl + 1
+    assert store.cached('cluster-1', '2.0.0') is None
+    assert store.cached('cluster-1', '2.0.0', ignore_ttl=True) == 'kubeconfig'
+
+
+def test_cache_disabled_with_zero_ttl(tmp_path):
+    store = KubeconfigStore(directory=str(tmp_path), cache_ttl=0)
+    store.cache('cluster-1', '2.0.0', 'kubeconfig')
+
+    assert store.cached('cluster-1', '2.0.0', ignore_ttl=True) is None
+
+
+def test_rename_entries_rejects_unexpected_kubeconfigs():
+    with pytest.raises(ValueError, match='Unexpected kubeconfig for oke-se'):
+        rename_entries({'clusters': [], 'users': [], 'contexts': []}, 'oke-se')
+
+
+def test_write_if_changed_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / 'config')
+
+    assert write_if_changed(path, 'a')
+    assert not write_if_changed(path, 'a')
+    assert write_if_changed(path, 'b')
+    assert os.listdir(tmp_path) == ['config']
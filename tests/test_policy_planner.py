@@ -0,0 +1,128 @@
+from iam.base_iam_manager import PolicySpec
+from iam.policy_planner import DEFINE_PATTERN, LEGACY_POLICY_PATTERN, PolicyPlanner
+
+REQUESTOR = 'AllowRemotePeering_Requestor'
+ACCEPTOR = 'AllowRemotePeering_Acceptor'
+
+
+def requestor_spec(region, peer, tenancy_id, peer_tenancy_id, admin_group_id='ocid1.group.admin'):
+    return PolicySpec(
+        region,
+        tenancy_id,
+        f'{REQUESTOR}_{region}_{peer}',
+        'Allow Requestor to manage remote peering requests to Acceptor',
+        [
+            f'Define group Administrators as {admin_group_id}',
+            f'Define tenancy Acceptor as {peer_tenancy_id}',
+            'Allow group Administrators to manage remote-peering-from in tenancy',
+            'Endorse group Administrators to manage remote-peering-to in tenancy Acceptor',
+        ],
+        group_name=REQUESTOR,
+    )
+
+
+def acceptor_spec(region, peer, tenancy_id, peer_tenancy_id, admin_group_id='ocid1.group.admin'):
+    return PolicySpec(
+        peer,
+        tenancy_id,
+        f'{ACCEPTOR}_{region}_{peer}',
+        'Allow Acceptor to approve remote peering requests from Requestor',
+        [
+            f'Define tenancy Requestor as {peer_tenancy_id}',
+            f'Define group Administrators as {admin_group_id}',
+            'Admit group Administrators of tenancy Requestor to manage remote-peering-to in tenancy',
+        ],
+        group_name=ACCEPTOR,
+    )
+
+
+def defines(statements):
+    return {
+        DEFINE_PATTERN.match(statement).group(2): DEFINE_PATTERN.match(statement).group(3)
+        for statement in statements
+        if DEFINE_PATTERN.match(statement)
+    }
+
+
+def test_merges_specs_per_tenancy_and_role():
+    specs = [
+        requestor_spec('se', 'os', 'tenancy-a', 'tenancy-b'),
+        requestor_spec('se', 'to', 'tenancy-a', 'tenancy-b'),
+        acceptor_spec('se', 'os', 'tenancy-b', 'tenancy-a'),
+    ]
+
+    plan = PolicyPlanner().plan(specs)
+
+    assert [spec.name for spec in plan['tenancy-a']] == [REQUESTOR]
+    assert [spec.name for spec in plan['tenancy-b']] == [ACCEPTOR]
+    # 같은 OCID를 가리키는 Define과 같은 구문은 한 번만 포함
+    assert plan['tenancy-a'][0].statements == [
+        'Define group Administrators as ocid1.group.admin',
+        'Define tenancy Acceptor as tenancy-b',
+        'Allow group Administrators to manage remote-peering-from in tenancy',
+        'Endorse group Administrators to manage remote-peering-to in tenancy Acceptor',
+    ]
+
+
+def test_gives_distinct_aliases_to_different_ocids():
+    specs = [
+        requestor_spec('se', 'os', 'tenancy-a', 'tenancy-b'),
+        requestor_spec('se', 'to', 'tenancy-a', 'tenancy-c'),
+    ]
+
+    statements = PolicyPlanner().plan(specs)['tenancy-a'][0].statements
+
+    assert defines(statements) == {
+        'Administrators': 'ocid1.group.admin',
+        'Acceptor': 'tenancy-b',
+        'Acceptor2': 'tenancy-c',
+    }
+    assert 'Endorse group Administrators to manage remote-peering-to in tenancy Acceptor' in statements
+    assert 'Endorse group Administrators to manage remote-peering-to in tenancy Acceptor2' in statements
+
+
+def test_splits_large_policies_with_their_defines():
+    specs = [requestor_spec('se', f'peer{index}', 'tenancy-a', f'tenancy-{index}') for index in range(8)]
+
+    plan = PolicyPlanner(max_statements=6).plan(specs)['tenancy-a']
+
+    assert [spec.name for spec in plan][:2] == [REQUESTOR, f'{REQUESTOR}_2']
+    assert all(spec.group_name == REQUESTOR for spec in plan)
+    for spec in plan:
+        assert len(spec.statements) <= 6
+        # 조각마다 자신이 참조하는 별칭의 Define을 포함
+        aliases = defines(spec.statements)
+        for statement in spec.statements:
+            if statement.startswith('Endorse'):
+                assert statement.rsplit(' ', 1)[1] in aliases
+    endorsed = {
+        defines(spec.statements)[statement.rsplit(' ', 1)[1]]
+        for spec in plan
+        for statement in spec.statements
+        if statement.startswith('Endorse')
+    }
+    assert endorsed == {f'tenancy-{index}' for index in range(8)}
+
+
+def test_normalizes_whitespace_before_deduplicating():
+    spec = requestor_spec('se', 'os', 'tenancy-a', 'tenancy-b')
+    spaced = PolicySpec(
+        spec.region,
+        spec.tenancy_id,
+        f'{REQUESTOR}_se_to',
+        spec.description,
+        [statement.replace(' ', '  ') for statement in spec.statements],
+        group_name=REQUESTOR,
+    )
+
+    statements = PolicyPlanner().plan([spec, spaced])['tenancy-a'][0].statements
+
+    assert len(statements) == len(spec.statements)
+
+
+def test_legacy_pattern_matches_per_edge_and_split_policies_only():
+    assert LEGACY_POLICY_PATTERN.match(f'{REQUESTOR}_se_os')
+    assert LEGACY_POLICY_PATTERN.match(f'{ACCEPTOR}_2')
+    assert LEGACY_POLICY_PATTERN.match('Cross_Tenant_Admin_Policy_Acceptor_se_os')
+    assert not LEGACY_POLICY_PATTERN.match(REQUESTOR)
+    assert not LEGACY_POLICY_PATTERN.match('Unrelated_Policy')
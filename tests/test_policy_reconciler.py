@@ -0,0 +1,174 @@
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from config import DeploymentSelection, IamConfig
+from iam.iam_manager import IamManager
+from iam.policy_planner import LEGACY_POLICY_PATTERN
+from iam.policy_reconciler import PolicyReconciler
+
+TENANCY = 'tenancy-a'
+
+
+def response(data):
+    return SimpleNamespace(data=data, has_next_page=False, next_page=None, status=200, headers={}, request=None)
+
+
+class FakeIdentityClient:
+    """정책 목록을 메모리에 보관하고 쓰기 호출을 기록하는 가짜 Identity 클라이언트"""
+
+    def __init__(self, policies=()):
+        self._ids = itertools.count(1)
+        self.policies = {}
+        for name, statements in policies:
+            self._add(name, 'existing', statements)
+        self.list_calls = 0
+        self.writes = []
+
+    def _add(self, name, description, statements):
+        policy = SimpleNamespace(
+            id=f'policy-{next(self._ids)}',
+            name=name,
+            description=description,
+            statements=list(statements),
+            lifecycle_state='ACTIVE',
+        )
+        self.policies[policy.id] = policy
+        return policy
+
+    def list_policies(self, compartment_id, **kwargs):
+        self.list_calls += 1
+        return response(list(self.policies.values()))
+
+    def get_policy(self, policy_id):
+        return response(self.policies[policy_id])
+
+    def create_policy(self, details):
+        self.writes.append(('create', details.name))
+        return response(self._add(details.name, details.description, details.statements))
+
+    def update_policy(self, policy_id, details):
+        self.writes.append(('update', self.policies[policy_id].name))
+        self.policies[policy_id].statements = list(details.statements)
+        return response(self.policies[policy_id])
+
+    def delete_policy(self, policy_id):
+        self.writes.append(('delete', self.policies.pop(policy_id).name))
+        return response(None)
+
+
+def test_unchanged_policies_need_no_writes():
+    client = FakeIdentityClient([('Peering', ['Allow group A to manage all-resources in tenancy'])])
+
+    counts = PolicyReconciler().reconcile_all(
+        client, TENANCY, [('Peering', 'existing', ['Allow  group A to manage all-resources in tenancy'])]
+    )
+
+    assert counts['unchanged'] == 1
+    assert client.writes == []
+
+
+def test_creates_missing_and_updates_changed_policies():
+    client = FakeIdentityClient([('Changed', ['Allow group A to read all-resources in tenancy'])])
+
+    counts = PolicyReconciler().reconcile_all(
+        client,
+        TENANCY,
+        [
+            ('Changed', 'existing', ['Allow group A to manage all-resources in tenancy']),
+            ('Missing', 'new', ['Allow group B to read all-resources in tenancy']),
+        ],
+    )
+
+    assert (counts['created'], counts['updated']) == (1, 1)
+    assert sorted(client.writes) == [('create', 'Missing'), ('update', 'Changed')]
+
+
+def test_lists_each_tenancy_once():
+    client = FakeIdentityClient()
+    reconciler = PolicyReconciler()
+
+    for name in ('P1', 'P2', 'P3'):
+        reconciler.reconcile(client, TENANCY, name, 'new', ['Allow group A to read all-resources in tenancy'])
+
+    assert client.list_calls == 1
+
+
+def test_prunes_superseded_policies_after_reconciling():
+    client = FakeIdentityClient(
+        [
+            ('AllowRemotePeering_Requestor_se_os', ['old']),
+            ('AllowRemotePeering_Requestor_2', ['old']),
+            ('Unrelated_Policy', ['keep']),
+        ]
+    )
+
+    counts = PolicyReconciler().reconcile_all(
+        client,
+        TENANCY,
+        [('AllowRemotePeering_Requestor', 'new', ['Allow group A to manage remote-peering-from in tenancy'])],
+        prune_pattern=LEGACY_POLICY_PATTERN,
+    )
+
+    assert counts['deleted'] == 2
+    # 통합 정책을 먼저 만든 뒤 이전 정책을 삭제
+    assert client.writes[0] == ('create', 'AllowRemotePeering_Requestor')
+    assert {policy.name for policy in client.policies.values()} == {
+        'AllowRemotePeering_Requestor',
+        'Unrelated_Policy',
+    }
+
+
+def test_partial_run_only_creates_missing_policies():
+    client = FakeIdentityClient([('AllowRemotePeering_Requestor', ['statements of other regions'])])
+
+    counts = PolicyReconciler().reconcile_all(
+        client,
+        TENANCY,
+        [
+            ('AllowRemotePeering_Requestor', 'new', ['statements of this run']),
+            ('AllowRemotePeering_Acceptor', 'new', ['statements of this run']),
+        ],
+        update_existing=False,
+    )
+
+    assert (counts['created'], counts['skipped'], counts['updated']) == (1, 1, 0)
+    assert client.writes == [('create', 'AllowRemotePeering_Acceptor')]
+
+
+def make_iam_configs(selection):
+    region = SimpleNamespace(tenancy=TENANCY, admin_group_id='ocid1.group.admin', iam_client=None)
+    return SimpleNamespace(
+        regions={'se': region, 'os': region},
+        peer_map={'se': ['os']},
+        peer_bi_map={'se': ['os'], 'os': ['se']},
+        iam=IamConfig(requests_per_second=1000, burst=100),
+        selection=selection,
+    )
+
+
+@pytest.mark.parametrize(
+    ('selection', 'full_scope'),
+    [
+        (DeploymentSelection(regions=['se', 'os'], all_regions=['se', 'os']), True),
+        # 지역 선택 또는 실패한 지역 제외로 일부 지역만 반영하는 실행
+        (DeploymentSelection(regions=['se'], all_regions=['se', 'os']), False),
+        # 피어링 스택은 제외된 지역의 정책 정리도 의도된 동작
+        (DeploymentSelection(regions=['se'], all_regions=['se', 'os'], stack_mode='peering'), True),
+    ],
+)
+def test_iam_manager_skips_update_and_prune_in_partial_runs(selection, full_scope):
+    client = FakeIdentityClient(
+        [('AllowRemotePeering_Requestor', ['statements of other regions']), ('AllowRemotePeering_Acceptor_x', [])]
+    )
+    configs = make_iam_configs(selection)
+    for region in configs.regions.values():
+        region.iam_client = client
+    iam_manager = IamManager(configs)
+
+    iam_manager.create_all_iam()
+
+    written = {name for action, name in client.writes if action in ('update', 'delete')}
+    assert iam_manager.full_scope is full_scope
+    assert bool(written) is full_scope
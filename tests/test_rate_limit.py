@@ -0,0 +1,127 @@
+import oci
+import pytest
+
+from utils import rate_limit
+from utils.rate_limit import RateLimitedClient, RateLimiterRegistry, TokenBucket, call_with_throttle_retry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, 'monotonic', fake.monotonic)
+    monkeypatch.setattr(rate_limit.time, 'sleep', fake.sleep)
+    return fake
+
+
+def throttled(retry_after=None):
+    headers = {'Retry-After': str(retry_after)} if retry_after is not None else {}
+    return oci.exceptions.ServiceError(429, 'TooManyRequests', headers, 'throttled')
+
+
+def test_bucket_allows_burst_then_paces_at_rate(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_bucket_refills_over_time_up_to_capacity(clock):
+    bucket = TokenBucket(rate=1, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60
+    bucket.acquire()
+    bucket.acquire()
+    bucket.acquire()
+
+    assert sum(clock.sleeps) == pytest.approx(1)
+
+
+def test_pause_delays_every_caller_of_the_bucket(clock):
+    bucket = TokenBucket(rate=1, capacity=5)
+
+    bucket.pause(10)
+    bucket.acquire()
+
+    assert sum(clock.sleeps) == pytest.approx(10)
+
+
+def test_registry_shares_one_bucket_per_key():
+    registry = RateLimiterRegistry(rate=1, capacity=1)
+
+    assert registry.get('tenancy-a') is registry.get('tenancy-a')
+    assert registry.get('tenancy-a') is not registry.get('tenancy-b')
+
+
+def test_throttled_call_honors_retry_after(clock):
+    bucket = TokenBucket(rate=100, capacity=1)
+    outcomes = [throttled(retry_after=7), 'ok']
+
+    def call():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert call_with_throttle_retry(call, bucket=bucket) == 'ok'
+    # Retry-After 동안 버킷을 비워 다음 acquire()가 대기
+    assert sum(clock.sleeps) == pytest.approx(7, abs=0.05)
+
+
+def test_gives_up_after_max_retries(clock):
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise throttled()
+
+    with pytest.raises(oci.exceptions.ServiceError):
+        call_with_throttle_retry(call, max_retries=2, base_delay=1)
+    assert len(calls) == 3
+
+
+def test_other_errors_are_not_retried(clock):
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise oci.exceptions.ServiceError(404, 'NotFound', {}, 'missing')
+
+    with pytest.raises(oci.exceptions.ServiceError):
+        call_with_throttle_retry(call)
+    assert len(calls) == 1
+
+
+def test_rate_limited_client_wraps_methods_only(clock):
+    class Client:
+        base_url = 'https://identity'
+
+        def get_policy(self, policy_id):
+            return f'policy {policy_id}'
+
+    bucket = TokenBucket(rate=1, capacity=1)
+    client = RateLimitedClient(Client(), bucket)
+
+    assert client.base_url == 'https://identity'
+    assert client.get_policy('p1') == 'policy p1'
+    assert client.get_policy.__name__ == 'get_policy'
+    client.get_policy('p2')
+    assert clock.sleeps == [pytest.approx(1)]
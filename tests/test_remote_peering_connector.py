@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from config import PeeringConfig
+from network.remote_peering_connection import RemotePeeringConnector
+
+TENANCIES = {'se': 'tenancy-a', 'os': 'tenancy-a', 'to': 'tenancy-b', 'sy': 'tenancy-b'}
+
+
+def make_configs(**peering):
+    regions = {
+        region: SimpleNamespace(tenancy=tenancy, region_name=f'region-{region}', virtual_network_client=None)
+        for region, tenancy in TENANCIES.items()
+    }
+    return SimpleNamespace(peering=PeeringConfig(**peering), regions=regions)
+
+
+def make_region_rpcs(peer_map):
+    region_rpcs = {region: {} for region in TENANCIES}
+    for region, peers in peer_map.items():
+        for peer in peers:
+            region_rpcs[region][peer] = f'rpc-{region}-{peer}'
+            region_rpcs[peer][region] = f'rpc-{peer}-{region}'
+    return region_rpcs
+
+
+class RecordingConnector(RemotePeeringConnector):
+    """connect_peer를 SDK 호출 없이 기록만 하는 커넥터 (scope별 최대 동시 처리 수 측정)"""
+
+    def __init__(self, *args, fail_edges=(), delay=0.02, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_edges = set(fail_edges)
+        self.delay = delay
+        self.active = Counter()
+        self.max_active = Counter()
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def connect_peer(self, virtual_network_client, region, rpc_id, peer, peer_rpc_id, peer_region_name):
+        scope = self._scope_key(region)
+        with self._lock:
+            self.calls.append((region, peer, rpc_id, peer_rpc_id, peer_region_name))
+            self.active[scope] += 1
+            self.max_active[scope] = max(self.max_active[scope], self.active[scope])
+        try:
+            time.sleep(self.delay)
+            if (region, peer) in self.fail_edges:
+                raise RuntimeError(f'cannot connect {region}-{peer}')
+            return 'connected'
+        finally:
+            with self._lock:
+                self.active[scope] -= 1
+
+
+def test_connects_every_edge_with_its_rpc_pair():
+    peer_map = {'se': ['os', 'to'], 'to': ['sy']}
+    connector = RecordingConnector(make_region_rpcs(peer_map), peer_map, make_configs(max_workers=4))
+
+    results = connector.connect_all_peers()
+
+    assert set(results) == {('se', 'os'), ('se', 'to'), ('to', 'sy')}
+    assert all(status == 'connected' and error is None for status, _, error in results.values())
+    assert ('se', 'to', 'rpc-se-to', 'rpc-to-se', 'region-to') in connector.calls
+
+
+@pytest.mark.parametrize(('limit_scope', 'per_scope_limit'), [('tenancy', 1), ('tenancy', 2), ('region', 1)])
+def test_respects_per_scope_limit(limit_scope, per_scope_limit):
+    peer_map = {'se': ['os', 'to', 'sy'], 'os': ['to', 'sy'], 'to': ['sy']}
+    configs = make_configs(max_workers=8, per_scope_limit=per_scope_limit, limit_scope=limit_scope)
+    connector = RecordingConnector(make_region_rpcs(peer_map), peer_map, configs)
+
+    connector.connect_all_peers()
+
+    assert len(connector.calls) == 6
+    assert max(connector.max_active.values()) <= per_scope_limit
+
+
+def test_collects_failures_per_edge_and_raises_once():
+    peer_map = {'se': ['os', 'to'], 'to': ['sy']}
+    connector = RecordingConnector(
+        make_region_rpcs(peer_map), peer_map, make_configs(max_workers=2), fail_edges={('se', 'os')}
+    )
+
+    with pytest.raises(RuntimeError, match=r'Failed to connect 1 peering edge\(s\): se->os'):
+        connector.connect_all_peers()
+    # 실패한 엣지가 있어도 나머지 엣지는 모두 처리됨
+    assert {(region, peer) for region, peer, *_ in connector.calls} == {('se', 'os'), ('se', 'to'), ('to', 'sy')}
+
+
+def test_prepares_iam_of_both_tenancies_before_connecting():
+    peer_map = {'se': ['os', 'to']}
+    iam_manager = SimpleNamespace(ready=[])
+    iam_manager.ensure_tenancy_iam = iam_manager.ready.append
+    connector = RecordingConnector(make_region_rpcs(peer_map), peer_map, make_configs(), iam_manager=iam_manager)
+
+    connector.connect_all_peers()
+
+    # 같은 테넌시의 엣지는 테넌시를 한 번만 요청 (실제 1회 실행은 IamManager가 보장)
+    assert Counter(iam_manager.ready) == {'tenancy-a': 2, 'tenancy-b': 1}
+
+
+def test_no_edges_returns_empty_result():
+    assert RecordingConnector({}, {}, make_configs()).connect_all_peers() == {}
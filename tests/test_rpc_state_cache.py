@@ -0,0 +1,127 @@
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from config import PeeringConfig
+from network.remote_peering_connection import RemotePeeringConnector, connect_remote_peering_connection
+from network.rpc_state_cache import RpcStateCache
+
+
+def rpc(rpc_id, peer_id=None, peering_status='NEW', lifecycle_state='AVAILABLE'):
+    return SimpleNamespace(id=rpc_id, peer_id=peer_id, peering_status=peering_status, lifecycle_state=lifecycle_state)
+
+
+class FakeVirtualNetworkClient:
+    """list_remote_peering_connections를 페이지 단위로 응답하고 호출 수를 기록하는 가짜 클라이언트"""
+
+    def __init__(self, rpcs, page_size=2, fail_times=0):
+        self.rpcs = rpcs
+        self.page_size = page_size
+        self.fail_times = fail_times
+        self.list_calls = []
+        self.get_calls = Counter()
+
+    def list_remote_peering_connections(self, page=None, **kwargs):
+        self.list_calls.append({**kwargs, 'page': page})
+        if self.fail_times:
+            self.fail_times -= 1
+            raise ValueError('list failed')
+        start = int(page or 0)
+        end = start + self.page_size
+        return SimpleNamespace(
+            data=self.rpcs[start:end],
+            has_next_page=end < len(self.rpcs),
+            next_page=str(end),
+            status=200,
+            headers={},
+            request=None,
+        )
+
+    def get_remote_peering_connection(self, rpc_id):
+        self.get_calls[rpc_id] += 1
+        raise AssertionError(f'unexpected get_remote_peering_connection({rpc_id})')
+
+
+def test_prefetch_follows_pages_and_indexes_by_id():
+    client = FakeVirtualNetworkClient([rpc(f'rpc-{index}') for index in range(5)])
+    cache = RpcStateCache()
+
+    cache.prefetch(client, 'compartment-1')
+
+    assert [call['page'] for call in client.list_calls] == [None, '2', '4']
+    assert cache.get('rpc-4').id == 'rpc-4'
+    assert cache.get('rpc-missing') is None
+
+
+def test_prefetch_lists_each_compartment_and_drg_once():
+    client = FakeVirtualNetworkClient([rpc('rpc-1')])
+    cache = RpcStateCache()
+
+    for _ in range(3):
+        cache.prefetch(client, 'compartment-1')
+    cache.prefetch(client, 'compartment-1', drg_id='drg-1')
+
+    assert [call.get('drg_id') for call in client.list_calls] == [None, 'drg-1']
+
+
+def test_failed_prefetch_can_be_retried():
+    client = FakeVirtualNetworkClient([rpc('rpc-1')], fail_times=1)
+    cache = RpcStateCache()
+
+    with pytest.raises(ValueError, match='list failed'):
+        cache.prefetch(client, 'compartment-1')
+    cache.prefetch(client, 'compartment-1')
+
+    assert cache.get('rpc-1') is not None
+
+
+def test_update_replaces_snapshot_entry():
+    cache = RpcStateCache()
+    cache.update(rpc('rpc-1', peering_status='PENDING'))
+    cache.update(rpc('rpc-1', peering_status='PEERED'))
+
+    assert cache.get('rpc-1').peering_status == 'PEERED'
+
+
+def test_peered_rpc_in_snapshot_needs_no_get_call():
+    client = FakeVirtualNetworkClient([])
+
+    status = connect_remote_peering_connection(
+        client, 'rpc-1', 'rpc-2', 'ap-osaka-1', rpc_details=rpc('rpc-1', 'rpc-2', 'PEERED')
+    )
+
+    assert status == 'already-peered'
+    assert not client.get_calls
+
+
+def test_steady_state_peering_uses_one_list_call_per_region():
+    peer_map = {'se': ['os', 'to'], 'os': ['to']}
+    region_rpcs = {region: {} for region in ('se', 'os', 'to')}
+    for region, peers in peer_map.items():
+        for peer in peers:
+            region_rpcs[region][peer] = f'rpc-{region}-{peer}'
+            region_rpcs[peer][region] = f'rpc-{peer}-{region}'
+    clients = {
+        region: FakeVirtualNetworkClient(
+            [rpc(rpc_id, region_rpcs[peer][region], 'PEERED') for peer, rpc_id in region_rpcs[region].items()]
+        )
+        for region in region_rpcs
+    }
+    configs = SimpleNamespace(
+        peering=PeeringConfig(max_workers=4),
+        regions={
+            region: SimpleNamespace(tenancy='tenancy-a', region_name=f'region-{region}', virtual_network_client=client)
+            for region, client in clients.items()
+        },
+    )
+    connector = RemotePeeringConnector(
+        region_rpcs, peer_map, configs, region_compartments={region: f'compartment-{region}' for region in clients}
+    )
+
+    results = connector.connect_all_peers()
+
+    assert {status for status, _, _ in results.values()} == {'already-peered'}
+    # 요청 측 지역(se, os)마다 list 1회, 엣지별 get 호출 없음
+    assert {region: len(client.list_calls) for region, client in clients.items()} == {'se': 1, 'os': 1, 'to': 0}
+    assert not any(client.get_calls for client in clients.values())
@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+
+import pytest
+
+from network.security_rules import (
+    ALL,
+    ANYWHERE,
+    CIDR_BLOCK,
+    EGRESS,
+    ICMP,
+    INGRESS,
+    K8S_API_SECURITY_RULES,
+    NODE_SECURITY_RULES,
+    NODE_SUBNET,
+    PATH_DISCOVERY,
+    PEERS,
+    TCP,
+    RuleSpec,
+    SecurityRule,
+    SecurityRuleCompiler,
+    to_args,
+)
+
+CONFIG = SimpleNamespace(
+    node_subnet_cidr_block='10.0.10.0/24',
+    k8s_api_subnet_cidr_block='10.0.0.0/28',
+    service_cidr='all-icn-services-in-oracle-services-network',
+)
+REGIONS = {
+    'os': SimpleNamespace(vcn_cidr_block='10.1.0.0/16'),
+    'to': SimpleNamespace(vcn_cidr_block='10.2.0.0/16'),
+}
+
+
+def compiler(peers=('os', 'to'), regions=REGIONS):
+    return SecurityRuleCompiler('se', CONFIG, regions, peers)
+
+
+def rule(cidr, protocol=ALL, direction=INGRESS, **kwargs):
+    return SecurityRule(direction=direction, cidr=cidr, cidr_type=CIDR_BLOCK, protocol=protocol, **kwargs)
+
+
+def test_identical_rules_are_dropped_keeping_the_first_description():
+    specs = (
+        RuleSpec(INGRESS, NODE_SUBNET, TCP, ports=(22, 22), description='first'),
+        RuleSpec(INGRESS, NODE_SUBNET, TCP, ports=(22, 22), description='second'),
+    )
+
+    compiled = compiler().compile('test', specs)
+
+    assert compiled.duplicates == 1
+    assert [rule.description for rule in compiled.ingress] == ['first']
+
+
+def test_rules_covered_by_broader_rules_are_kept():
+    compiled = compiler().compile('node', NODE_SECURITY_RULES)
+
+    # 0.0.0.0/0 egress 등에 가려지는 규칙도 선언된 그대로 유지
+    assert (compiled.duplicates, compiled.shadowed) == (0, 7)
+    assert (len(compiled.ingress), len(compiled.egress)) == (6, 9)
+    assert any(r.cidr == '10.0.0.0/28' and r.ports == (6443, 6443) for r in compiled.egress)
+
+
+def test_k8s_api_rules_compile_without_duplicates():
+    compiled = compiler().compile('k8s-api', K8S_API_SECURITY_RULES)
+
+    assert (compiled.duplicates, compiled.shadowed) == (0, 1)
+    assert (len(compiled.ingress), len(compiled.egress)) == (4, 3)
+
+
+def test_output_does_not_depend_on_peer_order():
+    forward = compiler(peers=['os', 'to']).compile('node', NODE_SECURITY_RULES)
+    backward = compiler(peers=['to', 'os']).compile('node', NODE_SECURITY_RULES)
+
+    assert forward == backward
+    assert [r.description for r in forward.ingress if r.cidr in ('10.1.0.0/16', '10.2.0.0/16')] == [
+        'Allow communication with peer os',
+        'Allow communication with peer to',
+    ]
+
+
+def test_rejects_more_rules_than_the_per_direction_limit():
+    regions = {f'p{i}': SimpleNamespace(vcn_cidr_block=f'10.{i // 256}.{i % 256}.0/24') for i in range(250)}
+
+    with pytest.raises(ValueError, match=r'has 2\d\d ingress rules \(limit 200 per direction\)'):
+        compiler(peers=list(regions), regions=regions).compile('node', (RuleSpec(INGRESS, PEERS, ALL),))
+
+
+def test_expand_creates_one_rule_per_peer():
+    rules = compiler().expand(RuleSpec(EGRESS, PEERS, ALL, description='to {peer}'))
+
+    assert [(r.cidr, r.description) for r in rules] == [('10.1.0.0/16', 'to os'), ('10.2.0.0/16', 'to to')]
+    assert compiler().expand(RuleSpec(INGRESS, ANYWHERE, TCP, ports=(22, 22)))[0].cidr == '0.0.0.0/0'
+
+
+@pytest.mark.parametrize(
+    ('broader', 'narrower', 'covers'),
+    [
+        (rule('0.0.0.0/0'), rule('10.1.0.0/16', TCP, ports=(22, 22)), True),
+        (rule('10.1.0.0/16', TCP), rule('10.1.2.0/24', TCP, ports=(443, 443)), True),
+        (rule('10.1.0.0/16', TCP, ports=(1, 1024)), rule('10.1.0.0/16', TCP, ports=(443, 443)), True),
+        (rule('10.1.0.0/16', TCP, ports=(443, 443)), rule('10.1.0.0/16', TCP), False),
+        (rule('10.1.0.0/16', ICMP), rule('10.1.0.0/16', ICMP, icmp=PATH_DISCOVERY), True),
+        (rule('10.1.0.0/16', ICMP, icmp=(3, None)), rule('10.1.0.0/16', ICMP, icmp=PATH_DISCOVERY), True),
+        (rule('10.1.0.0/16', ICMP, icmp=PATH_DISCOVERY), rule('10.1.0.0/16', ICMP, icmp=(3, None)), False),
+        (rule('10.1.0.0/16', TCP), rule('10.1.0.0/16', ICMP), False),
+        (rule('10.1.0.0/24'), rule('10.1.0.0/16'), False),
+        # 방향 또는 stateless 여부가 다르면 비교하지 않음
+        (rule('0.0.0.0/0'), rule('10.1.0.0/16', direction=EGRESS), False),
+        (rule('0.0.0.0/0'), rule('10.1.0.0/16', stateless=True), False),
+    ],
+)
+def test_covers(broader, narrower, covers):
+    assert broader.covers(narrower) is covers
+
+
+def test_to_args_is_built_once_per_rule():
+    tcp_rule = rule('10.1.0.0/16', TCP, ports=(443, 443), description='https')
+
+    args = to_args(tcp_rule)
+
+    assert to_args(rule('10.1.0.0/16', TCP, ports=(443, 443), description='https')) is args
+    assert (args.source, args.protocol, args.tcp_options.min) == ('10.1.0.0/16', TCP, 443)
+    assert to_args(rule('10.1.0.0/16', ICMP, EGRESS, icmp=PATH_DISCOVERY)).destination == '10.1.0.0/16'
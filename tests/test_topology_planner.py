@@ -0,0 +1,53 @@
+import pytest
+
+from config.topology_planner import TopologyPlanner
+
+ALL_REGIONS = ['se', 'os', 'to', 'sy']
+
+
+@pytest.mark.parametrize(
+    ('topology', 'edges'),
+    [
+        ({'mode': 'mesh'}, 6),
+        ({'mode': 'hub_spoke', 'hub': 'se'}, 3),
+        ({'mode': 'ring'}, 4),
+        ({'mode': 'ring', 'regions': ['se', 'os']}, 1),
+    ],
+)
+def test_topology_modes_expand_to_minimal_edges(topology, edges):
+    plan = TopologyPlanner(ALL_REGIONS, topology).plan()
+
+    assert plan.edge_count == edges
+    assert plan.rpc_count == 2 * edges
+    # 모든 엣지는 양방향 피어 맵에 양쪽 모두 기록
+    for region, peers in plan.peer_map.items():
+        for peer in peers:
+            assert peer in plan.peer_bi_map[region] and region in plan.peer_bi_map[peer]
+
+
+def test_hub_spoke_connects_spokes_to_the_hub_only():
+    plan = TopologyPlanner(ALL_REGIONS, {'mode': 'hub_spoke', 'hub': 'to'}).plan()
+
+    assert plan.peer_map == {'se': ['to'], 'os': ['to'], 'sy': ['to']}
+    assert plan.drg_count == 4
+
+
+def test_custom_topology_uses_peer_map_and_drops_duplicates():
+    plan = TopologyPlanner(ALL_REGIONS, peer_map={'se': ['os', 'os', 'se'], 'sy': []}).plan()
+
+    assert plan.mode == 'custom'
+    assert plan.peer_map == {'se': ['os']}
+    assert plan.peer_bi_map['sy'] == []
+
+
+@pytest.mark.parametrize(
+    ('topology', 'message'),
+    [
+        ({'mode': 'star'}, 'Invalid topology mode'),
+        ({'mode': 'hub_spoke', 'hub': 'xx'}, 'requires a hub region'),
+        ({'mode': 'mesh', 'regions': ['se', 'xx']}, 'Unknown regions in topology'),
+    ],
+)
+def test_invalid_topologies_are_rejected(topology, message):
+    with pytest.raises(ValueError, match=message):
+        TopologyPlanner(ALL_REGIONS, topology).plan()
@@ -0,0 +1,75 @@
+import pytest
+
+from utils import waiter
+from utils.waiter import wait_until
+
+
+class FakeClock:
+    """time.monotonic/time.sleep 대체 (sleep은 시계만 진행)"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(waiter.time, 'monotonic', fake.monotonic)
+    monkeypatch.setattr(waiter.time, 'sleep', fake.sleep)
+    return fake
+
+
+def sequence(*values):
+    iterator = iter(values)
+    return lambda: next(iterator)
+
+
+def test_returns_first_value_without_sleeping(clock):
+    assert wait_until(lambda: 'AVAILABLE', lambda state: state == 'AVAILABLE') == 'AVAILABLE'
+    assert clock.sleeps == []
+
+
+def test_polls_with_exponential_backoff_until_ready(clock):
+    fetch = sequence('PROVISIONING', 'PROVISIONING', 'PROVISIONING', 'AVAILABLE')
+
+    result = wait_until(fetch, lambda state: state == 'AVAILABLE', initial_delay=1, backoff=2, jitter=0)
+
+    assert result == 'AVAILABLE'
+    assert clock.sleeps == [1, 2, 4]
+
+
+def test_delay_is_capped_and_jittered(clock):
+    fetch = sequence(*['PENDING'] * 6, 'PEERED')
+
+    wait_until(fetch, lambda state: state == 'PEERED', initial_delay=2, max_delay=5, backoff=3, jitter=0.2)
+
+    assert len(clock.sleeps) == 6
+    assert 1.6 <= clock.sleeps[0] <= 2.4
+    assert all(seconds <= 5 for seconds in clock.sleeps)
+
+
+def test_failed_state_stops_waiting(clock):
+    fetch = sequence('PENDING', 'REVOKED', 'PEERED')
+
+    with pytest.raises(RuntimeError, match='RPC rpc-1 reached a failed state'):
+        wait_until(
+            fetch,
+            lambda state: state == 'PEERED',
+            is_failed=lambda state: state == 'REVOKED',
+            description='RPC rpc-1',
+        )
+
+
+def test_times_out_at_deadline(clock):
+    with pytest.raises(TimeoutError, match=r'still not ready after 10s'):
+        wait_until(lambda: 'PENDING', lambda state: state == 'PEERED', timeout=10, jitter=0)
+    # 마지막 대기는 남은 시간으로 줄어들어 기한을 넘기지 않음
+    assert sum(clock.sleeps) == pytest.approx(10)
@@ -0,0 +1,180 @@
+import atexit
+import contextvars
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 예외에 첨부하는 컨텍스트 속성 이름 / 보고 완료 표시
+ERROR_CONTEXT_ATTR = 'oke_error_context'
+REPORTED_ATTR = 'oke_error_reported'
+
+# apply_exception_handler가 매니저 클래스에 남기는 표시 (traceback에서 매니저/단계 식별용)
+MANAGER_MARKER = '__oke_error_context_manager__'
+
+_error_context = contextvars.ContextVar('error_context', default=None)
+
+
+def current_error_context():
+    """현재 실행 중인 코드의 컨텍스트 (region, layer 등)"""
+    return dict(_error_context.get() or {})
+
+
+def annotate_error(error, **fields):
+    """
+    예외에 컨텍스트 필드를 첨부. 이미 있는 필드는 유지하므로 가장 안쪽(먼저 첨부한) 값이 남는다.
+    정상 경로에는 비용이 없도록 예외가 발생한 경우에만 호출한다.
+    """
+    context = getattr(error, ERROR_CONTEXT_ATTR, None)
+    if context is None:
+        context = {}
+        try:
+            setattr(error, ERROR_CONTEXT_ATTR, context)
+        except AttributeError:
+            return error
+    for key, value in fields.items():
+        if value is not None:
+            context.setdefault(key, value)
+    return error
+
+
+@contextmanager
+def error_context(**fields):
+    """with 블록 안에서 발생한 예외에 fields(region, layer 등)를 첨부"""
+    token = _error_context.set({**(_error_context.get() or {}), **fields})
+    try:
+        yield
+    except Exception as e:
+        annotate_error(e, **_error_context.get())
+        raise
+    finally:
+        _error_context.reset(token)
+
+
+def _manager_frame(error):
+    """traceback에서 예외가 발생한 가장 안쪽 매니저 메서드의 (manager, step, region)"""
+    found = None
+    traceback = error.__traceback__
+    while traceback is not None:
+        frame = traceback.tb_frame
+        instance = frame.f_locals.get('self')
+        if instance is not None and getattr(type(instance), MANAGER_MARKER, False):
+            found = (type(instance).__name__, frame.f_code.co_name, getattr(instance, 'region', None))
+        traceback = traceback.tb_next
+    return found
+
+
+@dataclass
+class ErrorEntry:
+    region: str | None
+    manager: str | None
+    step: str | None
+    error: str
+    context: dict = field(default_factory=dict)
+
+    @property
+    def location(self):
+        step = '.'.join(part for part in (self.manager, self.step) if part)
+        return f'{self.region or "-"}/{step or self.context.get("layer") or "-"}'
+
+
+def describe_error(error):
+    """예외의 컨텍스트와 traceback으로 ErrorEntry 생성"""
+    context = dict(getattr(error, ERROR_CONTEXT_ATTR, None) or {})
+    manager, step, region = _manager_frame(error) or (None, None, None)
+    return ErrorEntry(
+        region=context.pop('region', None) or region,
+        manager=manager,
+        step=step or context.pop('step', None),
+        error=f'{type(error).__name__}: {error}',
+        context=context,
+    )
+
+
+class ErrorReport:
+    """실행 중 발생한 오류를 모아 실행이 끝날 때 지역별로 한 번에 보고"""
+
+    def __init__(self):
+        self._entries = []
+        self._reported = 0
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self):
+        with self._lock:
+            return list(self._entries)
+
+    def record(self, error):
+        entry = describe_error(error)
+        with self._lock:
+            self._entries.append(entry)
+        return entry
+
+    def failed_regions(self):
+        return sorted({entry.region for entry in self.entries if entry.region})
+
+    def log_report(self):
+        """아직 보고하지 않은 오류를 지역별 테이블로 로깅"""
+        with self._lock:
+            entries, self._reported = self._entries[self._reported :], len(self._entries)
+        if not entries:
+            return
+        logger.error(f'{"-" * 30} Error Report ({len(entries)} error(s)) {"-" * 30}')
+        logger.error(f'{"region":<12}{"step":<56}error')
+        for entry in sorted(entries, key=lambda entry: (entry.region or '', entry.location)):
+            step = entry.location.split('/', 1)[1]
+            extra = ', '.join(f'{key}={value}' for key, value in sorted(entry.context.items()))
+            logger.error(f'{entry.region or "-":<12}{step:<56}{entry.error}' + (f' ({extra})' if extra else ''))
+
+    def raise_if_failed(self):
+        """기록된 오류가 있으면 하나의 예외로 실행 실패 처리"""
+        entries = self.entries
+        if entries:
+            regions = self.failed_regions()
+            raise RuntimeError(
+                f'{len(entries)} error(s) during deployment'
+                + (f' in region(s): {", ".join(regions)}' if regions else '')
+                + '. See the error report above.'
+            )
+
+
+@contextmanager
+def error_boundary(reraise=False, **fields):
+    """
+    오류 경계: 블록 안의 예외를 한 번만 (traceback 포함) 로깅하고 error_report에 기록.
+    reraise=False이면 예외를 삼켜 다른 지역의 처리를 계속하고, 실패는 run 종료 시 한 번에 보고한다.
+    """
+    try:
+        with error_context(**fields):
+            yield
+    except Exception as e:
+        # 안쪽 경계에서 이미 보고된 예외는 다시 로깅하지 않음
+        if not getattr(e, REPORTED_ATTR, False):
+            entry = error_report.record(e)
+            logger.error(f'Failed at {entry.location}: {entry.error}', exc_info=e)
+            try:
+                setattr(e, REPORTED_ATTR, True)
+            except AttributeError:
+                pass
+        if reraise:
+            raise
+
+
+def with_error_boundary(func, **fields):
+    """apply 콜백 등을 오류 경계로 감싼 함수 (예외는 기록 후 다시 발생)"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with error_boundary(reraise=True, **fields):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+error_report = ErrorReport()
+# apply 콜백 등 프로그램 종료 후 발생한 오류도 프로세스 종료 시 한 번에 보고
+atexit.register(error_report.log_report)
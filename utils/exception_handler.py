@@ -1,28 +1,13 @@
-import logging
-from functools import wraps
-
-# Use the global logger
-logger = logging.getLogger('global_logger')
-
-
-def handle_exceptions(func):
-    """Decorator to handle exceptions and log them."""
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            # Log the error with stack trace
-            logger.error(f'Error in {func.__name__}: {e}', exc_info=True)
-            raise
-
-    return wrapper
+from utils.error_context import MANAGER_MARKER
 
 
 def apply_exception_handler(cls):
-    """Class decorator to apply exception handler to all methods in a class."""
-    for attr_name, attr_value in cls.__dict__.items():
-        if callable(attr_value) and not attr_name.startswith('__'):
-            setattr(cls, attr_name, handle_exceptions(attr_value))
+    """
+    Class decorator marking a manager class for error reporting.
+
+    메서드를 감싸지 않으므로 호출 비용이 없다. 예외는 오류 경계(utils.error_context.error_boundary)에서
+    한 번만 로깅되며, 이때 traceback에서 이 표시가 있는 가장 안쪽 매니저의 클래스/메서드/region을 찾아
+    오류 위치로 보고한다.
+    """
+    setattr(cls, MANAGER_MARKER, True)
     return cls
@@ -1,14 +1,154 @@
+import atexit
+import collections
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+ROOT_LOGGER_NAME = 'global_logger'
+
+# 로깅 설정 환경 변수 (로거는 import 시점에 구성되므로 Pulumi config 대신 환경 변수만 사용)
+LOG_LEVEL_ENV_VAR = 'OKE_LOG_LEVEL'  # 전체 레벨 (기본값: INFO)
+LOG_LEVELS_ENV_VAR = 'OKE_LOG_LEVELS'  # 모듈별 레벨 (예: network=DEBUG,iam.policy_reconciler=WARNING)
+LOG_FORMAT_ENV_VAR = 'OKE_LOG_FORMAT'  # text(기본값) 또는 json (JSON lines)
+LOG_QUIET_ENV_VAR = 'OKE_LOG_QUIET'  # 1이면 리소스별 로그를 종료 시 개수 요약으로 대체
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드 1개를 JSON 객체 한 줄로 출력"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    레코드를 포맷하지 않고 그대로 큐에 넣는 QueueHandler.
+    (기본 QueueHandler.prepare()는 호출 스레드에서 메시지를 포맷함)
+    메시지 포맷과 파일/콘솔 I/O는 모두 QueueListener 스레드에서 수행된다.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class ResourceLogCounter:
+    """quiet 모드에서 리소스별 로그 대신 (이벤트, 리소스 타입)별 개수를 집계"""
+
+    def __init__(self):
+        self._counts = collections.Counter()
+        self._lock = threading.Lock()
+
+    def add(self, event, resource_type):
+        with self._lock:
+            self._counts[(event, resource_type)] += 1
+
+    def summary(self):
+        """이벤트별 'Type=count' 요약 문자열 목록"""
+        with self._lock:
+            counts = dict(self._counts)
+        events = {}
+        for (event, resource_type), count in sorted(counts.items()):
+            events.setdefault(event, []).append(f'{resource_type}={count}')
+        return [f'{event}: {", ".join(items)}' for event, items in events.items()]
+
+
+_listener = None
+_quiet = False
+resource_log_counter = ResourceLogCounter()
+
+
+def _parse_module_levels(value):
+    """'network=DEBUG,iam=WARNING' 형식의 모듈별 레벨 설정"""
+    levels = {}
+    for item in (value or '').split(','):
+        module, _, level = item.partition('=')
+        if module.strip() and level.strip():
+            levels[module.strip()] = level.strip().upper()
+    return levels
+
+
+def _valid_level(level):
+    """logging 레벨 이름이면 대문자 이름, 아니면 None"""
+    level = level.strip().upper()
+    return level if level in logging.getLevelNamesMapping() else None
+
+
+def _apply_levels(logger, default_level):
+    """
+    OKE_LOG_LEVEL/OKE_LOG_LEVELS 적용. 잘못된 레벨 이름은 import 시점에 실패하지 않도록 건너뛴다.
+
+    Returns:
+        list[str]: 건너뛴 설정값
+    """
+    invalid = []
+    level = os.getenv(LOG_LEVEL_ENV_VAR, '')
+    if level.strip() and _valid_level(level) is None:
+        invalid.append(f'{LOG_LEVEL_ENV_VAR}={level}')
+    logger.setLevel(_valid_level(level) or default_level)
+    for module, module_level in _parse_module_levels(os.getenv(LOG_LEVELS_ENV_VAR)).items():
+        if _valid_level(module_level) is None:
+            invalid.append(f'{LOG_LEVELS_ENV_VAR}: {module}={module_level}')
+            continue
+        logger.getChild(module).setLevel(module_level)
+    return invalid
+
+
+def _warn_invalid_levels(logger, invalid):
+    if invalid:
+        logger.warning(
+            f'Ignoring invalid log level(s) {", ".join(invalid)}; '
+            f'valid levels: {", ".join(logging.getLevelNamesMapping())}'
+        )
+
+
+def _shutdown():
+    """프로세스 종료 시 quiet 모드 요약을 남기고 큐에 남은 레코드를 모두 기록"""
+    if _quiet:
+        logger = logging.getLogger(ROOT_LOGGER_NAME)
+        for line in resource_log_counter.summary():
+            logger.info(f'Resources {line}')
+    if _listener is not None:
+        _listener.stop()
 
 
 # Create a global logger
 def setup_global_logger(log_file='app.log', level=logging.INFO):
-    """Set up a global logger."""
-    logger = logging.getLogger('global_logger')
-    logger.setLevel(level)
+    """
+    Set up a global logger.
+
+    로거에는 QueueHandler만 붙이고, 파일/콘솔 핸들러는 별도 스레드의 QueueListener에서 실행하여
+    Pulumi 엔진 콜백 스레드가 로그 I/O를 기다리지 않도록 한다.
+    """
+    global _listener, _quiet
+
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    invalid_levels = _apply_levels(logger, level)
+    _quiet = os.getenv(LOG_QUIET_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+
+    # Add handlers to the logger if not already added
+    if logger.handlers:
+        _warn_invalid_levels(logger, invalid_levels)
+        return logger
 
     # Formatter for log messages
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if os.getenv(LOG_FORMAT_ENV_VAR, 'text').lower() == 'json':
+        formatter = JsonLinesFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
 
     # File handler for logging to a file
     file_handler = logging.FileHandler(log_file)
@@ -18,12 +158,39 @@ def setup_global_logger(log_file='app.log', level=logging.INFO):
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
-    # Add handlers to the logger if not already added
-    if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_shutdown)
 
+    # 핸들러를 붙인 뒤에 경고해야 콘솔/파일에 기록됨
+    _warn_invalid_levels(logger, invalid_levels)
     return logger
 
 
+def get_logger(name=None):
+    """
+    모듈별 로거 (global_logger의 하위 로거, 예: global_logger.network.vcn).
+    OKE_LOG_LEVELS로 모듈(패키지) 단위 레벨을 지정할 수 있다.
+    """
+    return global_logger.getChild(name) if name else global_logger
+
+
+def quiet_mode():
+    """리소스별 로그를 개수 요약으로 대체하는 quiet 모드 여부 (OKE_LOG_QUIET)"""
+    return _quiet
+
+
+def log_resource_event(logger, event, resource_type, message, *args):
+    """
+    리소스별 로그 (Creating/created 등). quiet 모드에서는 출력하지 않고 개수만 집계한다.
+    message는 logging의 %-형식 (args는 레벨이 활성화된 경우에만 리스너 스레드에서 포맷됨)
+    """
+    if _quiet:
+        resource_log_counter.add(event, resource_type)
+    else:
+        logger.info(message, *args)
+
+
 global_logger = setup_global_logger()
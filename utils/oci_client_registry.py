@@ -0,0 +1,169 @@
+import configparser
+import os
+import threading
+
+from utils.logger import get_logger
+from utils.tracing import instrument_client
+
+logger = get_logger(__name__)
+
+# oci.config와 같은 기본 경로/대체 경로 (SDK import 없이 프로파일을 로드하기 위함)
+DEFAULT_CONFIG_FILE = '~/.oci/config'
+FALLBACK_CONFIG_FILE = '~/.oraclebmc/config'
+CONFIG_FILE_ENV_VAR = 'OCI_CONFIG_FILE'
+
+# oci.config.DEFAULT_CONFIG과 동일한 기본값
+DEFAULT_PROFILE_VALUES = {
+    'log_requests': False,
+    'additional_user_agent': '',
+    'pass_phrase': None,
+}
+
+# oci.config.CONFIG_FILE_BLACKLISTED_KEYS: 보안상 config 파일에 둘 수 없는 키
+BLACKLISTED_KEYS = ('key_content',)
+
+_TRUE_VALUES = ('1', 'yes', 'true', 'on')
+_FALSE_VALUES = ('0', 'no', 'false', 'off')
+
+
+def resolve_config_file(config_file=DEFAULT_CONFIG_FILE):
+    """
+    OCI config 파일 경로 (oci.config.from_file과 같은 순서).
+    기본 경로가 지정되었는데 파일이 없으면 OCI_CONFIG_FILE, ~/.oraclebmc/config 순으로 대체한다.
+    """
+    expanded = os.path.expanduser(config_file)
+    if config_file != DEFAULT_CONFIG_FILE or os.path.isfile(expanded):
+        return expanded
+    if os.getenv(CONFIG_FILE_ENV_VAR):
+        return os.path.expanduser(os.environ[CONFIG_FILE_ENV_VAR])
+    fallback = os.path.expanduser(FALLBACK_CONFIG_FILE)
+    return fallback if os.path.isfile(fallback) else expanded
+
+
+def _as_bool(value):
+    if isinstance(value, bool):
+        return value
+    if value.lower() in _TRUE_VALUES:
+        return True
+    if value.lower() in _FALSE_VALUES:
+        return False
+    raise ValueError(f'{value!r} is not a valid alias for True/False')
+
+
+def parse_profile(parser, config_file, profile):
+    """
+    configparser로 읽은 OCI config에서 프로파일 1개를 oci.config.from_file과 같은 규칙으로 변환.
+    (DEFAULT 섹션 병합, 금지 키 검사, key_file 경로 검사)
+    """
+    if profile not in parser:
+        raise ValueError(f'Profile {profile} not found in OCI config file: {config_file}')
+    config = {**DEFAULT_PROFILE_VALUES, **dict(parser[profile])}
+    config['log_requests'] = _as_bool(config['log_requests'])
+    for key in BLACKLISTED_KEYS:
+        if key in config:
+            raise ValueError(
+                f"'{key}' cannot be specified in a config file for security reasons "
+                f'(profile {profile} in {config_file})'
+            )
+    if 'key_file' in config and not os.path.isfile(os.path.expanduser(config['key_file'])):
+        raise ValueError(
+            f"Config file {config_file} is invalid: the key_file's value '{config['key_file']}' "
+            f'of profile {profile} must be a valid file path'
+        )
+    return config
+
+
+class OciClientRegistry:
+    """
+    프로파일/서비스 단위로 OCI SDK 클라이언트를 공유하는 레지스트리.
+
+    ~/.oci/config 파일은 SDK 없이 한 번만 파싱하고 (프로그램 시작 시 모든 지역의 프로파일을 읽으므로),
+    클라이언트는 처음 요청될 때 생성하여 이후 호출에서 같은 인스턴스(와 HTTP 세션)를 재사용한다.
+    oci SDK는 import 비용이 크므로 클라이언트를 실제로 생성하는 시점에 로드한다.
+    """
+
+    def __init__(self, config_file=DEFAULT_CONFIG_FILE):
+        self.config_file = config_file
+        self._parser = None
+        self._configs = {}
+        self._clients = {}
+        self._lock = threading.RLock()
+
+    def _read_config_file(self):
+        """OCI config 파일 전체를 한 번만 읽음 (lock 내부에서 호출)"""
+        if self._parser is None:
+            config_file = resolve_config_file(self.config_file)
+            parser = configparser.ConfigParser(interpolation=None)
+            if not parser.read(config_file):
+                raise FileNotFoundError(f'OCI config file not found at: {config_file}')
+            self._parser = (config_file, parser)
+        return self._parser
+
+    def get_config(self, profile):
+        """
+        프로파일의 OCI config를 반환 (프로파일당 최초 1회만 변환).
+        oci.config.from_file과 같은 대체 경로, 금지 키, key_file 경로 검사를 SDK import 없이 수행한다.
+        """
+        config = self._configs.get(profile)
+        if config is None:
+            with self._lock:
+                config = self._configs.get(profile)
+                if config is None:
+                    config_file, parser = self._read_config_file()
+                    config = parse_profile(parser, config_file, profile)
+                    self._configs[profile] = config
+        return config
+
+    def get_client(self, profile, client_class):
+        """(프로파일, 서비스) 단위로 캐시된 SDK 클라이언트를 반환"""
+        key = (profile, client_class.__name__)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    logger.info(f'Creating {client_class.__name__} for profile: {profile}')
+                    # 트레이싱이 켜져 있으면 API 호출마다 span 기록
+                    client = instrument_client(client_class(self.get_config(profile)), profile)
+                    self._clients[key] = client
+        return client
+
+    def identity_client(self, profile):
+        import oci as oci_sdk  # type: ignore
+
+        return self.get_client(profile, oci_sdk.identity.IdentityClient)
+
+    def virtual_network_client(self, profile):
+        import oci as oci_sdk  # type: ignore
+
+        return self.get_client(profile, oci_sdk.core.VirtualNetworkClient)
+
+    def network_load_balancer_client(self, profile):
+        import oci as oci_sdk  # type: ignore
+
+        return self.get_client(profile, oci_sdk.network_load_balancer.NetworkLoadBalancerClient)
+
+    def load_balancer_client(self, profile):
+        import oci as oci_sdk  # type: ignore
+
+        return self.get_client(profile, oci_sdk.load_balancer.LoadBalancerClient)
+
+    def compute_client(self, profile):
+        import oci as oci_sdk  # type: ignore
+
+        return self.get_client(profile, oci_sdk.core.ComputeClient)
+
+    def container_engine_client(self, profile):
+        import oci as oci_sdk  # type: ignore
+
+        return self.get_client(profile, oci_sdk.container_engine.ContainerEngineClient)
+
+    def clear(self):
+        """캐시된 config와 클라이언트를 모두 제거"""
+        with self._lock:
+            self._parser = None
+            self._configs.clear()
+            self._clients.clear()
+
+
+oci_client_registry = OciClientRegistry()
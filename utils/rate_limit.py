@@ -0,0 +1,126 @@
+import random
+import threading
+import time
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+THROTTLED_STATUS = 429
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 쌓이는 토큰 버킷.
+    acquire()는 토큰이 생길 때까지 호출 스레드를 대기시킨다.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = max(float(rate), 0.001)
+        self.capacity = max(float(capacity or rate), 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """토큰 1개 사용 (없으면 대기)"""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self.rate
+            time.sleep(wait_seconds)
+
+    def pause(self, seconds):
+        """서버가 요청한 대기 시간 동안 같은 버킷을 쓰는 모든 호출을 늦춤"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0) - seconds * self.rate + 1
+
+
+class RateLimiterRegistry:
+    """키(테넌시 등)별 TokenBucket 저장소"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket(self.rate, self.capacity)
+            return self._buckets[key]
+
+
+def _retry_after_seconds(error):
+    """ServiceError 응답의 Retry-After 헤더(초) 값, 없으면 None"""
+    headers = getattr(error, 'headers', None) or {}
+    value = next((value for key, value in headers.items() if key.lower() == 'retry-after'), None)
+    try:
+        return max(float(value), 0) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def call_with_throttle_retry(func, *args, bucket=None, max_retries=5, base_delay=1, max_delay=30, **kwargs):
+    """
+    bucket 토큰을 얻은 뒤 func를 호출하고, 429(Too Many Requests) 응답이면 재시도.
+    재시도 대기 시간은 Retry-After 헤더를 우선 사용하고, 없으면 지수 백오프 + 지터를 사용한다.
+    """
+    import oci as oci_sdk  # type: ignore
+
+    attempt = 0
+    while True:
+        if bucket:
+            bucket.acquire()
+        try:
+            return func(*args, **kwargs)
+        except oci_sdk.exceptions.ServiceError as e:
+            if e.status != THROTTLED_STATUS or attempt >= max_retries:
+                raise
+            attempt += 1
+            retry_after = _retry_after_seconds(e)
+            if retry_after is None:
+                retry_after = min(base_delay * 2 ** (attempt - 1), max_delay) * random.uniform(0.8, 1.2)
+            logger.warning(
+                f'{getattr(func, "__name__", "request")} throttled, retrying in {retry_after:.1f}s '
+                f'({attempt}/{max_retries})'
+            )
+            if bucket:
+                # 버킷을 비워 다음 acquire()에서 대기 (같은 테넌시의 다른 호출도 함께 늦춤)
+                bucket.pause(retry_after)
+            else:
+                time.sleep(retry_after)
+
+
+class RateLimitedClient:
+    """
+    OCI SDK 클라이언트를 감싸 모든 메서드 호출에 토큰 버킷과 429 재시도를 적용하는 프록시.
+    list_call_get_all_results 등 클라이언트를 인자로 받는 유틸리티에도 그대로 전달할 수 있다.
+    """
+
+    def __init__(self, client, bucket, max_retries=5):
+        self._client = client
+        self._bucket = bucket
+        self._max_retries = max_retries
+
+    def __getattr__(self, name):
+        attribute = getattr(self._client, name)
+        if not callable(attribute) or name.startswith('_'):
+            return attribute
+
+        def call(*args, **kwargs):
+            return call_with_throttle_retry(
+                attribute, *args, bucket=self._bucket, max_retries=self._max_retries, **kwargs
+            )
+
+        call.__name__ = name
+        return call
@@ -1,13 +1,44 @@
+import contextvars
+from contextlib import contextmanager
+
 import pulumi
 import pulumi_oci as oci
 
-from utils.exception_handler import apply_exception_handler
-from utils.logger import global_logger
+from utils.error_context import annotate_error
+from utils.logger import get_logger, log_resource_event, quiet_mode
+from utils.stack_exports import stack_exporter
+
+logger = get_logger(__name__)
+
+# create_resource로 생성되는 리소스의 부모 ComponentResource (지역/네트워크/클러스터)
+_resource_parent = contextvars.ContextVar('resource_parent', default=None)
 
-logger = global_logger
+
+@contextmanager
+def resource_parent(parent: pulumi.ComponentResource):
+    """with 블록 안에서 생성되는 리소스의 부모를 parent로 지정"""
+    token = _resource_parent.set(parent)
+    try:
+        yield parent
+    finally:
+        _resource_parent.reset(token)
+
+
+def parented_options(opts: pulumi.ResourceOptions | None = None) -> pulumi.ResourceOptions:
+    """
+    현재 부모 컴포넌트를 ResourceOptions에 적용.
+    컴포넌트 도입 전 최상위에 있던 리소스가 교체되지 않도록 스택 루트를 부모로 하는 alias를 함께 지정한다.
+    """
+    opts = opts or pulumi.ResourceOptions()
+    parent = _resource_parent.get()
+    if parent is None or opts.parent is not None:
+        return opts
+    return pulumi.ResourceOptions.merge(
+        opts,
+        pulumi.ResourceOptions(parent=parent, aliases=[pulumi.Alias(parent=pulumi.ROOT_STACK_RESOURCE)]),
+    )
 
 
-@apply_exception_handler
 def create_resource(
     resource_type: type[pulumi.CustomResource],
     provider: oci.Provider,
@@ -17,7 +48,7 @@ def create_resource(
     **kwargs,
 ) -> pulumi.Output:
     """
-    리소스를 생성하고 로깅 및 ID를 익스포트하는 유틸리티 함수.
+    리소스를 생성하고 로깅 및 ID를 익스포트(exports.mode 정책에 따름)하는 유틸리티 함수.
 
     Args:
         resource_type (Type[pulumi.CustomResource]): 생성할 리소스 클래스 (예: oci.identity.Compartment).
@@ -40,7 +71,14 @@ def create_resource(
         if suffix:
             resource_name = f'{resource_name}-{suffix}'
 
-        logger.info(f'Creating {resource_type.__name__} in region: {region.upper()}')
+        log_resource_event(
+            logger,
+            'declared',
+            resource_type.__name__,
+            'Creating %s in region: %s',
+            resource_type.__name__,
+            region.upper(),
+        )
 
         # Set compartment_id if provided
         if compartment_id:
@@ -65,16 +103,20 @@ def create_resource(
         if 'opts' in kwargs:
             opts = pulumi.ResourceOptions.merge(kwargs['opts'], opts)
             del kwargs['opts']
+        opts = parented_options(opts)
 
         # Create the resource
         resource = resource_type(resource_name, opts=opts, **kwargs)
 
-        # Export the resource ID and log the creation
-        pulumi.export(f'{resource_name}_id', resource.id)
-        resource.id.apply(lambda id_value: logger.info(f'{resource_type.__name__} created with ID: {id_value}'))
+        # Export the resource ID (exports.mode 정책에 따름) and log the creation
+        stack_exporter.record(region, resource_name.removeprefix(f'{region}-'), resource_type.__name__, resource.id)
+        # quiet 모드에서는 ID 로그용 apply 콜백을 등록하지 않음 (종료 시 개수 요약만 출력)
+        if not quiet_mode():
+            resource.id.apply(lambda id_value: logger.info('%s created with ID: %s', resource_type.__name__, id_value))
 
         return resource.id
 
     except Exception as e:
-        logger.error(f'Failed to create resource {resource_type.__name__} in region {region.upper()}: {e}')
+        # 로깅은 오류 경계(error_boundary)에서 한 번만 수행
+        annotate_error(e, region=region, resource=f'{region}-{resource_type.__name__.lower()}')
         raise
@@ -0,0 +1,65 @@
+import threading
+
+import pulumi
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# all: 리소스마다 최상위 출력 (<region>-<role>_id), none: 출력 없음,
+# types: 지정한 리소스 타입만 최상위 출력, inventory: 지역/역할별 ID를 하나의 중첩 출력으로 export
+EXPORT_MODES = ('all', 'none', 'types', 'inventory')
+
+# inventory 모드의 출력 이름 ({region: {role: id}})
+INVENTORY_OUTPUT = 'inventory'
+
+
+class StackExporter:
+    """
+    create_resource 등에서 생성한 리소스 ID를 export 정책에 따라 스택 출력으로 기록.
+    inventory 모드는 프로그램이 끝날 때 flush()에서 한 번에 export한다.
+    """
+
+    def __init__(self, mode='all', types=None):
+        self._lock = threading.Lock()
+        self.configure(mode, types)
+
+    def configure(self, mode, types=None):
+        if mode not in EXPORT_MODES:
+            raise ValueError(f'Invalid exports.mode: {mode}. Expected one of {EXPORT_MODES}.')
+        with self._lock:
+            self.mode = mode
+            self.types = {resource_type.lower() for resource_type in types or []}
+            self._inventory = {}
+
+    def record(self, region, role, resource_type, value, output_name=None):
+        """
+        리소스 출력 기록.
+
+        Args:
+            region (str): 지역 키 (예: se)
+            role (str): 지역 안에서의 역할 (예: vcn, subnet-node)
+            resource_type (str): 리소스 클래스 이름 (types 모드 필터링에 사용, 예: Vcn)
+            value: export할 값 (pulumi.Output)
+            output_name (str, optional): all/types 모드의 출력 이름 (기본값: <region>-<role>_id)
+        """
+        output_name = output_name or f'{region}-{role}_id'
+        if self.mode == 'all' or (self.mode == 'types' and resource_type.lower() in self.types):
+            pulumi.export(output_name, value)
+        elif self.mode == 'inventory':
+            with self._lock:
+                self._inventory.setdefault(region, {})[role] = value
+
+    def flush(self):
+        """inventory 모드에서 기록된 ID를 하나의 출력으로 export"""
+        with self._lock:
+            inventory, self._inventory = self._inventory, {}
+        if self.mode == 'inventory' and inventory:
+            pulumi.export(INVENTORY_OUTPUT, inventory)
+            logger.info(
+                f'Exported {INVENTORY_OUTPUT} output '
+                f'({sum(len(roles) for roles in inventory.values())} resource(s) in {len(inventory)} region(s))'
+            )
+
+
+stack_exporter = StackExporter()
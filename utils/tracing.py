@@ -0,0 +1,250 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# trace 설정값이 '1'/'true'이면 사용하는 기본 파일 이름
+DEFAULT_TRACE_FILE = 'oke-trace.json'
+# 요약 테이블에 표시할 최대 행 수
+SUMMARY_ROWS = 20
+
+# 동적 프로바이더 프로세스가 읽는 트레이싱 환경 변수 (프로바이더는 Pulumi 설정을 읽을 수 없음)
+TRACE_ENV_VAR = 'OKE_TRACE'
+
+# Pulumi 리소스를 선언만 하는 구간의 카테고리. 리소스 생성은 엔진이 비동기로 수행하므로
+# 이 span에는 실제 생성(프로비저닝) 시간이 포함되지 않는다.
+DECLARE_CATEGORY = 'declare'
+
+
+class _Span:
+    """Tracer.span()이 반환하는 컨텍스트 매니저 (종료 시 이벤트 기록)"""
+
+    __slots__ = ('_started', 'category', 'name', 'status', 'tags', 'tracer')
+
+    def __init__(self, tracer, name, category, tags):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.tags = tags
+        self.status = 'ok'
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def set_tag(self, key, value):
+        """span 종료 전에 결과 등 태그 추가"""
+        self.tags[key] = value
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_value is not None:
+            self.status = _error_status(exc_value)
+        self.tracer._record(self, self._started, time.perf_counter())
+        return False
+
+
+class _NoopSpan:
+    """트레이싱이 꺼져 있을 때 사용하는 빈 span"""
+
+    status = None
+
+    def __enter__(self):
+        return self
+
+    def set_tag(self, key, value):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _error_status(error):
+    """예외를 span status 문자열로 변환 (OCI ServiceError는 HTTP 상태 코드 포함)"""
+    status = getattr(error, 'status', None)
+    return f'error:{status}' if isinstance(status, int) else f'error:{type(error).__name__}'
+
+
+class Tracer:
+    """
+    매니저 단계와 OCI SDK 호출의 시작/종료 시간을 기록하는 경량 트레이서.
+
+    설정되지 않으면 span()은 아무것도 기록하지 않는다. 설정되면 프로세스 종료 시(apply 콜백 이후)
+    Chrome trace-event 형식(chrome://tracing, Perfetto) 파일과 요약 테이블을 남긴다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        # True이면 flush마다 새 이벤트를 JSON 배열 형식으로 파일에 이어 씀 (동적 프로바이더 프로세스)
+        self.streaming = False
+        self._events = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._atexit_registered = False
+
+    def configure(self, trace, suffix=''):
+        """
+        trace 설정값으로 트레이싱 활성화 ('1'/'true': 기본 파일, 그 외: 파일 경로, 빈 값: 비활성화)
+        suffix가 주어지면 파일 이름(확장자 앞)에 붙인다.
+        """
+        if not trace or str(trace).lower() in ('0', 'false'):
+            self.enabled = False
+            return
+        path = DEFAULT_TRACE_FILE if str(trace).lower() in ('1', 'true') else str(trace)
+        root, ext = os.path.splitext(path)
+        self.path = f'{root}{suffix}{ext}'
+        self.enabled = True
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+        logger.info(f'Tracing enabled, trace will be written to: {os.path.abspath(self.path)}')
+
+    def span(self, name, category='step', **tags):
+        """
+        with tracer.span('network.check_nlb', region='se'): ... 형태로 구간 기록.
+        tags(region, service, operation 등)는 trace 이벤트의 args로 저장된다.
+        리소스 선언만 하는 구간은 category=DECLARE_CATEGORY로 기록하여 실제 작업 시간과 구분한다.
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, category, tags)
+
+    def _record(self, span, started, finished):
+        thread = threading.current_thread()
+        event = {
+            'name': span.name,
+            'cat': span.category,
+            'ph': 'X',
+            # trace-event 시간 단위는 마이크로초
+            'ts': round((started - self._origin) * 1e6, 1),
+            'dur': round((finished - started) * 1e6, 1),
+            'pid': os.getpid(),
+            'tid': thread.ident,
+            'args': {**span.tags, 'status': span.status},
+        }
+        with self._lock:
+            self._events.append((event, thread.name))
+
+    def flush(self):
+        """기록된 span을 trace 파일로 저장하고 요약 테이블을 로깅"""
+        with self._lock:
+            records, self._events = self._events, []
+        if not self.path or not records:
+            return
+        if self.streaming:
+            self._append(records)
+            return
+        thread_names = {event['tid']: thread_name for event, thread_name in records}
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid, 'args': {'name': thread_name}}
+            for tid, thread_name in thread_names.items()
+        ]
+        events = [event for event, _ in records]
+        try:
+            with open(self.path, 'w') as trace_file:
+                json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, trace_file)
+        except OSError as e:
+            logger.warning(f'Failed to write trace file {self.path}: {e}')
+        self._log_summary(events)
+
+    def _append(self, records):
+        """
+        이벤트를 trace-event JSON 배열 형식으로 파일에 이어 씀.
+        배열의 닫는 괄호는 생략 가능하므로 프로세스가 강제 종료되어도 그때까지의 이벤트는 열어볼 수 있다.
+        """
+        try:
+            with self._write_lock, open(self.path, 'a') as trace_file:
+                if trace_file.tell() == 0:
+                    trace_file.write('[\n')
+                for event, thread_name in records:
+                    trace_file.write(json.dumps({**event, 'args': {**event['args'], 'thread': thread_name}}) + ',\n')
+        except OSError as e:
+            logger.warning('Failed to write trace file %s: %s', self.path, e)
+
+    def _log_summary(self, events):
+        """span 이름별 / 지역별 소요 시간 요약 (총 소요 시간 순)"""
+        by_name = defaultdict(lambda: [0, 0.0, 0.0, 0])
+        by_region = {'step': defaultdict(float), DECLARE_CATEGORY: defaultdict(float)}
+        for event in events:
+            duration_ms = event['dur'] / 1000
+            stats = by_name[(event['cat'], event['name'])]
+            stats[0] += 1
+            stats[1] += duration_ms
+            stats[2] = max(stats[2], duration_ms)
+            stats[3] += event['args']['status'] != 'ok'
+            region = event['args'].get('region')
+            if region and event['cat'] in by_region:
+                by_region[event['cat']][region] += duration_ms
+
+        logger.info(f'{"-" * 30} Trace Summary ({len(events)} span(s)) {"-" * 30}')
+        logger.info(f'{"category":<10}{"span":<52}{"count":>8}{"total(ms)":>12}{"max(ms)":>12}{"errors":>8}')
+        rows = sorted(by_name.items(), key=lambda item: item[1][1], reverse=True)
+        for (category, name), (count, total_ms, max_ms, errors) in rows[:SUMMARY_ROWS]:
+            logger.info(f'{category:<10}{name:<52}{count:>8}{total_ms:>12.1f}{max_ms:>12.1f}{errors:>8}')
+        for category, label in (('step', 'Step time'), (DECLARE_CATEGORY, 'Declaration time')):
+            if by_region[category]:
+                totals = sorted(by_region[category].items(), key=lambda item: item[1], reverse=True)
+                logger.info(
+                    f'{label} by region (ms): ' + ', '.join(f'{region}={total_ms:.1f}' for region, total_ms in totals)
+                )
+        if by_region[DECLARE_CATEGORY]:
+            logger.info(
+                f'{DECLARE_CATEGORY!r} spans measure resource declaration only; '
+                'provisioning runs asynchronously in the Pulumi engine and is not included'
+            )
+
+
+@contextmanager
+def provider_span(name, **tags):
+    """
+    동적 프로바이더의 create/update 구간을 기록.
+    프로바이더는 Pulumi가 별도 프로세스로 실행하므로 OKE_TRACE 환경 변수로 트레이싱을 설정하고,
+    프로그램의 trace 파일을 덮어쓰지 않도록 프로세스별 파일(<trace>.provider-<pid>.json)에 작업마다 이어 쓴다.
+    종료 시점을 보장할 수 없으므로 요약 테이블은 남기지 않는다.
+    """
+    if not tracer.enabled:
+        tracer.streaming = True
+        tracer.configure(os.getenv(TRACE_ENV_VAR), suffix=f'.provider-{os.getpid()}')
+    try:
+        with tracer.span(name, category='provider', **tags) as span:
+            yield span
+    finally:
+        if tracer.enabled:
+            tracer.flush()
+
+
+def instrument_client(client, profile):
+    """
+    SDK 클라이언트의 모든 API 호출을 oci 카테고리 span으로 기록 (트레이싱이 꺼져 있으면 그대로 호출).
+    base_client.call_api를 감싸므로 페이지네이션/재시도/waiter 호출도 각각 기록된다.
+    """
+    service = type(client).__name__.removesuffix('Client')
+    call_api = client.base_client.call_api
+
+    def traced_call_api(*args, **kwargs):
+        if not tracer.enabled:
+            return call_api(*args, **kwargs)
+        operation = kwargs.get('operation_name') or kwargs.get('method', 'call_api')
+        with tracer.span(
+            f'{service}.{operation}', category='oci', region=profile, service=service, operation=operation
+        ) as span:
+            response = call_api(*args, **kwargs)
+            span.set_tag('http_status', getattr(response, 'status', None))
+            return response
+
+    client.base_client.call_api = traced_call_api
+    return client
+
+
+tracer = Tracer()
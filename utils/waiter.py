@@ -0,0 +1,61 @@
+import random
+import time
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def wait_until(
+    fetch,
+    is_ready,
+    *,
+    is_failed=None,
+    timeout=300,
+    initial_delay=2,
+    max_delay=30,
+    backoff=2.0,
+    jitter=0.2,
+    description='resource',
+):
+    """
+    fetch() 결과가 is_ready(value)를 만족할 때까지 지수 백오프 + 지터로 폴링.
+
+    Args:
+        fetch (Callable[[], Any]): 현재 상태를 조회하는 함수 (예: SDK get_* 호출).
+        is_ready (Callable[[Any], bool]): 대기 완료 조건.
+        is_failed (Optional[Callable[[Any], bool]]): 더 기다려도 의미 없는 실패 상태 조건.
+        timeout (float): 전체 대기 시간 한도(초).
+        initial_delay (float): 첫 재조회까지의 대기 시간(초).
+        max_delay (float): 재조회 간격의 상한(초).
+        backoff (float): 재조회마다 대기 시간에 곱할 배수.
+        jitter (float): 대기 시간에 적용할 무작위 편차 비율 (0.2 = ±20%).
+        description (str): 로그/에러 메시지에 사용할 대상 설명.
+
+    Returns:
+        Any: is_ready를 만족한 마지막 fetch() 결과.
+
+    Raises:
+        RuntimeError: is_failed 조건을 만족한 경우.
+        TimeoutError: 기한 내에 is_ready 조건을 만족하지 못한 경우.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    attempt = 0
+    while True:
+        attempt += 1
+        value = fetch()
+        if is_ready(value):
+            if attempt > 1:
+                logger.info('%s is ready after %d checks.', description, attempt)
+            return value
+        if is_failed and is_failed(value):
+            raise RuntimeError(f'{description} reached a failed state while waiting.')
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f'{description} is still not ready after {timeout}s ({attempt} checks).')
+
+        sleep_seconds = min(delay * random.uniform(1 - jitter, 1 + jitter), max_delay, remaining)
+        time.sleep(max(sleep_seconds, 0))
+        delay = min(delay * backoff, max_delay)